@@ -0,0 +1,180 @@
+"""
+Benchmarks every public converter across data sizes, point dimensions, float types and with or without vertex cells.
+
+Every case runs in its own interpreter so the peak resident memory can be attributed to it. The results (wall time,
+peak RSS and the peak allocations of a separate untimed conversion) are written as JSON. The allocations are traced
+by tracemalloc where it is available and are the growth of the peak RSS otherwise, peak_allocated_by names which.
+
+Usage:
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --sizes 1000 100000 --converters mesh line --output results.json
+    python benchmarks/run.py --output results.json --compare baseline.json --threshold 1.25
+
+When a baseline is given, every case that got slower than threshold times its baseline time is reported and the script
+exits with status 1.
+"""
+from __future__ import print_function
+
+import argparse
+import itertools
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+import numpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+CONVERTERS = ['raw.points', 'raw.edges', 'raw.polygons', 'vertices', 'line', 'mesh']
+WITH_VERTS = ['vertices', 'line', 'mesh']
+WITHOUT_POINTS = ['raw.edges', 'raw.polygons']
+SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+DIMENSIONS = [2, 3]
+DTYPES = ['float32', 'float64']
+
+
+def cases(converters, sizes):
+    for converter, size in itertools.product(converters, sizes):
+        dimensions, dtypes = ([None], [None]) if converter in WITHOUT_POINTS else (DIMENSIONS, DTYPES)
+        for dimension, dtype in itertools.product(dimensions, dtypes):
+            for verts in ([True, False] if converter in WITH_VERTS else [None]):
+                yield {'converter': converter, 'size': size, 'dimension': dimension, 'dtype': dtype, 'verts': verts}
+
+
+def prepare(case):
+    """
+    Returns a function that runs the conversion described by case on freshly generated input.
+    """
+    from numpy2vtk import data
+    from numpy2vtk.data import raw
+
+    size = case['size']
+    points = numpy.random.rand(size, case['dimension'] or 3).astype(case['dtype'] or 'float64')
+    edges = numpy.column_stack((numpy.arange(size - 1), numpy.arange(1, size)))
+    polys = numpy.random.randint(0, size, size=(size, 3))
+    verts = case['verts']
+
+    return {
+        'raw.points': lambda: raw.points(points),
+        'raw.edges': lambda: raw.edges(edges),
+        'raw.polygons': lambda: raw.polygons(polys),
+        'vertices': lambda: data.vertices(points, verts=verts),
+        'line': lambda: data.line(points, verts=verts),
+        'mesh': lambda: data.mesh(points, polys, verts=verts),
+    }[case['converter']]
+
+
+def run_case(case, repeat):
+    convert = prepare(case)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    allocated, allocated_by = measure_allocations(convert)
+
+    durations = []
+    for _ in range(repeat):
+        start = time.time()
+        result = convert()
+        durations.append(time.time() - start)
+        del result
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return dict(case, **{
+        'time': min(durations),
+        'peak_rss_kb': peak_rss,
+        'conversion_rss_kb': peak_rss - rss_before,
+        'peak_allocated_bytes': allocated,
+        'peak_allocated_by': allocated_by,
+    })
+
+
+def measure_allocations(convert):
+    """
+    Returns the peak memory allocated by one untimed conversion and how it was measured. The peak of traced
+    allocations is used where tracemalloc is available (python 3). Otherwise the growth of the peak RSS of the process
+    is used, which only counts memory beyond the earlier high-water mark, so this runs before the timed conversions.
+    """
+    if tracemalloc is not None:
+        tracemalloc.start()
+        result = convert()
+        allocated = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del result
+        return allocated, 'tracemalloc'
+
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result = convert()
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    del result
+    return (after - before) * 1024, 'maxrss'
+
+
+def run(converters, sizes, repeat):
+    results = []
+    for case in cases(converters, sizes):
+        output = subprocess.check_output([
+            sys.executable, os.path.abspath(__file__), '--case', json.dumps(case), '--repeat', str(repeat)
+        ])
+        result = json.loads(output.decode('utf-8').strip().splitlines()[-1])
+        print('{:<62} {:>9.4f}s {:>9} kB'.format(describe(result), result['time'], result['conversion_rss_kb']))
+        results.append(result)
+    return results
+
+
+def describe(result):
+    return '{converter} size={size} dimension={dimension} dtype={dtype} verts={verts}'.format(**result)
+
+
+def key(result):
+    return (result['converter'], result['size'], result['dimension'], result['dtype'], result['verts'])
+
+
+def compare(results, baseline, threshold):
+    """
+    Returns the results that are slower than threshold times the matching baseline result.
+    """
+    baseline = dict((key(result), result) for result in baseline)
+    slower = []
+    for result in results:
+        expected = baseline.get(key(result))
+        if expected is not None and result['time'] > threshold * expected['time']:
+            slower.append((result, expected))
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks the numpy2vtk converters')
+    parser.add_argument('--converters', nargs='+', default=CONVERTERS, choices=CONVERTERS)
+    parser.add_argument('--sizes', nargs='+', type=int, default=SIZES)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='file the JSON results are written to')
+    parser.add_argument('--compare', help='JSON results of an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=1.25, help='allowed slowdown factor against the baseline')
+    parser.add_argument('--case', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(json.loads(args.case), args.repeat)))
+        return 0
+
+    results = run(args.converters, args.sizes, args.repeat)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            slower = compare(results, json.load(f), args.threshold)
+        for result, expected in slower:
+            print('SLOWER {} {:.4f}s (baseline {:.4f}s)'.format(describe(result), result['time'], expected['time']))
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
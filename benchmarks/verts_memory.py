@@ -0,0 +1,40 @@
+"""
+Compares the memory used by polydata built with and without vertex cells.
+
+Usage: python benchmarks/verts_memory.py [number_of_points ...]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import time
+import numpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from numpy2vtk.data import mesh
+
+
+def measure(number_of_points, verts):
+    points = numpy.random.rand(number_of_points, 3)
+    polys = numpy.random.randint(0, number_of_points, size=(number_of_points // 2, 3))
+
+    start = time.time()
+    poly_data = mesh(points, polys, verts=verts)
+    duration = time.time() - start
+
+    verts_kb = poly_data.GetVerts().GetActualMemorySize()
+    return duration, verts_kb, poly_data.GetActualMemorySize()
+
+
+def main(sizes):
+    print('{:>12} {:>6} {:>10} {:>12} {:>12}'.format('points', 'verts', 'time [s]', 'verts [kB]', 'total [kB]'))
+    for number_of_points in sizes:
+        for verts in (True, False):
+            duration, verts_kb, total_kb = measure(number_of_points, verts)
+            print('{:>12} {!s:>6} {:>10.3f} {:>12} {:>12}'.format(number_of_points, verts, duration, verts_kb,
+                                                                  total_kb))
+
+
+if __name__ == '__main__':
+    main([int(n) for n in sys.argv[1:]] or [10 ** 4, 10 ** 5, 10 ** 6])
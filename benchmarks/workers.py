@@ -0,0 +1,84 @@
+"""
+Benchmarks how the conversion of large arrays scales with the number of worker threads.
+
+Every converter that takes workers is run for each number of workers on the same input, the speedup is reported
+relative to a single worker. The results are written as JSON if an output file is given.
+
+Usage:
+    python benchmarks/workers.py --size 10000000 --workers 1 2 4 8 16 32
+    python benchmarks/workers.py --converters raw.points mesh --output workers.json
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+import numpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CONVERTERS = ['raw.points', 'raw.polygons', 'raw.polygons.offsets', 'mesh']
+WORKERS = [1, 2, 4, 8, 16, 32]
+
+
+def prepare(size):
+    """
+    Returns the conversions by name, each a function of the number of workers.
+    """
+    from numpy2vtk.data import raw, mesh
+
+    points = numpy.random.rand(size, 2).astype(numpy.float32)
+    polys = numpy.random.randint(0, size, size=(size, 3)).astype(numpy.int32)
+    offsets = numpy.arange(0, 3 * size + 1, 3)
+
+    return {
+        'raw.points': lambda workers: raw.points(points, workers=workers),
+        'raw.polygons': lambda workers: raw.polygons(polys, workers=workers),
+        'raw.polygons.offsets': lambda workers: raw.polygons(polys.ravel(), offsets=offsets, workers=workers),
+        'mesh': lambda workers: mesh(points, polys, workers=workers),
+    }
+
+
+def run(converters, size, workers, repeat):
+    conversions = prepare(size)
+    results = []
+    for converter in converters:
+        baseline = None
+        for count in workers:
+            durations = []
+            for _ in range(repeat):
+                start = time.time()
+                result = conversions[converter](count)
+                durations.append(time.time() - start)
+                del result
+            duration = min(durations)
+            baseline = baseline or duration
+            print('{:<22} workers={:<3} {:>9.4f}s speedup {:>5.2f}'.format(converter, count, duration,
+                                                                          baseline / duration))
+            results.append({'converter': converter, 'size': size, 'workers': count, 'time': duration,
+                            'speedup': baseline / duration})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks the scaling of the numpy2vtk converters with workers')
+    parser.add_argument('--converters', nargs='+', default=CONVERTERS, choices=CONVERTERS)
+    parser.add_argument('--size', type=int, default=10 ** 7)
+    parser.add_argument('--workers', nargs='+', type=int, default=WORKERS)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='file the JSON results are written to')
+    args = parser.parse_args()
+
+    print('{} cores available'.format(multiprocessing.cpu_count()))
+    results = run(args.converters, args.size, args.workers, args.repeat)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,3 @@
+from actors import actor, vertices, line, mesh, point_cloud, point_cloud_lod
+
+__all__ = ['actor', 'vertices', 'line', 'mesh', 'point_cloud', 'point_cloud_lod']
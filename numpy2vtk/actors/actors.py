@@ -0,0 +1,230 @@
+import vtk
+from numpy2vtk import data
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+# The render time per point that the levels of point_cloud_lod are initially estimated with
+ESTIMATED_SECONDS_PER_POINT = 1e-8
+
+# The class names of the rendering backend's implementations of the mapper types (e.g. vtkOpenGLPolyDataMapper)
+_class_names = {}
+
+def actor(data_set, scalars=None, scalar_range=None, lookup_table=None, direct_colors=False, color=None, opacity=None,
+          static=False, reuse=None):
+    """
+    Returns a vtkActor that renders polydata (e.g. the output of the functions in numpy2vtk.data) through a
+    vtkPolyDataMapper.
+
+    Passing the actor of an earlier call as reuse updates its mapper with the new data instead of building a new
+    mapper and actor, so the mapper keeps its render state and only the modified data is uploaded to the GPU again.
+
+    Args:
+        data_set (vtk.vtkPolyData): The data that is rendered
+        scalars (str): The name of the point or cell data array the data is colored by, by default it is not colored
+            by scalars
+        scalar_range (tuple<float>): The range of scalars that is mapped onto the lookup table, by default the range of
+            the array
+        lookup_table (vtk.vtkScalarsToColors): The lookup table scalars are mapped with, by default the one of the
+            mapper
+        direct_colors (bool): Whether scalars are unsigned char colors of shape (n,3) or (n,4) that are used directly
+            instead of being mapped through the lookup table
+        color (tuple<float>): The color of the actor if it is not colored by scalars
+        opacity (float): The opacity of the actor
+        static (bool): Whether the data is never modified, which skips the pipeline update checks on every render
+        reuse (vtk.vtkActor): An actor returned by an earlier call whose mapper and actor are reused
+
+    Returns:
+        actor (vtk.vtkActor): The actor rendering the data
+    """
+    vtk_actor, mapper = _actor(vtk.vtkPolyDataMapper, reuse)
+    mapper.SetInputData(data_set)
+    _configure(vtk_actor, mapper, data_set, scalars, scalar_range, lookup_table, direct_colors, color, opacity, static)
+    return vtk_actor
+
+def vertices(points, z_index=0, point_data=None, **options):
+    """
+    Returns a vtkActor that renders the points of a numpy array as vertices, see data.vertices and actor.
+
+    Args:
+        points (numpy.ndarray<float> or str): The points, should be of dimensions (n,2) or (n,3)
+        z_index (float): The value the z-value of 2d-points is filled with (only applicable for (n,2) input arrays)
+        point_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are attached as point data
+        options: The keyword arguments of actor
+
+    Returns:
+        actor (vtk.vtkActor): The actor rendering the vertices
+    """
+    return actor(data.vertices(points, z_index=z_index, point_data=point_data), **options)
+
+def line(points, z_index=0, closed=False, point_data=None, **options):
+    """
+    Returns a vtkActor that renders the points of a numpy array as single polyline, see data.line and actor.
+
+    Args:
+        points (numpy.ndarray<float> or str): The points of the line, should be of dimensions (n,2) or (n,3)
+        z_index (float): The value the z-value of 2d-points is filled with (only applicable for (n,2) input arrays)
+        closed (bool): Whether the last point of the line should be connected with the first one
+        point_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are attached as point data
+        options: The keyword arguments of actor
+
+    Returns:
+        actor (vtk.vtkActor): The actor rendering the line
+    """
+    line_data = data.line(points, z_index=z_index, closed=closed, poly_line=True, verts=False, point_data=point_data)
+    return actor(line_data, **options)
+
+def mesh(points, polys, z_index=0, offsets=None, point_data=None, cell_data=None, **options):
+    """
+    Returns a vtkActor that renders a mesh of numpy points and polys, see data.mesh and actor. No vertex cells are
+    created, so cell data has one entry per patch.
+
+    Args:
+        points (numpy.ndarray<float> or str): The points of the mesh, should be of dimensions (n,2) or (n,3)
+        polys (numpy.ndarray<int> or str): Array of patches, should be of shape nxm for n patches with m points per
+            patch or of shape (k,) if offsets are given
+        z_index (float): The value the z-value of 2d-points is filled with (only applicable for (n,2) input arrays)
+        offsets (numpy.ndarray<int> or str): Array of shape (n+1,) that defines where each of the n patches starts in
+            polys
+        point_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are attached as point data
+        cell_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are attached as cell data
+        options: The keyword arguments of actor
+
+    Returns:
+        actor (vtk.vtkActor): The actor rendering the mesh
+    """
+    mesh_data = data.mesh(points, polys, z_index=z_index, offsets=offsets, verts=False, point_data=point_data,
+                          cell_data=cell_data)
+    return actor(mesh_data, **options)
+
+def point_cloud(points, z_index=0, radius=None, scale_array=None, glyph=None, point_data=None, scalars=None,
+                scalar_range=None, lookup_table=None, direct_colors=False, color=None, opacity=None, static=False,
+                reuse=None):
+    """
+    Returns a vtkActor that renders huge numbers of points without creating a vertex cell per point. The points are
+    splatted by a vtkPointGaussianMapper or, if a glyph is given, instanced with a vtkGlyph3DMapper.
+
+    Args:
+        points (numpy.ndarray<float> or str): The points, should be of dimensions (n,2) or (n,3)
+        z_index (float): The value the z-value of 2d-points is filled with (only applicable for (n,2) input arrays)
+        radius (float): The radius of the splats or the scale of the glyphs. By default splats are rendered as plain
+            points (a radius of 0) and glyphs keep the size of their source (a scale of 1)
+        scale_array (str): The name of a point data array the radius is scaled with per point
+        glyph (vtk.vtkAlgorithm): The source of the geometry rendered at every point, e.g. a vtk.vtkSphereSource
+        point_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are attached as point data
+        scalars (str): The name of the point data array the points are colored by
+        scalar_range (tuple<float>): The range of scalars that is mapped onto the lookup table, by default the range of
+            the array
+        lookup_table (vtk.vtkScalarsToColors): The lookup table scalars are mapped with
+        direct_colors (bool): Whether scalars are unsigned char colors that are used directly
+        color (tuple<float>): The color of the points if they are not colored by scalars
+        opacity (float): The opacity of the points
+        static (bool): Whether the data is never modified, which skips the pipeline update checks on every render
+        reuse (vtk.vtkActor): An actor returned by an earlier call whose mapper and actor are reused
+
+    Returns:
+        actor (vtk.vtkActor): The actor rendering the points
+    """
+    cloud = data.vertices(points, z_index=z_index, verts=False, point_data=point_data)
+    vtk_actor, mapper = _actor(vtk.vtkPointGaussianMapper if glyph is None else vtk.vtkGlyph3DMapper, reuse)
+    mapper.SetInputData(cloud)
+    if radius is None:
+        radius = 0.0 if glyph is None else 1.0
+    mapper.SetScaleFactor(radius)
+    if scale_array is not None:
+        mapper.SetScaleArray(scale_array)
+    if glyph is not None:
+        mapper.SetSourceConnection(glyph.GetOutputPort())
+        mapper.SetScaling(scale_array is not None)
+        mapper.SetScaleModeToScaleByMagnitude()
+    _configure(vtk_actor, mapper, cloud, scalars, scalar_range, lookup_table, direct_colors, color, opacity, static)
+    return vtk_actor
+
+def point_cloud_lod(points, number_of_levels=4, factor=8, method='voxel', z_index=0, point_data=None, scalars=None,
+                    scalar_range=None, lookup_table=None, direct_colors=False, seed=None):
+    """
+    Returns a vtkLODProp3D that renders a point cloud at the level of detail that fits the desired frame rate of the
+    render window, the levels are built by data.point_cloud_levels.
+
+    Args:
+        points (numpy.ndarray<float> or str): The points, should be of dimensions (n,2) or (n,3)
+        number_of_levels (int): The number of levels including the one with all points
+        factor (float): The factor the number of points is reduced by from one level to the next
+        method (str): 'voxel' or 'random', see data.point_cloud_levels
+        z_index (float): The value the z-value of 2d-points is filled with (only applicable for (n,2) input arrays)
+        point_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are attached as point data
+        scalars (str): The name of the point data array the points are colored by
+        scalar_range (tuple<float>): The range of scalars that is mapped onto the lookup table, by default the range of
+            the array in the finest level
+        lookup_table (vtk.vtkScalarsToColors): The lookup table scalars are mapped with
+        direct_colors (bool): Whether scalars are unsigned char colors that are used directly
+        seed (int): The seed of the random subsampling
+
+    Returns:
+        lod (vtk.vtkLODProp3D): The prop rendering the point cloud
+    """
+    levels = data.point_cloud_levels(points, number_of_levels=number_of_levels, factor=factor, method=method,
+                                     z_index=z_index, point_data=point_data, seed=seed)
+    lod = vtk.vtkLODProp3D()
+    for level in levels:
+        mapper = vtk.vtkPolyDataMapper()
+        mapper.SetInputData(level)
+        _scalars(mapper, level, scalars, scalar_range, lookup_table, direct_colors)
+        if scalars is not None and scalar_range is None:
+            scalar_range = mapper.GetScalarRange()
+        # VTK measures the render time of every level once it was rendered, until then the time is estimated
+        lod.AddLOD(mapper, level.GetNumberOfPoints() * ESTIMATED_SECONDS_PER_POINT)
+    return lod
+
+def _actor(mapper_type, reuse):
+    """
+    Returns the actor and mapper that are reused or newly created, the mapper is replaced if it is of another type.
+    """
+    if reuse is not None and not isinstance(reuse, vtk.vtkActor):
+        raise Numpy2VtkFormatException(
+            'actor reuse needs to be a vtk.vtkActor'
+        )
+    vtk_actor = reuse if reuse is not None else vtk.vtkActor()
+    mapper = vtk_actor.GetMapper()
+    if mapper_type not in _class_names:
+        _class_names[mapper_type] = mapper_type().GetClassName()
+    if mapper is None or mapper.GetClassName() != _class_names[mapper_type]:
+        mapper = mapper_type()
+        vtk_actor.SetMapper(mapper)
+    return vtk_actor, mapper
+
+def _configure(vtk_actor, mapper, data_set, scalars, scalar_range, lookup_table, direct_colors, color, opacity,
+               static):
+    mapper.SetStatic(static)
+    if color is not None:
+        vtk_actor.GetProperty().SetColor(*color)
+    if opacity is not None:
+        vtk_actor.GetProperty().SetOpacity(opacity)
+    _scalars(mapper, data_set, scalars, scalar_range, lookup_table, direct_colors)
+
+def _scalars(mapper, data_set, scalars, scalar_range, lookup_table, direct_colors):
+    if scalars is None:
+        mapper.ScalarVisibilityOff()
+        return
+
+    if data_set.GetPointData().HasArray(scalars):
+        mapper.SetScalarModeToUsePointFieldData()
+        array = data_set.GetPointData().GetArray(scalars)
+    elif data_set.GetCellData().HasArray(scalars):
+        mapper.SetScalarModeToUseCellFieldData()
+        array = data_set.GetCellData().GetArray(scalars)
+    else:
+        raise Numpy2VtkFormatException(
+            'actor scalars {} needs to be a point or cell data array'.format(scalars)
+        )
+    mapper.SelectColorArray(scalars)
+    mapper.ScalarVisibilityOn()
+
+    if direct_colors:
+        mapper.SetColorModeToDirectScalars()
+        return
+    mapper.SetColorModeToMapScalars()
+    if lookup_table is not None:
+        mapper.SetLookupTable(lookup_table)
+    mapper.UseLookupTableScalarRangeOff()
+    if scalar_range is None:
+        scalar_range = array.GetRange(0 if array.GetNumberOfComponents() == 1 else -1)
+    mapper.SetScalarRange(*scalar_range)
@@ -1,6 +1,19 @@
 import raw
 from vertices import vertices
 from line import line
+from lines import lines
 from mesh import mesh
+from grid import image_data, rectilinear_grid, structured_grid
+from unstructured import unstructured_grid
+from update import update_points
+from builder import PolyDataBuilder
+from cache import ConversionCache
+from batch import meshes
+from merge import merge
+from lod import point_cloud_levels, level_for_budget
+from spatial import VoxelHash, voxel_hash
+from weld import weld
 
-__all__ = ['vertices', 'line', 'mesh', 'raw']
+__all__ = ['vertices', 'line', 'lines', 'mesh', 'image_data', 'rectilinear_grid', 'structured_grid',
+           'unstructured_grid', 'update_points', 'PolyDataBuilder', 'ConversionCache', 'meshes', 'merge',
+           'point_cloud_levels', 'level_for_budget', 'VoxelHash', 'voxel_hash', 'weld', 'raw']
@@ -0,0 +1,56 @@
+import numpy
+from .raw import array as to_vtk_array
+from .raw.raw import _load
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+def attach(data_set, point_data=None, cell_data=None, skipped_cells=0):
+    """
+    Attaches numpy arrays as point and cell data to a VTK data set.
+
+    The arrays are attached in the order of their names. The first array with a single component becomes the active
+    scalars, an array named 'normals' with three components becomes the active normals and the first other array with
+    three components becomes the active vectors.
+
+    Args:
+        data_set (vtk.vtkDataSet): The data set the arrays are attached to
+        point_data (dict<str, numpy.ndarray>): Arrays with one entry per point, of shape (n,) or (n,c)
+        cell_data (dict<str, numpy.ndarray>): Arrays with one entry per cell, of shape (n,) or (n,c)
+        skipped_cells (int): The number of leading cells (e.g. vertex cells) that the cell data arrays do not cover,
+            their values are filled with 0
+    """
+    if point_data:
+        _attach(data_set.GetPointData(), point_data, data_set.GetNumberOfPoints(), 'point_data')
+    if cell_data:
+        cell_data = dict(
+            (name, _prepend_zeros(values, skipped_cells)) for name, values in cell_data.items()
+        ) if skipped_cells else cell_data
+        _attach(data_set.GetCellData(), cell_data, data_set.GetNumberOfCells(), 'cell_data')
+
+def _attach(attributes, arrays, number_of_tuples, kind):
+    has_scalars = has_vectors = False
+    for name in sorted(arrays.keys()):
+        vtk_array = to_vtk_array(arrays[name], name=name)
+        if vtk_array.GetNumberOfTuples() != number_of_tuples:
+            raise Numpy2VtkFormatException(
+                '{} {} needs {} entries, has {}'.format(kind, name, number_of_tuples, vtk_array.GetNumberOfTuples())
+            )
+
+        components = vtk_array.GetNumberOfComponents()
+        if components == 1 and not has_scalars:
+            attributes.SetScalars(vtk_array)
+            has_scalars = True
+        elif components == 3 and name == 'normals':
+            attributes.SetNormals(vtk_array)
+        elif components == 3 and not has_vectors:
+            attributes.SetVectors(vtk_array)
+            has_vectors = True
+        else:
+            attributes.AddArray(vtk_array)
+
+def _prepend_zeros(values, count):
+    values = _load(values)
+    if not isinstance(values, numpy.ndarray):
+        return values
+    padded = numpy.zeros((count + len(values),) + values.shape[1:], dtype=values.dtype)
+    padded[count:] = values
+    return padded
@@ -0,0 +1,80 @@
+import collections
+import multiprocessing
+import vtk
+from .mesh import mesh
+from .raw.raw import _reset_pools
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+def meshes(items, processes=None, in_flight=None, pool=None):
+    """
+    Converts many independent meshes across a pool of processes and yields the VTK-representations in the order of
+    items. Each mesh is built by mesh in a worker process and sent back as binary legacy VTK data.
+
+    Items are consumed lazily and at most in_flight of them are converted or waiting to be yielded at any time, so
+    the memory that is needed stays bounded for long iterables.
+
+    Example:
+        for poly_data in meshes((part.points, part.polys, {'verts': False}) for part in parts):
+            append_filter.AddInputData(poly_data)
+
+    Args:
+        items (iterable<tuple>): Tuples of points and polys and optionally a dict of further keyword arguments of mesh
+            (except cache), the arrays need to be picklable
+        processes (int): The number of processes that are started, by default the number of cores (only applicable
+            if no pool is given)
+        in_flight (int): The maximum number of items that are converted at the same time, by default twice the number
+            of processes
+        pool (multiprocessing.pool.Pool): Pool the meshes are converted in instead of starting a new one, it is not
+            closed afterwards
+
+    Returns:
+        poly_data (generator<vtk.vtkPolyData>): The VTK polydata representations of the meshes in order
+    """
+    processes = processes or multiprocessing.cpu_count()
+    in_flight = in_flight or 2 * processes
+    if in_flight < 1:
+        raise Numpy2VtkFormatException(
+            'meshes needs at least one item in flight'
+        )
+
+    own_pool = pool is None
+    if own_pool:
+        # The workers start without the thread pools of this process, which they inherit without their threads
+        pool = multiprocessing.Pool(processes, initializer=_reset_pools)
+    try:
+        pending = collections.deque()
+        for item in items:
+            if len(pending) >= in_flight:
+                yield _deserialize(pending.popleft().get())
+            pending.append(pool.apply_async(_convert, (item,)))
+        while pending:
+            yield _deserialize(pending.popleft().get())
+    finally:
+        if own_pool:
+            pool.terminate()
+            pool.join()
+
+def _convert(item):
+    """
+    Builds the mesh of an item and returns it serialized, this runs in the worker processes.
+    """
+    if len(item) not in (2, 3):
+        raise Numpy2VtkFormatException(
+            'meshes needs items of points, polys and optionally a dict of keyword arguments'
+        )
+    points, polys = item[:2]
+    kwargs = item[2] if len(item) == 3 else {}
+
+    writer = vtk.vtkPolyDataWriter()
+    writer.SetInputData(mesh(points, polys, **kwargs))
+    writer.WriteToOutputStringOn()
+    writer.SetFileTypeToBinary()
+    writer.Write()
+    return writer.GetOutputStdString()
+
+def _deserialize(data):
+    reader = vtk.vtkPolyDataReader()
+    reader.ReadFromInputStringOn()
+    reader.SetBinaryInputString(data, len(data))
+    reader.Update()
+    return reader.GetOutput()
@@ -0,0 +1,141 @@
+import numpy
+import vtk
+from vtk.util.numpy_support import ID_TYPE_CODE
+from .raw import points as to_vtk_points
+from .raw import vertices as to_vtk_vertices
+from .raw.raw import _legacy_cells, _wrap_cell_array
+from .spatial import voxel_hash
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+from numpy2vtk.validation import check_bounds, check_offsets
+
+class PolyDataBuilder(object):
+    """
+    Builds the VTK-representation of a mesh incrementally from chunks of points and polys, e.g. when the data is
+    produced by a generator. Points and cells are collected in buffers that grow by doubling, build() wraps these
+    buffers without copying them again.
+
+    Example:
+        builder = PolyDataBuilder()
+        for points, polys in chunks:
+            builder.append(points, polys)
+        poly_data = builder.build()
+
+    Args:
+        z_index (float): The value the z-value of 2d-points is filled with (only applicable for (n,2) input arrays)
+        verts (bool): Whether a vertex cell should be created for every point
+        dtype (numpy.dtype): The type the points are stored as, numpy.float32 or numpy.float64. By default the points
+            are stored as float32 as long as all appended chunks are float32 and as float64 otherwise
+        capacity (int): The number of points that is initially reserved
+    """
+
+    def __init__(self, z_index=0, verts=True, dtype=None, capacity=1024):
+        if dtype is not None and numpy.dtype(dtype) not in (numpy.float32, numpy.float64):
+            raise Numpy2VtkFormatException(
+                'builder dtype needs to be numpy.float32 or numpy.float64'
+            )
+        self.z_index = z_index
+        self.verts = verts
+        self.dtype = dtype
+        self._points = numpy.empty((capacity, 3), dtype=numpy.float32 if dtype is None else dtype)
+        self._cells = numpy.empty(capacity, dtype=ID_TYPE_CODE)
+        self._number_of_points = 0
+        self._number_of_cells = 0
+        self._cells_size = 0
+
+    @property
+    def number_of_points(self):
+        return self._number_of_points
+
+    @property
+    def number_of_cells(self):
+        return self._number_of_cells
+
+    def append(self, points, polys=None, offsets=None):
+        """
+        Appends a chunk of points and the polys between them. The indices in polys refer to the points of this chunk
+        and are offset automatically.
+
+        Args:
+            points (numpy.ndarray<float>): The points of the chunk, should be of dimensions (n,2) or (n,3)
+            polys (numpy.ndarray<int>): Array of patches, should be of shape nxm for n patches with m points per patch
+                or of shape (k,) if offsets are given
+            offsets (numpy.ndarray<int>): Array of shape (n+1,) that defines where each of the n patches starts in polys
+        """
+        if not isinstance(points, numpy.ndarray) or len(points.shape) != 2 or points.shape[1] not in (2, 3):
+            raise Numpy2VtkFormatException(
+                'builder points needs to be a numpy array of nx2 or nx3 shape'
+            )
+
+        if polys is not None:
+            if not isinstance(polys, numpy.ndarray) or polys.dtype.kind not in 'iu':
+                raise Numpy2VtkFormatException(
+                    'builder polys needs to be numpy array of integer type'
+                )
+            if offsets is None and len(polys.shape) != 2:
+                raise Numpy2VtkFormatException(
+                    'builder polys needs a nxm ndarray as input'
+                )
+            if offsets is not None:
+                if len(polys.shape) != 1:
+                    raise Numpy2VtkFormatException(
+                        'builder polys needs a one dimensional ndarray as input when offsets are given'
+                    )
+                check_offsets(polys, offsets, 'builder')
+            check_bounds(polys, len(points), 'builder polys')
+
+        first_point = self._number_of_points
+        start, end = first_point, first_point + len(points)
+        if self.dtype is None and self._points.dtype == numpy.float32 and points.dtype != numpy.float32:
+            self._points = self._points.astype(numpy.float64)
+        self._points = _reserve(self._points, start, end)
+        self._points[start:end, :points.shape[1]] = points
+        if points.shape[1] == 2:
+            self._points[start:end, 2] = self.z_index
+        self._number_of_points = end
+
+        if polys is not None:
+            number_of_cells = len(polys) if offsets is None else len(offsets) - 1
+            start, end = self._cells_size, self._cells_size + polys.size + number_of_cells
+            self._cells = _reserve(self._cells, start, end)
+            # The cells are laid out directly in the buffer, then their indices are offset to the points of this chunk
+            cells = _legacy_cells(polys, offsets, out=self._cells[start:end])
+            if offsets is None:
+                cells.reshape(number_of_cells, polys.shape[1] + 1)[:, 1:] += first_point
+            else:
+                cells += first_point
+                cells[numpy.asarray(offsets[:-1], dtype=ID_TYPE_CODE) + numpy.arange(number_of_cells)] -= first_point
+            self._cells_size = end
+            self._number_of_cells += number_of_cells
+
+    def build(self, spatial_index=False):
+        """
+        Returns the VTK-representation of all chunks appended so far. The returned polydata shares its buffers with
+        the builder, appending more chunks afterwards does not change it.
+
+        Args:
+            spatial_index (bool): Whether a VoxelHash of the points should be built and cached on the result, see
+                voxel_hash
+
+        Returns:
+            poly_data (vtk.vtkPolyData): VTK polydata representation of the mesh
+        """
+        poly_data = vtk.vtkPolyData()
+        poly_data.SetPoints(to_vtk_points(self._points[:self._number_of_points]))
+        if self.verts:
+            poly_data.SetVerts(to_vtk_vertices(numpy.arange(self._number_of_points, dtype=numpy.int)))
+        poly_data.SetPolys(_wrap_cell_array(self._cells[:self._cells_size], self._number_of_cells))
+        if spatial_index:
+            voxel_hash(poly_data)
+
+        return poly_data
+
+def _reserve(buffer, used, size):
+    """
+    Returns a buffer that can hold at least size rows, the capacity of the buffer is at least doubled when it needs
+    to grow so appending stays amortized linear. Only the used rows are copied.
+    """
+    if size <= len(buffer):
+        return buffer
+    grown = numpy.empty((max(size, 2 * len(buffer)),) + buffer.shape[1:], dtype=buffer.dtype)
+    grown[:used] = buffer[:used]
+    return grown
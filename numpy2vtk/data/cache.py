@@ -0,0 +1,108 @@
+import collections
+import hashlib
+import numpy
+from .raw import points as to_vtk_points
+from .update import update_points
+
+class ConversionCache(object):
+    """
+    Least recently used cache of converted VTK objects, which avoids converting the same numpy arrays again when e.g.
+    mesh is called every frame with the same polys and moved points.
+
+    Arrays are identified by the address of their buffer, their shape, strides and dtype. The cache keeps references
+    to the arrays of its entries, so an address can not be reused by another array while it is cached. Arrays that
+    are modified in place are only recognized when hash_content is set, which hashes their content on every lookup.
+
+    Example:
+        cache = ConversionCache(max_bytes=64 * 1024 * 1024)
+        for points in frames:
+            poly_data = mesh(points, polys, cache=cache)
+
+    Args:
+        max_bytes (int): The size of the converted VTK objects the cache holds before evicting the least recently used
+        hash_content (bool): Whether the content of arrays should be part of their key
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, hash_content=False):
+        self.max_bytes = max_bytes
+        self.hash_content = hash_content
+        self.size = 0
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, name, arrays, convert):
+        """
+        Returns the cached conversion of arrays or converts and caches them.
+
+        Args:
+            name (str): The name of the conversion, to separate different conversions of the same arrays
+            arrays (tuple): The numpy arrays (or other hashable parameters) that are converted
+            convert (function): Function without arguments that returns the converted VTK object
+
+        Returns:
+            converted (vtk.vtkObject): The cached or converted VTK object
+        """
+        key = (name,) + tuple(self._key(array) for array in arrays)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            entry = self._create(convert(), arrays)
+        self._entries[key] = entry
+        self._evict()
+        return entry[0]
+
+    def points(self, coordinates, z_index=0, dtype=None, validate=True, workers=1):
+        """
+        Returns cached vtkPoints for coordinates. Points are expected to move between calls, so they are identified by
+        their buffer only and the cached vtkPoints are updated in place on every hit unless they share the buffer of
+        coordinates.
+
+        Args:
+            coordinates (numpy.ndarray<float>): numpy.ndarray of shape (n,2) or (n,3) that contains the points
+            z_index (float): The value the z-value of 2d-points is filled with (only applicable for (n,2) input arrays)
+            dtype (numpy.dtype): The type the points are stored as, numpy.float32 or numpy.float64, by default the
+                precision of the input is preserved
+            validate (bool): Whether the input should be checked when it is converted, can be disabled for trusted input
+            workers (int): The number of threads a conversion is split across
+
+        Returns:
+            vtk_points (vtk.vtkPoints): VTK representation of the points
+        """
+        key = ('points', _identity(coordinates), z_index, None if dtype is None else numpy.dtype(dtype).str)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            vtk_points = to_vtk_points(coordinates, z_index=z_index, dtype=dtype, validate=validate, workers=workers)
+            entry = self._create(vtk_points, (coordinates,))
+        else:
+            update_points(entry[0], coordinates, z_index=z_index)
+        self._entries[key] = entry
+        self._evict()
+        return entry[0]
+
+    def clear(self):
+        """
+        Removes all entries from the cache.
+        """
+        self._entries.clear()
+        self.size = 0
+
+    def _create(self, converted, arrays):
+        size = converted.GetActualMemorySize() * 1024
+        self.size += size
+        return converted, arrays, size
+
+    def _key(self, array):
+        if not isinstance(array, numpy.ndarray):
+            return array
+        if self.hash_content:
+            return _identity(array) + (hashlib.sha1(numpy.ascontiguousarray(array)).hexdigest(),)
+        return _identity(array)
+
+    def _evict(self):
+        while self.size > self.max_bytes and self._entries:
+            _, (_, _, size) = self._entries.popitem(last=False)
+            self.size -= size
+
+def _identity(array):
+    return (array.__array_interface__['data'][0], array.shape, array.strides, array.dtype.str)
@@ -0,0 +1,187 @@
+import numpy
+import vtk
+from .raw import points as to_vtk_points
+from .raw import array as to_vtk_array
+from .raw.raw import _load
+from .attributes import attach
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+def image_data(point_data=None, cell_data=None, dimensions=None, origin=(0.0, 0.0, 0.0), spacing=(1.0, 1.0, 1.0),
+               order='F'):
+    """
+    Returns the VTK-representation of a regular grid with dense fields as point and cell data.
+
+    Fields are arrays with one axis per grid dimension and an optional trailing axis for components. With order 'F'
+    they are indexed as [x, y, z], with order 'C' as [z, y, x]. Fields are shared with VTK without copying when their
+    memory is laid out like VTK's, where x varies fastest after the components: C-contiguous arrays for order 'C' and
+    Fortran-contiguous arrays for order 'F' (for fields with components, arrays whose spatial axes are Fortran-ordered
+    while the components are contiguous, e.g. numpy.transpose(c_array, (2, 1, 0, 3))). Other fields are copied once.
+
+    Args:
+        point_data (dict<str, numpy.ndarray>): Fields with one entry per grid point
+        cell_data (dict<str, numpy.ndarray>): Fields with one entry per grid cell
+        dimensions (tuple<int>): The number of points along x, y (and z), by default implied by the shapes of the
+            fields, which is ambiguous for 2d grids with only vector fields
+        origin (tuple<float>): The position of the first point
+        spacing (tuple<float>): The distance between neighbouring points along x, y and z
+        order (str): 'F' if fields are indexed as [x, y, z] or 'C' if they are indexed as [z, y, x]
+
+    Returns:
+        image_data (vtk.vtkImageData): VTK representation of the grid
+    """
+    _check_order(order, 'image_data')
+    if dimensions is None:
+        dimensions = _dimensions(point_data, cell_data, order)
+    if dimensions is None:
+        raise Numpy2VtkFormatException(
+            'image_data needs dimensions, point_data or cell_data as input'
+        )
+
+    image = vtk.vtkImageData()
+    image.SetDimensions(*_padded(dimensions, 1))
+    image.SetOrigin(*_padded(origin, 0.0))
+    image.SetSpacing(*_padded(spacing, 1.0))
+    _attach_fields(image, dimensions, point_data, cell_data, order)
+
+    return image
+
+def rectilinear_grid(x, y, z=None, z_index=0, point_data=None, cell_data=None, order='F'):
+    """
+    Returns the VTK-representation of an axis aligned grid with varying spacing, defined by the coordinates of the
+    grid lines along each axis. Fields are passed as for image_data.
+
+    Args:
+        x (numpy.ndarray<float>): Array of shape (nx,) with the x-coordinates of the grid lines
+        y (numpy.ndarray<float>): Array of shape (ny,) with the y-coordinates of the grid lines
+        z (numpy.ndarray<float>): Array of shape (nz,) with the z-coordinates of the grid lines, a 2d grid if omitted
+        z_index (float): The z-value of a 2d grid (only applicable if z is omitted)
+        point_data (dict<str, numpy.ndarray>): Fields with one entry per grid point
+        cell_data (dict<str, numpy.ndarray>): Fields with one entry per grid cell
+        order (str): 'F' if fields are indexed as [x, y, z] or 'C' if they are indexed as [z, y, x]
+
+    Returns:
+        rectilinear_grid (vtk.vtkRectilinearGrid): VTK representation of the grid
+    """
+    _check_order(order, 'rectilinear_grid')
+    coordinates = [_load(c) for c in (x, y) + (() if z is None else (z,))]
+    for c in coordinates:
+        if not isinstance(c, numpy.ndarray) or len(c.shape) != 1:
+            raise Numpy2VtkFormatException(
+                'rectilinear_grid needs one dimensional numpy arrays as coordinates'
+            )
+    dimensions = tuple(len(c) for c in coordinates)
+    if z is None:
+        coordinates.append(numpy.array([z_index], dtype=numpy.float64))
+
+    grid = vtk.vtkRectilinearGrid()
+    grid.SetDimensions(*_padded(dimensions, 1))
+    grid.SetXCoordinates(to_vtk_array(_float(coordinates[0])))
+    grid.SetYCoordinates(to_vtk_array(_float(coordinates[1])))
+    grid.SetZCoordinates(to_vtk_array(_float(coordinates[2])))
+    _attach_fields(grid, dimensions, point_data, cell_data, order)
+
+    return grid
+
+def structured_grid(points, z_index=0, point_data=None, cell_data=None, order='F', dtype=None, workers=1):
+    """
+    Returns the VTK-representation of a curvilinear grid, where the position of every grid point is given. Points and
+    fields are passed as for image_data, points have a trailing axis of 2 or 3 coordinates.
+
+    Args:
+        points (numpy.ndarray<float> or str): Array of shape (nx,ny,nz,3) or (nx,ny,2|3) for order 'F' and of
+            shape (nz,ny,nx,3) or (ny,nx,2|3) for order 'C', paths to .npy files are memory-mapped
+        z_index (float): The value the z-value of 2d-points is filled with (only applicable for 2d coordinates)
+        point_data (dict<str, numpy.ndarray>): Fields with one entry per grid point
+        cell_data (dict<str, numpy.ndarray>): Fields with one entry per grid cell
+        order (str): 'F' if points and fields are indexed as [x, y, z] or 'C' if they are indexed as [z, y, x]
+        dtype (numpy.dtype): The type the points are stored as, numpy.float32 or numpy.float64, by default the
+            precision of the input is preserved
+        workers (int): The number of threads the conversion of the points is split across
+
+    Returns:
+        structured_grid (vtk.vtkStructuredGrid): VTK representation of the grid
+    """
+    _check_order(order, 'structured_grid')
+    points = _load(points)
+    if not isinstance(points, numpy.ndarray) or len(points.shape) not in (3, 4) or points.shape[-1] not in (2, 3):
+        raise Numpy2VtkFormatException(
+            'structured_grid needs an array of shape (nx,ny,2|3) or (nx,ny,nz,3) as input'
+        )
+    dimensions = points.shape[:-1] if order == 'F' else points.shape[-2::-1]
+
+    grid = vtk.vtkStructuredGrid()
+    grid.SetDimensions(*_padded(dimensions, 1))
+    grid.SetPoints(to_vtk_points(_flatten(points, dimensions, order, 'structured_grid', 'points'), z_index=z_index,
+                                 dtype=dtype, workers=workers))
+    _attach_fields(grid, dimensions, point_data, cell_data, order)
+
+    return grid
+
+def _attach_fields(data_set, dimensions, point_data, cell_data, order):
+    cell_dimensions = tuple(max(d - 1, 1) for d in dimensions)
+    attach(
+        data_set,
+        point_data=dict(
+            (name, _flatten(values, dimensions, order, 'point_data', name)) for name, values in point_data.items()
+        ) if point_data else None,
+        cell_data=dict(
+            (name, _flatten(values, cell_dimensions, order, 'cell_data', name)) for name, values in cell_data.items()
+        ) if cell_data else None
+    )
+
+def _flatten(values, dimensions, order, kind, name):
+    """
+    Returns a field of the given grid dimensions as array of shape (n,) or (n,c) in VTK point order, as a view of the
+    field where its memory layout allows it.
+    """
+    values = _load(values)
+    spatial = tuple(dimensions) if order == 'F' else tuple(reversed(dimensions))
+    if not isinstance(values, numpy.ndarray) or values.shape[:len(spatial)] != spatial or \
+            len(values.shape) > len(spatial) + 1:
+        raise Numpy2VtkFormatException(
+            '{} {} needs an array of shape {} with an optional component axis'.format(kind, name, spatial)
+        )
+
+    count = int(numpy.prod(spatial))
+    if order == 'C':
+        return values.reshape((count,) + values.shape[len(spatial):])
+    if len(values.shape) == len(spatial):
+        return values.reshape(count, order='F')
+    return numpy.moveaxis(values, -1, 0).reshape((values.shape[-1], count), order='F').T
+
+def _dimensions(point_data, cell_data, order):
+    """
+    Returns the grid dimensions implied by the shapes of all point and cell data fields. Fields have an axis per grid
+    dimension and an optional component axis, so the grid is 3d if a field has four axes, 2d if a field has two and
+    otherwise all fields are taken as 3d scalar fields.
+    """
+    fields = [(_load(values), 0) for values in (point_data or {}).values()] + \
+        [(_load(values), 1) for values in (cell_data or {}).values()]
+    if not fields:
+        return None
+    axes = set(len(getattr(values, 'shape', ())) for values, _ in fields)
+    if 2 in axes and 4 in axes:
+        raise Numpy2VtkFormatException(
+            'image_data fields need the same number of grid dimensions, pass dimensions to choose them'
+        )
+
+    spatial = 2 if 2 in axes else 3
+    implied = set(tuple(d + extra for d in getattr(values, 'shape', ())[:spatial]) for values, extra in fields)
+    if len(implied) != 1:
+        raise Numpy2VtkFormatException(
+            'image_data fields imply different dimensions, pass dimensions to choose them'
+        )
+    shape = implied.pop()
+    return shape if order == 'F' else tuple(reversed(shape))
+
+def _check_order(order, name):
+    if order not in ('F', 'C'):
+        raise Numpy2VtkFormatException(
+            "{} order needs to be 'F' or 'C'".format(name)
+        )
+
+def _padded(values, fill):
+    return tuple(values) + (fill,) * (3 - len(values))
+
+def _float(coordinates):
+    return coordinates if coordinates.dtype in (numpy.float32, numpy.float64) else coordinates.astype(numpy.float64)
@@ -2,44 +2,54 @@ import numpy
 import vtk
 from .raw import points as to_vtk_points
 from .raw import vertices as to_vtk_vertices
-from .raw import edges as to_vtk_edges
+from .raw.raw import _load
+from .attributes import attach
+from .lines import _line_cells
 from numpy2vtk.exceptions import Numpy2VtkFormatException
 
-def line(points, z_index=0, closed=False):
+def line(points, z_index=0, closed=False, poly_line=False, verts=True, point_data=None, cell_data=None,
+         dtype=None, validate=True, workers=1):
     """
     Returns the VTK-representation of a line that is build from the points in the numpy array.
 
     Args:
-        points (numpy.ndarray<float> or vtk.vtkPoints): The points that the line consist of.
-            If it's a numpy array it should be of dimensions (n,2) or (n,3)
+        points (numpy.ndarray<float>, str or vtk.vtkPoints): The points that the line consist of.
+            If it's a numpy array it should be of dimensions (n,2) or (n,3), paths to .npy files are memory-mapped
         z_index (float): The value the z-value of 2d-points is filled with (only applicable for (n,2) input arrays)
         closed (bool): Whether the last point of the line should be connected with the first one
+        poly_line (bool): Whether the line should be a single polyline cell instead of one cell per edge
+        verts (bool): Whether a vertex cell should be created for every point
+        point_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are attached as point data
+        cell_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are attached as cell data, one entry
+            per edge or for the polyline (the values of vertex cells are 0)
+        dtype (numpy.dtype): The type the points are stored as, numpy.float32 or numpy.float64, by default the
+            precision of the input is preserved
+        validate (bool): Whether the input should be checked, can be disabled for trusted input
+        workers (int): The number of threads the conversion is split across
 
     Returns:
         line_data (vtk.vtkPolyData): VTK polydata representation of the line
     """
+    points = _load(points)
     if not (isinstance(points, numpy.ndarray) or isinstance(points, vtk.vtkPoints)):
         raise Numpy2VtkFormatException(
             'line needs numpy array or vtk.vtkPoints as input'
         )
 
     if isinstance(points, numpy.ndarray):
-        vtk_points = to_vtk_points(points, z_index=z_index) if isinstance(points, numpy.ndarray) else points
+        vtk_points = to_vtk_points(points, z_index=z_index, dtype=dtype, validate=validate, workers=workers)
     else:
         vtk_points = points
 
     number_of_points = vtk_points.GetNumberOfPoints()
-    edges = map(lambda i: [i, i+1], range(0, number_of_points-1))
-    if closed:
-        edges.append([number_of_points-1, 0])
-    edges = numpy.array(edges, dtype=numpy.int)
-
-    vtk_lines = to_vtk_edges(edges)
-    vtk_vertices = to_vtk_vertices(numpy.array(range(number_of_points), dtype=numpy.int))
+    vtk_lines = _line_cells(numpy.array([0, number_of_points], dtype=numpy.int), closed, poly_line, workers)
 
     line_data = vtk.vtkPolyData()
     line_data.SetPoints(vtk_points)
-    line_data.SetVerts(vtk_vertices)
+    if verts:
+        vtk_vertices = to_vtk_vertices(numpy.arange(number_of_points, dtype=numpy.int), validate=False, workers=workers)
+        line_data.SetVerts(vtk_vertices)
     line_data.SetLines(vtk_lines)
+    attach(line_data, point_data=point_data, cell_data=cell_data, skipped_cells=line_data.GetNumberOfVerts())
 
     return line_data
@@ -0,0 +1,120 @@
+import numpy
+import vtk
+from .raw import points as to_vtk_points
+from .raw import vertices as to_vtk_vertices
+from .raw import edges as to_vtk_edges
+from .raw import polylines as to_vtk_polylines
+from .raw.raw import _load
+from .attributes import attach
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+from numpy2vtk.validation import check_offsets
+
+def lines(points, offsets=None, z_index=0, closed=False, poly_line=False, verts=True, point_data=None,
+          cell_data=None, dtype=None, validate=True, workers=1):
+    """
+    Returns the VTK-representation of many lines in a single polydata. The lines are either passed as a list of
+    arrays or as one array of points together with an array of offsets, where line i consists of the points
+    points[offsets[i]:offsets[i+1]].
+
+    Args:
+        points (list<numpy.ndarray<float>> or numpy.ndarray<float>): The points of the lines, either a list of arrays of
+            dimensions (n,2) or (n,3) (one per line) or a single array if offsets are given
+        offsets (numpy.ndarray<int>): Array of shape (n+1,) that defines where each of the n lines starts in points
+        z_index (float): The value the z-value of 2d-points is filled with (only applicable for (n,2) input arrays)
+        closed (bool): Whether the last point of each line should be connected with its first one
+        poly_line (bool): Whether each line should be a single polyline cell instead of one cell per edge
+        verts (bool): Whether a vertex cell should be created for every point
+        point_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are attached as point data
+        cell_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are attached as cell data, one entry
+            per edge or polyline (the values of vertex cells are 0)
+        dtype (numpy.dtype): The type the points are stored as, numpy.float32 or numpy.float64, by default the
+            precision of the input is preserved
+        validate (bool): Whether the input should be checked, can be disabled for trusted input
+        workers (int): The number of threads the conversion is split across
+
+    Returns:
+        lines_data (vtk.vtkPolyData): VTK polydata representation of the lines
+    """
+    if isinstance(points, (list, tuple)):
+        if offsets is not None:
+            raise Numpy2VtkFormatException(
+                'lines needs a single numpy array as input when offsets are given'
+            )
+        points, offsets = _concatenate([_load(p) for p in points], z_index, dtype)
+
+    points = _load(points)
+    offsets = _load(offsets)
+    if not isinstance(points, numpy.ndarray) or offsets is None:
+        raise Numpy2VtkFormatException(
+            'lines needs a list of numpy arrays or a numpy array and offsets as input'
+        )
+    if validate:
+        check_offsets(points, offsets, 'lines')
+    offsets = offsets.astype(numpy.int, copy=False)
+
+    vtk_points = to_vtk_points(points, z_index=z_index, dtype=dtype, validate=validate, workers=workers)
+
+    lines_data = vtk.vtkPolyData()
+    lines_data.SetPoints(vtk_points)
+    if verts:
+        vtk_vertices = to_vtk_vertices(numpy.arange(len(points), dtype=numpy.int), validate=False, workers=workers)
+        lines_data.SetVerts(vtk_vertices)
+    lines_data.SetLines(_line_cells(offsets, closed, poly_line, workers))
+    attach(lines_data, point_data=point_data, cell_data=cell_data, skipped_cells=lines_data.GetNumberOfVerts())
+
+    return lines_data
+
+def _concatenate(arrays, z_index, dtype=None):
+    """
+    Concatenates arrays of points of shape (n,2) or (n,3) into one array of shape (k,3) and returns it together with
+    the offsets of the arrays. Unless dtype is given, the result is float32 if all arrays are float32 and float64
+    otherwise.
+    """
+    for p in arrays:
+        if not isinstance(p, numpy.ndarray) or len(p.shape) != 2 or p.shape[1] not in (2, 3):
+            raise Numpy2VtkFormatException(
+                'lines needs a list of numpy arrays of nx2 or nx3 shape'
+            )
+
+    offsets = numpy.zeros(len(arrays) + 1, dtype=numpy.int)
+    numpy.cumsum([len(p) for p in arrays], out=offsets[1:])
+    if dtype is None:
+        dtypes = [p.dtype for p in arrays]
+        dtype = numpy.float32 if dtypes and all(d == numpy.float32 for d in dtypes) else numpy.float64
+    concatenated = numpy.empty((offsets[-1], 3), dtype=dtype)
+    for p, start, end in zip(arrays, offsets[:-1], offsets[1:]):
+        concatenated[start:end, :p.shape[1]] = p
+        if p.shape[1] == 2:
+            concatenated[start:end, 2] = z_index
+    return concatenated, offsets
+
+def _line_cells(offsets, closed, poly_line, workers=1):
+    """
+    Returns the vtkCellArray that connects consecutive points of each line defined by offsets, either as single
+    polyline cells or as one cell per edge.
+    """
+    number_of_points = offsets[-1]
+    starts = offsets[:-1]
+    ends = offsets[1:][offsets[1:] > starts] - 1
+    indices = numpy.arange(number_of_points, dtype=numpy.int)
+
+    if poly_line:
+        if not closed:
+            return to_vtk_polylines(indices, offsets=offsets, validate=False, workers=workers)
+        closed_offsets = offsets + numpy.arange(len(offsets))
+        closed_offsets[1:] -= numpy.cumsum(offsets[1:] == starts)
+        closing = closed_offsets[1:][offsets[1:] > starts] - 1
+        closed_indices = numpy.empty(closed_offsets[-1], dtype=numpy.int)
+        is_point = numpy.ones(len(closed_indices), dtype=bool)
+        is_point[closing] = False
+        closed_indices[is_point] = indices
+        closed_indices[closing] = starts[offsets[1:] > starts]
+        return to_vtk_polylines(closed_indices, offsets=closed_offsets, validate=False, workers=workers)
+
+    following = indices + 1
+    if closed:
+        following[ends] = starts[offsets[1:] > starts]
+        return to_vtk_edges(numpy.column_stack((indices, following)), validate=False, workers=workers)
+    is_start = numpy.ones(number_of_points, dtype=bool)
+    is_start[ends] = False
+    return to_vtk_edges(numpy.column_stack((indices[is_start], following[is_start])), validate=False, workers=workers)
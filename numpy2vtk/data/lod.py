@@ -0,0 +1,134 @@
+import numpy
+from .vertices import vertices
+from .raw.raw import _load, _windows
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+def point_cloud_levels(points, number_of_levels=4, factor=8, method='voxel', z_index=0, verts=True, point_data=None,
+                       seed=None, dtype=None):
+    """
+    Returns a hierarchy of subsampled versions of a point cloud, from all points to the coarsest level, so a viewer can
+    render the level that fits its budget (see level_for_budget or actors.point_cloud_lod).
+
+    Each level has about factor times fewer points than the previous one and is subsampled from it, so every level
+    is a subset of the finer ones. With method 'voxel' the bounding box is binned into a regular grid and the first
+    point of every occupied voxel is kept, which preserves the shape of the cloud. With method 'random' points are kept
+    at random.
+
+    Args:
+        points (numpy.ndarray<float> or str): The points of the cloud, should be of dimensions (n,2) or (n,3), paths to
+            .npy files are memory-mapped
+        number_of_levels (int): The number of levels including the one with all points
+        factor (float): The factor the number of points is reduced by from one level to the next
+        method (str): 'voxel' or 'random'
+        z_index (float): The value the z-value of 2d-points is filled with (only applicable for (n,2) input arrays)
+        verts (bool): Whether a vertex cell should be created for every point
+        point_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are subsampled with the points and
+            attached as point data
+        seed (int): The seed of the random subsampling
+        dtype (numpy.dtype): The type the points are stored as, numpy.float32 or numpy.float64, by default the
+            precision of the input is preserved
+
+    Returns:
+        levels (list<vtk.vtkPolyData>): VTK polydata representations of the levels, starting with all points
+    """
+    points = _load(points)
+    if not isinstance(points, numpy.ndarray) or len(points.shape) != 2 or points.shape[1] not in (2, 3):
+        raise Numpy2VtkFormatException(
+            'point_cloud_levels needs an array of nx2 or nx3 shape as input'
+        )
+    if method not in ('voxel', 'random'):
+        raise Numpy2VtkFormatException(
+            "point_cloud_levels method needs to be 'voxel' or 'random'"
+        )
+    if number_of_levels < 1 or factor <= 1:
+        raise Numpy2VtkFormatException(
+            'point_cloud_levels needs at least one level and a factor larger than 1'
+        )
+    point_data = dict((name, _load(values)) for name, values in (point_data or {}).items())
+
+    levels = [vertices(points, z_index=z_index, verts=verts, point_data=point_data, dtype=dtype)]
+    random = numpy.random.RandomState(seed)
+    selected = numpy.arange(len(points))
+    for level in range(1, number_of_levels):
+        target = len(points) / float(factor) ** level
+        if method == 'voxel':
+            selected = selected[_first_per_voxel(points, selected, target)]
+        else:
+            selected = selected[random.random_sample(len(selected)) < target / max(1, len(selected))]
+        levels.append(vertices(
+            points[selected], z_index=z_index, verts=verts, dtype=dtype,
+            point_data=dict((name, values[selected]) for name, values in point_data.items())
+        ))
+    return levels
+
+def level_for_budget(levels, budget):
+    """
+    Returns the finest level with at most budget points, or the coarsest level if all levels have more points.
+
+    Args:
+        levels (list<vtk.vtkPolyData>): The levels as returned by point_cloud_levels
+        budget (int): The maximum number of points that should be rendered
+
+    Returns:
+        level (vtk.vtkPolyData): The level that fits the budget
+    """
+    for level in levels:
+        if level.GetNumberOfPoints() <= budget:
+            return level
+    return levels[-1]
+
+def _first_per_voxel(points, selected, target):
+    """
+    Returns the positions in selected of the first point of every occupied voxel of a regular grid over the bounding
+    box of the selected points. The resolution of the grid is searched until about target voxels are occupied, as
+    clouds that do not fill their bounding box (e.g. scanned surfaces) occupy only a small part of the voxels.
+    """
+    lower = numpy.full(points.shape[1], numpy.inf)
+    upper = numpy.full(points.shape[1], -numpy.inf)
+    for start, end in _windows(len(selected)):
+        window = points[selected[start:end]]
+        lower = numpy.minimum(lower, window.min(axis=0))
+        upper = numpy.maximum(upper, window.max(axis=0))
+    extent = upper - lower
+    spanned = max(1, (extent > 0).sum())
+    # The largest resolution whose voxel keys fit into int64
+    limit = int(2 ** (62.0 / spanned))
+
+    # The resolution is at least the one of a cloud that fills its bounding box, it is doubled until enough voxels
+    # are occupied and then bisected
+    low, best = 1, _first_per_resolution(points, selected, lower, extent, 1)
+    high = min(limit, max(1, int(max(target, 1) ** (1.0 / spanned) + 1e-9)))
+    while True:
+        first = _first_per_resolution(points, selected, lower, extent, high)
+        if len(first) > target:
+            break
+        low, best = high, first
+        if len(first) >= 0.9 * target or high == limit:
+            return best
+        high = min(limit, 2 * high)
+    while high - low > 1:
+        middle = (low + high) // 2
+        first = _first_per_resolution(points, selected, lower, extent, middle)
+        if len(first) > target:
+            high = middle
+        else:
+            low, best = middle, first
+            if len(first) >= 0.9 * target:
+                break
+    return best
+
+def _first_per_resolution(points, selected, lower, extent, resolution):
+    """
+    Returns the positions in selected of the first point of every occupied voxel of a grid with resolution voxels
+    along every spanned axis. The voxel keys are computed in windows, so no temporaries of the size of points are
+    needed.
+    """
+    size = numpy.where(extent > 0, extent / resolution, 1.0)
+    keys = numpy.zeros(len(selected), dtype=numpy.int64)
+    for start, end in _windows(len(selected)):
+        voxels = numpy.minimum(((points[selected[start:end]] - lower) / size).astype(numpy.int64), resolution - 1)
+        for axis in reversed(range(points.shape[1])):
+            keys[start:end] = keys[start:end] * resolution + voxels[:, axis]
+    first = numpy.unique(keys, return_index=True)[1]
+    first.sort()
+    return first
@@ -0,0 +1,125 @@
+import numpy
+import vtk
+from vtk.util.numpy_support import ID_TYPE_CODE
+from .raw import points as to_vtk_points
+from .raw import vertices as to_vtk_vertices
+from .raw import polygons as to_vtk_polygons
+from .raw.raw import _load
+from .lines import _concatenate
+from .attributes import attach, _prepend_zeros
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+from numpy2vtk.validation import check_offsets
+
+def merge(parts, z_index=0, verts=True, part_ids=False, point_data=None, cell_data=None, dtype=None, validate=True):
+    """
+    Returns the VTK-representation of many meshes merged into a single polydata, which renders much faster than
+    many separate ones. The points of all parts are concatenated and the indices of their polys are offset by the
+    number of points of the preceding parts.
+
+    Args:
+        parts (list<tuple>): Tuples of points and polys of each part, as passed to mesh. Points are arrays of
+            dimensions (n,2) or (n,3), polys are arrays of shape nxm or flat arrays followed by offsets of shape (n+1,)
+        z_index (float): The value the z-value of 2d-points is filled with (only applicable for (n,2) input arrays)
+        verts (bool): Whether a vertex cell should be created for every point
+        part_ids (bool): Whether the index of the part of each cell should be attached as cell data 'part_id', vertex
+            cells get the part of their point
+        point_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are attached as point data, one entry
+            per point of all parts
+        cell_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are attached as cell data, one entry
+            per polygon of all parts (the values of vertex cells are 0)
+        dtype (numpy.dtype): The type the points are stored as, numpy.float32 or numpy.float64, by default float32 if
+            all parts are float32 and float64 otherwise
+        validate (bool): Whether the input should be checked, can be disabled for trusted input
+
+    Returns:
+        poly_data (vtk.vtkPolyData): VTK polydata representation of the merged meshes
+    """
+    if not isinstance(parts, (list, tuple)) or \
+            not all(isinstance(part, tuple) and len(part) in (2, 3) for part in parts):
+        raise Numpy2VtkFormatException(
+            'merge needs a list of tuples of points, polys and optionally offsets as input'
+        )
+    parts = [tuple(_load(array) for array in part) for part in parts]
+    if validate:
+        for part in parts:
+            _check_part(*part)
+
+    points, point_offsets = _concatenate([part[0] for part in parts], z_index, dtype)
+    index_counts = [part[1].size for part in parts]
+    indices = numpy.empty(sum(index_counts), dtype=ID_TYPE_CODE)
+    index_offsets = numpy.cumsum([0] + index_counts)
+    for part, start, end in zip(parts, index_offsets[:-1], index_offsets[1:]):
+        indices[start:end] = numpy.ravel(part[1])
+    if validate:
+        _check_bounds(indices, index_offsets, numpy.diff(point_offsets))
+    indices += numpy.repeat(point_offsets[:-1], index_counts)
+
+    sizes = [_cell_sizes(*part[1:]) for part in parts]
+    number_of_cells = numpy.array([len(s) for s in sizes], dtype=numpy.int)
+    sizes = numpy.concatenate(sizes or [numpy.zeros(0, dtype=numpy.int)])
+    if len(sizes) and (sizes == sizes[0]).all():
+        vtk_polygons = to_vtk_polygons(indices.reshape(-1, sizes[0]), validate=False)
+    else:
+        cell_offsets = numpy.zeros(len(sizes) + 1, dtype=numpy.int)
+        numpy.cumsum(sizes, out=cell_offsets[1:])
+        vtk_polygons = to_vtk_polygons(indices, offsets=cell_offsets, validate=False)
+
+    skipped_cells = len(points) if verts else 0
+    if part_ids:
+        # The part ids cover the vertex cells as well, so the other cell data is padded here instead of by attach
+        cell_data = dict((name, _prepend_zeros(values, skipped_cells)) for name, values in (cell_data or {}).items())
+        part_of_cells = numpy.repeat(numpy.arange(len(parts)), number_of_cells)
+        if verts:
+            part_of_points = numpy.repeat(numpy.arange(len(parts)), numpy.diff(point_offsets))
+            part_of_cells = numpy.append(part_of_points, part_of_cells)
+        cell_data['part_id'] = part_of_cells
+        skipped_cells = 0
+
+    poly_data = vtk.vtkPolyData()
+    poly_data.SetPoints(to_vtk_points(points, validate=False))
+    if verts:
+        poly_data.SetVerts(to_vtk_vertices(numpy.arange(len(points), dtype=numpy.int), validate=False))
+    poly_data.SetPolys(vtk_polygons)
+    attach(poly_data, point_data=point_data, cell_data=cell_data, skipped_cells=skipped_cells)
+
+    return poly_data
+
+def _cell_sizes(polys, offsets=None):
+    """
+    Returns the number of points of each polygon of a part.
+    """
+    if offsets is None:
+        return numpy.full(len(polys), polys.shape[1], dtype=numpy.int)
+    return numpy.diff(offsets)
+
+def _check_part(points, polys, offsets=None):
+    if not isinstance(points, numpy.ndarray) or len(points.shape) != 2 or points.shape[1] not in (2, 3):
+        raise Numpy2VtkFormatException(
+            'merge needs points of nx2 or nx3 shape'
+        )
+    if not isinstance(polys, numpy.ndarray) or polys.dtype.kind not in 'iu':
+        raise Numpy2VtkFormatException(
+            'merge polys needs to be numpy array of integer type'
+        )
+    if offsets is None and len(polys.shape) != 2:
+        raise Numpy2VtkFormatException(
+            'merge polys needs a nxm ndarray as input'
+        )
+    if offsets is not None:
+        if len(polys.shape) != 1:
+            raise Numpy2VtkFormatException(
+                'merge polys needs a one dimensional ndarray as input when offsets are given'
+            )
+        check_offsets(polys, offsets, 'merge polys')
+
+def _check_bounds(indices, index_offsets, number_of_points):
+    """
+    Checks the indices of all parts against the number of points of their part at once, with one reduction per part.
+    """
+    non_empty = index_offsets[1:] > index_offsets[:-1]
+    starts = index_offsets[:-1][non_empty]
+    if len(starts) and ((numpy.minimum.reduceat(indices, starts) < 0).any() or
+                        (numpy.maximum.reduceat(indices, starts) >= number_of_points[non_empty]).any()):
+        raise Numpy2VtkFormatException(
+            'merge polys references a point index that does not exist'
+        )
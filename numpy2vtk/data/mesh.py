@@ -3,45 +3,97 @@ import vtk
 from .raw import points as to_vtk_points
 from .raw import vertices as to_vtk_vertices
 from .raw import polygons as to_vtk_polygons
+from .raw import array as to_vtk_array
+from .raw.raw import _load
+from .attributes import attach
+from .spatial import voxel_hash
+from .weld import weld as weld_points
 from numpy2vtk.exceptions import Numpy2VtkFormatException
+from numpy2vtk.validation import check_bounds
 
-def mesh(points, polys, z_index=0):
+def mesh(points, polys, z_index=0, offsets=None, verts=True, point_data=None, cell_data=None, cache=None,
+         dtype=None, validate=True, workers=1, spatial_index=False, weld=None):
     """
     Returns the VTK-representation of a mesh that is build by creating the patches specified by points and polys.
     Points are the considered points and polys consists of an array of patches (which consist of indices into the
-    points array).
+    points array). Patches with differing numbers of points can be passed as a flat array of indices together with
+    an array of offsets, where patch i consists of polys[offsets[i]:offsets[i+1]].
 
     Args:
-        points (numpy.ndarray<float> or vtk.vtkPoints): The points that the mesh consist of.
-            If it's a numpy array it should be of dimensions (n,2) or (n,3)
-        polys (numpy.ndarray<int>): Array of patches, should be of shape nxm for n patches with m points per patch
+        points (numpy.ndarray<float>, str or vtk.vtkPoints): The points that the mesh consist of.
+            If it's a numpy array it should be of dimensions (n,2) or (n,3), paths to .npy files are memory-mapped
+        polys (numpy.ndarray<int> or str): Array of patches, should be of shape nxm for n patches with m points per
+            patch or of shape (k,) if offsets are given
         z_index (float): The value the z-value of 2d-points is filled with (only applicable for (n,2) input arrays)
+        offsets (numpy.ndarray<int> or str): Array of shape (n+1,) that defines where each of the n patches starts in
+            polys
+        verts (bool): Whether a vertex cell should be created for every point
+        point_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are attached as point data
+        cell_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are attached as cell data, one entry
+            per patch (the values of vertex cells are 0)
+        cache (numpy2vtk.data.ConversionCache): Cache that converted points, polys and vertex cells are reused from
+        dtype (numpy.dtype): The type the points are stored as, numpy.float32 or numpy.float64, by default the
+            precision of the input is preserved
+        validate (bool): Whether the input should be checked, can be disabled for trusted input
+        workers (int): The number of threads the conversion is split across
+        spatial_index (bool): Whether a VoxelHash of the converted points should be built and cached on the result,
+            see voxel_hash
+        weld (float): The tolerance duplicate points are merged with before the conversion, points that no patch
+            references are removed as well and point data is reduced accordingly, see data.weld. The ratio of the
+            number of original to kept points is attached as field data 'compaction_ratio'. Welding creates new
+            arrays on every call, so the cache is never hit for welded points and polys. By default points are not
+            welded
 
     Returns:
         poly_data (vtk.vtkPolyData): VTK polydata representation of the mesh
     """
+    points = _load(points)
+    polys = _load(polys)
     if not (isinstance(points, numpy.ndarray) or isinstance(points, vtk.vtkPoints)):
         raise Numpy2VtkFormatException(
             'mesh points needs to be numpy array or vtk.vtkPoints'
         )
+    if weld is not None:
+        if not isinstance(points, numpy.ndarray):
+            raise Numpy2VtkFormatException(
+                'mesh weld needs points as numpy array'
+            )
+        points, polys, kept, ratio = weld_points(points, polys, offsets=offsets, tolerance=weld, validate=validate)
+        point_data = dict((name, _load(values)[kept]) for name, values in (point_data or {}).items())
 
-    if isinstance(points, numpy.ndarray):
-        vtk_points = to_vtk_points(points, z_index=z_index)
+    if isinstance(points, numpy.ndarray) and cache is None:
+        vtk_points = to_vtk_points(points, z_index=z_index, dtype=dtype, validate=validate, workers=workers)
+    elif isinstance(points, numpy.ndarray):
+        vtk_points = cache.points(points, z_index=z_index, dtype=dtype, validate=validate, workers=workers)
     else:
         vtk_points = points
 
     number_of_points = vtk_points.GetNumberOfPoints()
-    if numpy.logical_or(polys > number_of_points-1, polys < 0).any():
-        raise Numpy2VtkFormatException(
-            'mesh polys references a point index that does not exist'
-        )
-
-    vtk_vertices = to_vtk_vertices(numpy.array(range(number_of_points), dtype=numpy.int))
-    vtk_polygons = to_vtk_polygons(polys)
+    if cache is None:
+        vtk_polygons = _polygons(polys, offsets, number_of_points, validate, workers)
+    else:
+        vtk_polygons = cache.get('polygons', (polys, _load(offsets), number_of_points),
+                                 lambda: _polygons(polys, offsets, number_of_points, validate, workers))
 
     poly_data = vtk.vtkPolyData()
     poly_data.SetPoints(vtk_points)
-    poly_data.SetVerts(vtk_vertices)
+    if verts and cache is None:
+        poly_data.SetVerts(_vertices(number_of_points, workers))
+    elif verts:
+        poly_data.SetVerts(cache.get('vertices', (number_of_points,), lambda: _vertices(number_of_points, workers)))
     poly_data.SetPolys(vtk_polygons)
+    attach(poly_data, point_data=point_data, cell_data=cell_data, skipped_cells=poly_data.GetNumberOfVerts())
+    if weld is not None:
+        poly_data.GetFieldData().AddArray(to_vtk_array(numpy.array([ratio]), name='compaction_ratio'))
+    if spatial_index:
+        voxel_hash(poly_data)
 
     return poly_data
+
+def _polygons(polys, offsets, number_of_points, validate, workers):
+    if validate and isinstance(polys, numpy.ndarray):
+        check_bounds(polys, number_of_points, 'mesh polys')
+    return to_vtk_polygons(polys, offsets=offsets, validate=validate, workers=workers)
+
+def _vertices(number_of_points, workers):
+    return to_vtk_vertices(numpy.arange(number_of_points, dtype=numpy.int), validate=False, workers=workers)
@@ -2,5 +2,7 @@ from raw import points
 from raw import vertices
 from raw import edges
 from raw import polygons
+from raw import polylines
+from raw import array
 
-__all__ = ['points', 'vertices', 'edges', 'polygons']
+__all__ = ['points', 'vertices', 'edges', 'polygons', 'polylines', 'array']
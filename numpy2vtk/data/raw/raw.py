@@ -1,127 +1,385 @@
+import atexit
+import os
+import threading
+from multiprocessing.pool import ThreadPool
 import numpy
 import vtk
+from vtk.util.numpy_support import numpy_to_vtk, numpy_to_vtkIdTypeArray, ID_TYPE_CODE
 from numpy2vtk.exceptions import Numpy2VtkFormatException
+from numpy2vtk.validation import check_offsets
 
-def points(coordinates, z_index=0):
+# Number of rows that are copied at once, which bounds the temporary memory that is needed when converting large
+# (e.g. memory-mapped) arrays
+WINDOW_SIZE = 1 << 16
+
+# Thread pools by number of workers, they are kept alive to be reused by later conversions and closed at exit. They
+# belong to the process with _pools_pid, a forked child inherits them without their threads and starts its own
+_pools = {}
+_pools_lock = threading.Lock()
+_pools_pid = os.getpid()
+
+def points(coordinates, z_index=0, copy=False, dtype=None, validate=True, workers=1):
     """
     Returns the raw VTK-representation of the points in the passed numpy array
 
+    The precision of float32 and float64 input is preserved (as vtkFloatArray or vtkDoubleArray), other input is
+    converted to float64 unless dtype is given. Writeable C-contiguous arrays of shape (n,3) that already have this
+    type are wrapped without copying, the returned vtkPoints keep a reference to the numpy buffer, so changes to the
+    array are visible in VTK. All other input is converted with a single vectorized copy. Read-only arrays are always
+    copied, as VTK writes to the points (e.g. update_points), this includes paths to .npy files, which are memory-mapped
+    read-only and copied in windows of WINDOW_SIZE rows, so only the returned vtkPoints need to be held in memory.
+
     Args:
-        coordinates (numpy.ndarray<float>): numpy.ndarray of shape (n,2) or (n,3) that contains the points
+        coordinates (numpy.ndarray<float> or str): numpy.ndarray of shape (n,2) or (n,3) that contains the points or
+            the path to a .npy file containing it
         z_index (float): The value the z-value of 2d-points is filled with (only applicable for (n,2) input arrays)
+        copy (bool): Whether the points should always be copied instead of sharing the buffer of the numpy array
+        dtype (numpy.dtype): The type the points are stored as, numpy.float32 or numpy.float64, by default the
+            precision of the input is preserved
+        validate (bool): Whether the input should be checked, can be disabled for trusted input
+        workers (int): The number of threads the conversion is split across, windows of WINDOW_SIZE rows are filled in
+            parallel
 
     Returns:
         vtk_points (vtk.vtkPoints): VTK representation of the points
     """
-    if not isinstance(coordinates, numpy.ndarray):
+    coordinates = _load(coordinates)
+    if validate and not isinstance(coordinates, numpy.ndarray):
         raise Numpy2VtkFormatException(
             'points needs numpy array as input'
         )
-    if len(coordinates.shape) != 2:
+    if validate and len(coordinates.shape) != 2:
         raise Numpy2VtkFormatException(
             'points needs a two dimensional array as input, was {}-dimensional'.format(len(coordinates.shape))
         )
-    if coordinates.shape[1] != 2 and coordinates.shape[1] != 3:
+    if validate and coordinates.shape[1] != 2 and coordinates.shape[1] != 3:
         raise Numpy2VtkFormatException(
             'points needs an array of nx2 or nx3 shape, was nx{}'.format(coordinates.shape[1])
         )
+    if validate and dtype is not None and numpy.dtype(dtype) not in (numpy.float32, numpy.float64):
+        raise Numpy2VtkFormatException(
+            'points dtype needs to be numpy.float32 or numpy.float64'
+        )
+
+    if dtype is None:
+        dtype = coordinates.dtype if coordinates.dtype in (numpy.float32, numpy.float64) else numpy.float64
+    shared = not copy and coordinates.shape[1] == 3 and coordinates.dtype == dtype and \
+        coordinates.flags.c_contiguous and coordinates.flags.writeable
+    if shared:
+        data = coordinates
+    else:
+        data = numpy.empty((coordinates.shape[0], 3), dtype=dtype)
+
+        def fill(start, end):
+            data[start:end, :coordinates.shape[1]] = coordinates[start:end]
+            if coordinates.shape[1] == 2:
+                data[start:end, 2] = z_index
+        _map_windows(fill, len(coordinates), workers)
 
     vtk_points = vtk.vtkPoints()
-    for p in coordinates:
-        z_value = p[2] if coordinates.shape[1] == 3 else z_index
-        vtk_points.InsertNextPoint([p[0], p[1], z_value])
+    vtk_points.SetData(numpy_to_vtk(data, deep=0))
 
     return vtk_points
 
-def vertices(indices):
+def vertices(indices, validate=True, workers=1):
     """
     Maps a numpy ndarray of shape (n,) to an vtkCellArray of vertex indices
 
     Args:
         indices (numpy.ndarray<int>): A numpy.ndarray of shape (n,) of indices that defines the n vertices
+        validate (bool): Whether the input should be checked, can be disabled for trusted input
+        workers (int): The number of threads the conversion is split across, windows of WINDOW_SIZE rows are filled in
+            parallel
 
     Returns:
         vtk_vertices (vtk.vtkCellArray): VTK representation of the vertices
     """
-    if not isinstance(indices, numpy.ndarray):
+    if validate and not isinstance(indices, numpy.ndarray):
         raise Numpy2VtkFormatException(
             'vertices needs numpy array as input'
         )
-    if len(indices.shape) != 1:
+    if validate and len(indices.shape) != 1:
         raise Numpy2VtkFormatException(
             'vertices needs a one dimensional array as input, was {}-dimensional'.format(len(indices.shape))
         )
-    if indices.dtype != numpy.int:
+    if validate and indices.dtype.kind not in 'iu':
         raise Numpy2VtkFormatException(
-            'vertices need to be numpy array of type numpy.int'
+            'vertices need to be numpy array of integer type'
         )
 
-    vtk_vertices = vtk.vtkCellArray()
-    for v in indices:
-        vtk_vertices.InsertNextCell(1)
-        vtk_vertices.InsertCellPoint(v)
-    return vtk_vertices
+    return _cell_array(indices.reshape(-1, 1), workers=workers)
 
-def edges(indices):
+def edges(indices, validate=True, workers=1):
     """
     Maps a numpy ndarray to an vtkCellArray of vtkLines
 
     Args:
         indices (numpy.ndarray<int>): A numpy.ndarray of shape (n,2) of indices that define n edges
+        validate (bool): Whether the input should be checked, can be disabled for trusted input
+        workers (int): The number of threads the conversion is split across, windows of WINDOW_SIZE rows are filled in
+            parallel
 
     Returns:
         vtk_lines (vtk.vtkCellArray): VTK representation of the edges
     """
-    if not isinstance(indices, numpy.ndarray):
+    if validate and not isinstance(indices, numpy.ndarray):
         raise Numpy2VtkFormatException(
             'lines needs numpy array as input'
         )
-    if len(indices.shape) != 2 or indices.shape[1] != 2:
+    if validate and (len(indices.shape) != 2 or indices.shape[1] != 2):
         raise Numpy2VtkFormatException(
             'lines needs a nx2 ndarray as input'
         )
-    if indices.dtype != numpy.int:
+    if validate and indices.dtype.kind not in 'iu':
         raise Numpy2VtkFormatException(
-            'lines needs to be numpy array of type numpy.int'
+            'lines needs to be numpy array of integer type'
         )
-    vtk_lines = vtk.vtkCellArray()
-    for e in indices:
-        line = vtk.vtkLine()
-        line.GetPointIds().SetId(0, e[0])
-        line.GetPointIds().SetId(1, e[1])
-        vtk_lines.InsertNextCell(line)
-    return vtk_lines
+    return _cell_array(indices, workers=workers)
 
-def polygons(indices):
+def polygons(indices, offsets=None, validate=True, workers=1):
     """
     Maps a numpy ndarray to an vtkCellArray of vtkPolygons
 
+    Polygons with differing numbers of points can be passed as a flat array of indices together with an array of
+    offsets, where the points of polygon i are indices[offsets[i]:offsets[i+1]].
+
+    Both arrays can also be memory-mapped or be passed as paths to .npy files, they are read in windows of WINDOW_SIZE
+    polygons.
+
     Args:
-        indices (numpy.ndarray<int>): A numpy.ndarray of shape (n,m) of indices that define n polygons with m points each
+        indices (numpy.ndarray<int> or str): A numpy.ndarray of shape (n,m) of indices that define n polygons with m
+            points each or of shape (k,) if offsets are given
+        offsets (numpy.ndarray<int> or str): A numpy.ndarray of shape (n+1,) that defines where each of the n polygons
+            starts in indices, starting with 0 and ending with k
+        validate (bool): Whether the input should be checked, can be disabled for trusted input
+        workers (int): The number of threads the conversion is split across, windows of WINDOW_SIZE rows are filled in
+            parallel
 
     Returns:
         vtk_polygons (vtk.vtkCellArray): VTK representation of the polygons
     """
-    if not isinstance(indices, numpy.ndarray):
+    return _cells(indices, offsets, 'polygons', validate, workers)
+
+def polylines(indices, offsets=None, validate=True, workers=1):
+    """
+    Maps a numpy ndarray to an vtkCellArray of vtkPolyLines
+
+    Polylines with differing numbers of points can be passed as a flat array of indices together with an array of
+    offsets, where the points of polyline i are indices[offsets[i]:offsets[i+1]].
+
+    Args:
+        indices (numpy.ndarray<int> or str): A numpy.ndarray of shape (n,m) of indices that define n polylines with m
+            points each or of shape (k,) if offsets are given
+        offsets (numpy.ndarray<int> or str): A numpy.ndarray of shape (n+1,) that defines where each of the n polylines
+            starts in indices, starting with 0 and ending with k
+        validate (bool): Whether the input should be checked, can be disabled for trusted input
+        workers (int): The number of threads the conversion is split across, windows of WINDOW_SIZE rows are filled in
+            parallel
+
+    Returns:
+        vtk_polylines (vtk.vtkCellArray): VTK representation of the polylines
+    """
+    return _cells(indices, offsets, 'polylines', validate, workers)
+
+def array(values, name=None, validate=True):
+    """
+    Returns the raw VTK-representation of a numpy array of attribute values (e.g. scalars or vectors).
+
+    Contiguous integer, float32 and float64 arrays are wrapped without copying, boolean arrays are wrapped as unsigned
+    chars. All other input is converted with a single vectorized copy.
+
+    Args:
+        values (numpy.ndarray): numpy.ndarray of shape (n,) or (n,c) that contains n values with c components each
+        name (str): The name of the array
+        validate (bool): Whether the input should be checked, can be disabled for trusted input
+
+    Returns:
+        vtk_array (vtk.vtkDataArray): VTK representation of the values
+    """
+    values = _load(values)
+    if validate and not isinstance(values, numpy.ndarray):
         raise Numpy2VtkFormatException(
-            'polygons needs numpy array as input'
+            'array needs numpy array as input'
         )
-    if len(indices.shape) != 2:
+    if validate and len(values.shape) != 1 and len(values.shape) != 2:
         raise Numpy2VtkFormatException(
-            'polygons needs a nxm ndarray as input'
+            'array needs a one or two dimensional array as input, was {}-dimensional'.format(len(values.shape))
         )
-    if indices.dtype != numpy.int:
+    if validate and values.dtype.kind not in 'biuf':
         raise Numpy2VtkFormatException(
-            'polygons needs to be numpy array of type numpy.int'
+            'array needs to be numpy array of boolean, integer or float type'
         )
 
-    number_of_polygons = indices.shape[0]
-    poly_shape = indices.shape[1]
-    vtk_polygons = vtk.vtkCellArray()
-    for j in range(0, number_of_polygons):
-        polygon = vtk.vtkPolygon()
-        polygon.GetPointIds().SetNumberOfIds(poly_shape)
-        for i in range(0, poly_shape):
-            polygon.GetPointIds().SetId(i, indices[j, i])
-        vtk_polygons.InsertNextCell(polygon)
-    return vtk_polygons
+    if values.dtype.kind == 'b':
+        values = values.view(numpy.uint8)
+    elif values.dtype.kind == 'f' and values.dtype not in (numpy.float32, numpy.float64):
+        values = values.astype(numpy.float64 if values.dtype.itemsize > 8 else numpy.float32)
+    if isinstance(values, numpy.memmap):
+        copied = numpy.empty(values.shape, dtype=values.dtype)
+        for start, end in _windows(len(values)):
+            copied[start:end] = values[start:end]
+        values = copied
+
+    vtk_array = numpy_to_vtk(values, deep=0)
+    if name is not None:
+        vtk_array.SetName(name)
+
+    return vtk_array
+
+def _cells(indices, offsets, name, validate, workers):
+    """
+    Validates indices (and offsets) of cells and maps them to a vtkCellArray, name is used in the error messages.
+    """
+    indices = _load(indices)
+    offsets = _load(offsets)
+    if validate:
+        if not isinstance(indices, numpy.ndarray):
+            raise Numpy2VtkFormatException(
+                '{} needs numpy array as input'.format(name)
+            )
+        if offsets is None and len(indices.shape) != 2:
+            raise Numpy2VtkFormatException(
+                '{} needs a nxm ndarray as input'.format(name)
+            )
+        if offsets is not None and len(indices.shape) != 1:
+            raise Numpy2VtkFormatException(
+                '{} needs a one dimensional ndarray as input when offsets are given'.format(name)
+            )
+        if indices.dtype.kind not in 'iu':
+            raise Numpy2VtkFormatException(
+                '{} needs to be numpy array of integer type'.format(name)
+            )
+        if offsets is not None:
+            check_offsets(indices, offsets, name)
+
+    return _cell_array(indices, offsets=offsets, workers=workers)
+
+def _cell_array(indices, offsets=None, workers=1):
+    """
+    Builds a vtkCellArray from a numpy ndarray of shape (n,m) or from a flat numpy ndarray and offsets in a single call.
+
+    Args:
+        indices (numpy.ndarray<int>): A numpy.ndarray of shape (n,m) of indices that define n cells with m points each
+            or of shape (k,) if offsets are given
+        offsets (numpy.ndarray<int>): A numpy.ndarray of shape (n+1,) that defines where each of the n cells starts
+            in indices
+
+    Returns:
+        vtk_cells (vtk.vtkCellArray): VTK representation of the cells
+    """
+    number_of_cells = len(indices) if offsets is None else len(offsets) - 1
+    return _wrap_cell_array(_legacy_cells(indices, offsets, workers=workers), number_of_cells)
+
+def _legacy_cells(indices, offsets=None, out=None, workers=1):
+    """
+    Lays out cells as [m, i0, ..., im-1] for each cell, which is the format VTK uses internally. Indices of any integer
+    type are cast to vtkIdType while they are copied into this layout.
+
+    Args:
+        indices (numpy.ndarray<int>): A numpy.ndarray of shape (n,m) of indices that define n cells with m points each
+            or of shape (k,) if offsets are given
+        offsets (numpy.ndarray<int>): A numpy.ndarray of shape (n+1,) that defines where each of the n cells starts
+            in indices
+        out (numpy.ndarray<int>): A numpy.ndarray of shape (n+k,) of vtkIdType the cells are written to instead of a
+            newly allocated one
+        workers (int): The number of threads the windows of cells are filled from
+
+    Returns:
+        cells (numpy.ndarray<int>): A numpy.ndarray of shape (n+k,) of vtkIdType
+    """
+    if offsets is None:
+        number_of_cells, cell_size = indices.shape
+        if out is None:
+            cells = numpy.empty((number_of_cells, cell_size + 1), dtype=ID_TYPE_CODE)
+        else:
+            cells = out.reshape(number_of_cells, cell_size + 1)
+
+        def fill(start, end):
+            cells[start:end, 0] = cell_size
+            cells[start:end, 1:] = indices[start:end]
+        _map_windows(fill, number_of_cells, workers)
+        return cells.ravel()
+
+    number_of_cells = len(offsets) - 1
+    cells = numpy.empty(len(indices) + number_of_cells, dtype=ID_TYPE_CODE) if out is None else out
+
+    def fill(first, last):
+        window_offsets = numpy.array(offsets[first:last + 1], dtype=ID_TYPE_CODE)
+        window = cells[window_offsets[0] + first:window_offsets[-1] + last]
+        headers = window_offsets[:-1] - window_offsets[0] + numpy.arange(last - first)
+        window[headers] = numpy.diff(window_offsets)
+        is_index = numpy.ones(len(window), dtype=bool)
+        is_index[headers] = False
+        window[is_index] = indices[window_offsets[0]:window_offsets[-1]]
+    _map_windows(fill, number_of_cells, workers)
+    return cells
+
+def _wrap_cell_array(cells, number_of_cells):
+    """
+    Wraps cells in the layout returned by _legacy_cells as vtkCellArray without copying them.
+
+    Args:
+        cells (numpy.ndarray<int>): A contiguous numpy.ndarray of vtkIdType in the layout returned by _legacy_cells
+        number_of_cells (int): The number of cells in cells
+
+    Returns:
+        vtk_cells (vtk.vtkCellArray): VTK representation of the cells
+    """
+    vtk_cells = vtk.vtkCellArray()
+    vtk_cells.SetCells(number_of_cells, numpy_to_vtkIdTypeArray(cells, deep=0))
+    return vtk_cells
+
+def _load(array):
+    """
+    Opens a path to a .npy file as read-only memory-mapped array, all other input is returned unchanged.
+    """
+    if isinstance(array, basestring) and array.endswith('.npy'):
+        return numpy.load(array, mmap_mode='r')
+    return array
+
+def _windows(length):
+    """
+    Splits range(length) into consecutive (start, end) windows of at most WINDOW_SIZE entries.
+    """
+    return [(start, min(start + WINDOW_SIZE, length)) for start in range(0, length, WINDOW_SIZE)]
+
+def _map_windows(fill, length, workers=1):
+    """
+    Calls fill(start, end) for every window of range(length), from a pool of threads if workers is larger than 1.
+    The windows need to be independent, numpy releases the GIL while copying them so the threads run in parallel.
+    """
+    windows = _windows(length)
+    if workers > 1 and len(windows) > 1:
+        _pool(workers).map(lambda window: fill(*window), windows)
+    else:
+        for start, end in windows:
+            fill(start, end)
+
+def _pool(workers):
+    """
+    Returns the thread pool with the given number of workers, the lock makes sure only one is created.
+    """
+    if _pools_pid != os.getpid():
+        _reset_pools()
+    with _pools_lock:
+        if workers not in _pools:
+            _pools[workers] = ThreadPool(workers)
+        return _pools[workers]
+
+def _reset_pools():
+    """
+    Forgets the thread pools of the parent process in a forked child, their threads do not exist in the child and the
+    lock may have been held by one of them while forking, so neither can be used.
+    """
+    global _pools, _pools_lock, _pools_pid
+    _pools, _pools_lock, _pools_pid = {}, threading.Lock(), os.getpid()
+
+@atexit.register
+def _close_pools():
+    if _pools_pid != os.getpid():
+        return
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+            pool.join()
+        _pools.clear()
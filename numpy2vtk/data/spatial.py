@@ -0,0 +1,191 @@
+import itertools
+import numpy
+import vtk
+from vtk.util.numpy_support import vtk_to_numpy
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+class VoxelHash(object):
+    """
+    Spatial index of points that answers radius and nearest neighbour queries for many query points at once. The
+    points are binned into cubic voxels and sorted by voxel, queries look up the voxels around them with binary
+    searches. The loops run over neighbouring voxels, never over the query points.
+
+    Example:
+        index = VoxelHash(points)
+        indices, offsets = index.radius(queries, 0.1)
+        neighbours_of_first_query = indices[offsets[0]:offsets[1]]
+
+    Args:
+        points (numpy.ndarray<float>): The points that are indexed, should be of dimensions (n,2) or (n,3), they are
+            referenced and not copied
+        cell_size (float): The edge length of the voxels, by default chosen so there is about one point per voxel
+    """
+
+    def __init__(self, points, cell_size=None):
+        if not isinstance(points, numpy.ndarray) or len(points.shape) != 2 or points.shape[1] not in (2, 3):
+            raise Numpy2VtkFormatException(
+                'voxel hash needs an array of nx2 or nx3 shape as input'
+            )
+        if cell_size is not None and cell_size <= 0:
+            raise Numpy2VtkFormatException(
+                'voxel hash cell size needs to be positive'
+            )
+        self.points = points
+        self._lower = points.min(axis=0) if len(points) else numpy.zeros(points.shape[1])
+        self.cell_size = float(cell_size or _default_cell_size(points, self._lower))
+
+        voxels = self._voxels(points)
+        self._dimensions = voxels.max(axis=0) + 1 if len(points) else numpy.ones(points.shape[1], dtype=numpy.int64)
+        keys = self._keys(voxels)
+        self._order = numpy.argsort(keys, kind='mergesort')
+        self._voxel_keys, starts = numpy.unique(keys[self._order], return_index=True)
+        self._starts = numpy.append(starts, len(points))
+
+    def radius(self, queries, radius):
+        """
+        Returns the indices of all points within radius of each query point.
+
+        Args:
+            queries (numpy.ndarray<float>): The query points, should be of the same dimensions as the indexed points
+            radius (float): The maximum distance of the returned points
+
+        Returns:
+            indices (tuple<numpy.ndarray>): Arrays of shape (k,) and (m+1,) with the indices of the points and the
+                offsets, where the neighbours of query i are indices[offsets[i]:offsets[i+1]]
+        """
+        queries = self._check_queries(queries)
+        voxels = self._voxels(queries)
+        reach = int(numpy.ceil(radius / self.cell_size))
+
+        query_ids, candidates = [], []
+        for step in itertools.product(range(-reach, reach + 1), repeat=queries.shape[1]):
+            ids, points = self._candidates(voxels + step)
+            query_ids.append(ids)
+            candidates.append(points)
+        query_ids = numpy.concatenate(query_ids)
+        candidates = numpy.concatenate(candidates)
+
+        inside = _squared_distances(self.points[candidates], queries[query_ids]) <= radius * radius
+        query_ids, candidates = query_ids[inside], candidates[inside]
+        order = numpy.argsort(query_ids, kind='mergesort')
+        offsets = numpy.zeros(len(queries) + 1, dtype=numpy.int64)
+        numpy.cumsum(numpy.bincount(query_ids, minlength=len(queries)), out=offsets[1:])
+        return candidates[order], offsets
+
+    def nearest(self, queries):
+        """
+        Returns the nearest point of each query point. The voxels around the queries are searched in rings of
+        growing size until no closer point can exist.
+
+        Args:
+            queries (numpy.ndarray<float>): The query points, should be of the same dimensions as the indexed points
+
+        Returns:
+            nearest (tuple<numpy.ndarray>): Arrays of shape (m,) with the indices of the nearest points and their
+                distances
+        """
+        queries = self._check_queries(queries)
+        if not len(self.points):
+            raise Numpy2VtkFormatException(
+                'voxel hash needs points to find the nearest one'
+            )
+        voxels = self._voxels(queries)
+        indices = numpy.full(len(queries), -1, dtype=numpy.int64)
+        distances = numpy.full(len(queries), numpy.inf)
+        # The largest ring that can contain a point, as voxels outside the bounding box are empty
+        last_ring = numpy.maximum(numpy.abs(voxels), numpy.abs(voxels - self._dimensions + 1)).max(axis=1)
+
+        pending = numpy.arange(len(queries))
+        ring = 0
+        while len(pending):
+            for step in _ring(ring, queries.shape[1]):
+                ids, candidates = self._candidates(voxels[pending] + step)
+                if not len(ids):
+                    continue
+                ids = pending[ids]
+                squared = _squared_distances(self.points[candidates], queries[ids])
+                # Visits the candidates from farthest to nearest so the nearest one is assigned last
+                order = numpy.argsort(-squared, kind='mergesort')
+                ids, candidates, squared = ids[order], candidates[order], squared[order]
+                closer = squared < distances[ids]
+                distances[ids[closer]] = squared[closer]
+                indices[ids[closer]] = candidates[closer]
+            # Points in the rings beyond are at least ring voxels away from the voxel of a query
+            done = (numpy.sqrt(distances[pending]) <= ring * self.cell_size) | (last_ring[pending] <= ring)
+            pending = pending[~done]
+            ring += 1
+        return indices, numpy.sqrt(distances)
+
+    def _candidates(self, voxels):
+        """
+        Returns the query ids and point indices of all points in the given voxels, one voxel per query.
+        """
+        inside = ((voxels >= 0) & (voxels < self._dimensions)).all(axis=1)
+        ids = numpy.flatnonzero(inside)
+        keys = self._keys(voxels[ids])
+        slots = numpy.minimum(numpy.searchsorted(self._voxel_keys, keys), max(len(self._voxel_keys) - 1, 0))
+        occupied = self._voxel_keys[slots] == keys if len(self._voxel_keys) else numpy.zeros(len(ids), dtype=bool)
+        ids, slots = ids[occupied], slots[occupied]
+
+        starts, lengths = self._starts[slots], self._starts[slots + 1] - self._starts[slots]
+        positions = numpy.arange(lengths.sum()) + numpy.repeat(starts - numpy.cumsum(lengths) + lengths, lengths)
+        return numpy.repeat(ids, lengths), self._order[positions]
+
+    def _voxels(self, points):
+        return numpy.floor((points - self._lower) / self.cell_size).astype(numpy.int64)
+
+    def _keys(self, voxels):
+        keys = numpy.zeros(len(voxels), dtype=numpy.int64)
+        for axis in range(voxels.shape[1]):
+            keys = keys * self._dimensions[axis] + voxels[:, axis]
+        return keys
+
+    def _check_queries(self, queries):
+        if not isinstance(queries, numpy.ndarray) or len(queries.shape) != 2 or \
+                queries.shape[1] != self.points.shape[1]:
+            raise Numpy2VtkFormatException(
+                'voxel hash queries need to be of the same dimensions as the points'
+            )
+        return queries
+
+def voxel_hash(data_set, cell_size=None):
+    """
+    Returns the VoxelHash of the points of a data set. The index is cached on the data set and only rebuilt when its
+    points were modified or another cell size is requested. The index references the points of the data set.
+
+    Args:
+        data_set (vtk.vtkPointSet): The data set whose points are indexed, e.g. vtk.vtkPolyData
+        cell_size (float): The edge length of the voxels, by default chosen so there is about one point per voxel
+
+    Returns:
+        index (numpy2vtk.data.VoxelHash): The spatial index of the points
+    """
+    if not isinstance(data_set, vtk.vtkPointSet) or data_set.GetPoints() is None:
+        raise Numpy2VtkFormatException(
+            'voxel hash needs a vtk.vtkPointSet with points as input'
+        )
+    vtk_points = data_set.GetPoints()
+    cached = getattr(data_set, '_voxel_hash', None)
+    if cached is not None and cached[0] == vtk_points.GetMTime() and cached[1] == cell_size:
+        return cached[2]
+
+    index = VoxelHash(vtk_to_numpy(vtk_points.GetData()).reshape(-1, 3), cell_size)
+    data_set._voxel_hash = (vtk_points.GetMTime(), cell_size, index)
+    return index
+
+def _default_cell_size(points, lower):
+    extent = points.max(axis=0) - lower if len(points) else numpy.zeros(points.shape[1])
+    spanned = extent[extent > 0]
+    if not len(spanned):
+        return 1.0
+    return (numpy.prod(spanned) / len(points)) ** (1.0 / len(spanned))
+
+def _ring(ring, dimensions):
+    """
+    Returns the steps to all voxels whose largest distance to the center voxel along any axis is ring.
+    """
+    steps = numpy.array(list(itertools.product(range(-ring, ring + 1), repeat=dimensions)), dtype=numpy.int64)
+    return steps[numpy.abs(steps).max(axis=1) == ring]
+
+def _squared_distances(a, b):
+    return ((a - b) ** 2).sum(axis=1)
@@ -0,0 +1,166 @@
+import numpy
+import vtk
+from vtk.util.numpy_support import numpy_to_vtk, numpy_to_vtkIdTypeArray, ID_TYPE_CODE
+from .raw import points as to_vtk_points
+from .raw.raw import _legacy_cells, _wrap_cell_array, _load
+from .attributes import attach
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+from numpy2vtk.validation import check_bounds, check_offsets
+
+# The number of points of the cell types that have a fixed size, 0 for cell types with a variable number of points.
+CELL_SIZES = numpy.zeros(256, dtype=numpy.int)
+for _cell_type, _size in [
+        (vtk.VTK_VERTEX, 1), (vtk.VTK_LINE, 2), (vtk.VTK_TRIANGLE, 3), (vtk.VTK_PIXEL, 4), (vtk.VTK_QUAD, 4),
+        (vtk.VTK_TETRA, 4), (vtk.VTK_VOXEL, 8), (vtk.VTK_HEXAHEDRON, 8), (vtk.VTK_WEDGE, 6), (vtk.VTK_PYRAMID, 5),
+        (vtk.VTK_QUADRATIC_EDGE, 3), (vtk.VTK_QUADRATIC_TRIANGLE, 6), (vtk.VTK_QUADRATIC_QUAD, 8),
+        (vtk.VTK_QUADRATIC_TETRA, 10), (vtk.VTK_QUADRATIC_HEXAHEDRON, 20), (vtk.VTK_QUADRATIC_WEDGE, 15),
+        (vtk.VTK_QUADRATIC_PYRAMID, 13)]:
+    CELL_SIZES[_cell_type] = _size
+
+def unstructured_grid(points, cells, offsets=None, types=None, z_index=0, point_data=None, cell_data=None,
+                      dtype=None, validate=True, workers=1):
+    """
+    Returns the VTK-representation of an unstructured grid of (e.g. volumetric) cells of arbitrary VTK cell types.
+
+    The cells are passed in one of three ways:
+        - an array of shape (n,m) of n cells with m points each, types is a single cell type or one per cell
+        - a flat array of indices together with offsets, where cell i consists of cells[offsets[i]:offsets[i+1]], and
+          one cell type per cell
+        - blocks of cells of the same type, as dict or list of pairs of a cell type and an array of shape (n,m).
+          The cells of a dict are ordered by cell type, which is the order cell_data refers to
+
+    Example:
+        grid = unstructured_grid(points, {vtk.VTK_TETRA: tetras, vtk.VTK_HEXAHEDRON: hexahedra})
+
+    Args:
+        points (numpy.ndarray<float>, str or vtk.vtkPoints): The points of the grid. If it's a numpy array it should
+            be of dimensions (n,2) or (n,3), paths to .npy files are memory-mapped
+        cells (numpy.ndarray<int>, str, dict or list): The cells in one of the forms described above
+        offsets (numpy.ndarray<int> or str): Array of shape (n+1,) that defines where each of the n cells starts in
+            cells
+        types (int or numpy.ndarray<int>): The VTK cell type (e.g. vtk.VTK_TETRA) of all cells or an array of shape
+            (n,) with the type of each cell
+        z_index (float): The value the z-value of 2d-points is filled with (only applicable for (n,2) input arrays)
+        point_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are attached as point data
+        cell_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are attached as cell data
+        dtype (numpy.dtype): The type the points are stored as, numpy.float32 or numpy.float64, by default the
+            precision of the input is preserved
+        validate (bool): Whether the input should be checked, can be disabled for trusted input
+        workers (int): The number of threads the conversion is split across
+
+    Returns:
+        unstructured_grid (vtk.vtkUnstructuredGrid): VTK representation of the grid
+    """
+    points = _load(points)
+    if not (isinstance(points, numpy.ndarray) or isinstance(points, vtk.vtkPoints)):
+        raise Numpy2VtkFormatException(
+            'unstructured_grid needs numpy array or vtk.vtkPoints as input'
+        )
+    if isinstance(points, numpy.ndarray):
+        vtk_points = to_vtk_points(points, z_index=z_index, dtype=dtype, validate=validate, workers=workers)
+    else:
+        vtk_points = points
+
+    if isinstance(cells, (dict, list, tuple)):
+        if offsets is not None or types is not None:
+            raise Numpy2VtkFormatException(
+                'unstructured_grid needs no offsets or types when cells are given as blocks'
+            )
+        blocks = sorted(cells.items()) if isinstance(cells, dict) else list(cells)
+        blocks = [(cell_type, _load(block)) for cell_type, block in blocks]
+    else:
+        cells = _load(cells)
+        offsets = _load(offsets)
+        if types is None:
+            raise Numpy2VtkFormatException(
+                'unstructured_grid needs types when cells are given as an array'
+            )
+        blocks = [(types, cells)] if offsets is None else None
+
+    number_of_points = vtk_points.GetNumberOfPoints()
+    if blocks is None:
+        if validate:
+            _check_cells(cells, offsets, types, number_of_points)
+        cell_types, locations, legacy = _mixed(cells, offsets, types, workers)
+    else:
+        if validate:
+            for block_types, block in blocks:
+                _check_cells(block, None, block_types, number_of_points)
+        cell_types, locations, legacy = _blocks(blocks, workers)
+
+    grid = vtk.vtkUnstructuredGrid()
+    grid.SetPoints(vtk_points)
+    grid.SetCells(
+        numpy_to_vtk(cell_types, deep=0, array_type=vtk.VTK_UNSIGNED_CHAR),
+        numpy_to_vtkIdTypeArray(locations, deep=0),
+        _wrap_cell_array(legacy, len(cell_types))
+    )
+    attach(grid, point_data=point_data, cell_data=cell_data)
+
+    return grid
+
+def _mixed(indices, offsets, types, workers):
+    """
+    Returns the cell types, locations and legacy cells of cells given as flat indices and offsets.
+    """
+    number_of_cells = len(offsets) - 1
+    cell_types = numpy.empty(number_of_cells, dtype=numpy.uint8)
+    cell_types[:] = types
+    locations = numpy.array(offsets[:-1], dtype=ID_TYPE_CODE)
+    locations += numpy.arange(number_of_cells, dtype=ID_TYPE_CODE)
+    return cell_types, locations, _legacy_cells(indices, offsets, workers=workers)
+
+def _blocks(blocks, workers):
+    """
+    Returns the cell types, locations and legacy cells of blocks of cells with the same number of points, all blocks
+    are written into one buffer.
+    """
+    number_of_cells = sum(len(block) for _, block in blocks)
+    cell_types = numpy.empty(number_of_cells, dtype=numpy.uint8)
+    locations = numpy.empty(number_of_cells, dtype=ID_TYPE_CODE)
+    legacy = numpy.empty(sum(block.size + len(block) for _, block in blocks), dtype=ID_TYPE_CODE)
+
+    cell = position = 0
+    for block_types, block in blocks:
+        count, size = block.shape
+        cell_types[cell:cell + count] = block_types
+        locations[cell:cell + count] = numpy.arange(position, position + count * (size + 1), size + 1)
+        _legacy_cells(block, out=legacy[position:position + count * (size + 1)], workers=workers)
+        cell += count
+        position += count * (size + 1)
+    return cell_types, locations, legacy
+
+def _check_cells(indices, offsets, types, number_of_points):
+    if not isinstance(indices, numpy.ndarray):
+        raise Numpy2VtkFormatException(
+            'unstructured_grid cells needs numpy array as input'
+        )
+    if offsets is None and len(indices.shape) != 2:
+        raise Numpy2VtkFormatException(
+            'unstructured_grid cells needs a nxm ndarray as input'
+        )
+    if offsets is not None and len(indices.shape) != 1:
+        raise Numpy2VtkFormatException(
+            'unstructured_grid cells needs a one dimensional ndarray as input when offsets are given'
+        )
+    if indices.dtype.kind not in 'iu':
+        raise Numpy2VtkFormatException(
+            'unstructured_grid cells needs to be numpy array of integer type'
+        )
+    if offsets is not None:
+        check_offsets(indices, offsets, 'unstructured_grid cells')
+    check_bounds(indices, number_of_points, 'unstructured_grid cells')
+
+    number_of_cells = len(indices) if offsets is None else len(offsets) - 1
+    types = numpy.asarray(types)
+    if types.dtype.kind not in 'iu' or types.shape not in ((), (number_of_cells,)) or \
+            (types.size and (types.min() < 0 or types.max() > 255)):
+        raise Numpy2VtkFormatException(
+            'unstructured_grid types needs to be a VTK cell type or an array of one VTK cell type per cell'
+        )
+    sizes = indices.shape[1] if offsets is None else numpy.diff(offsets)
+    expected = CELL_SIZES[types]
+    if numpy.logical_and(expected > 0, expected != sizes).any():
+        raise Numpy2VtkFormatException(
+            'unstructured_grid cells needs the number of points of its cell type for every cell'
+        )
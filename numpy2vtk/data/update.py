@@ -0,0 +1,69 @@
+import numpy
+import vtk
+from vtk.util.numpy_support import vtk_to_numpy
+from .raw import points as to_vtk_points
+from .raw.raw import _load, _windows
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+def update_points(data, coordinates, z_index=0, copy=True):
+    """
+    Replaces the coordinates of the points of polydata built by vertices, line, lines or mesh (or of any other VTK
+    point set) without rebuilding its cells. When copying, note that points created from a contiguous (n,3) array
+    share its buffer (see raw.points), so that array is overwritten as well. Points that wrap a read-only numpy array
+    can not be written, they are replaced by a copy of the coordinates instead.
+
+    Args:
+        data (vtk.vtkPointSet or vtk.vtkPoints): The data whose points are updated
+        coordinates (numpy.ndarray<float> or str): numpy.ndarray of shape (n,2) or (n,3) that contains the new points,
+            n has to match the current number of points
+        z_index (float): The value the z-value of 2d-points is filled with (only applicable for (n,2) input arrays)
+        copy (bool): Whether the coordinates should be copied into the existing point buffer. Otherwise the points
+            are replaced by points that share the buffer of coordinates where possible
+
+    Returns:
+        data (vtk.vtkPointSet or vtk.vtkPoints): The updated data
+    """
+    coordinates = _load(coordinates)
+    vtk_points = data if isinstance(data, vtk.vtkPoints) else data.GetPoints()
+    if vtk_points is None:
+        raise Numpy2VtkFormatException(
+            'update_points needs vtk.vtkPoints or a vtk.vtkPointSet with points as input'
+        )
+    if not isinstance(coordinates, numpy.ndarray) or len(coordinates.shape) != 2 or \
+            coordinates.shape[1] not in (2, 3) or len(coordinates) != vtk_points.GetNumberOfPoints():
+        raise Numpy2VtkFormatException(
+            'update_points needs an array of nx2 or nx3 shape with one row per point'
+        )
+
+    if copy and _writeable(vtk_points.GetData()):
+        buffer = vtk_to_numpy(vtk_points.GetData())
+        if not _same_buffer(buffer, coordinates):
+            if numpy.may_share_memory(buffer, coordinates):
+                coordinates = numpy.array(coordinates)
+            for start, end in _windows(len(coordinates)):
+                buffer[start:end, :coordinates.shape[1]] = coordinates[start:end]
+        if coordinates.shape[1] == 2:
+            buffer[:, 2] = z_index
+        vtk_points.GetData().Modified()
+    elif copy:
+        vtk_points.SetData(to_vtk_points(coordinates, z_index=z_index, copy=True).GetData())
+    else:
+        vtk_points.SetData(to_vtk_points(coordinates, z_index=z_index).GetData())
+
+    vtk_points.Modified()
+    data.Modified()
+    return data
+
+def _writeable(vtk_array):
+    """
+    Returns whether the buffer of a VTK array can be written, which is not the case if it wraps a read-only numpy array.
+    """
+    reference = getattr(vtk_array, '_numpy_reference', None)
+    return reference is None or reference.flags.writeable
+
+def _same_buffer(buffer, coordinates):
+    """
+    Returns whether coordinates is a view of the first columns of buffer, so there is nothing to copy.
+    """
+    return buffer.__array_interface__['data'][0] == coordinates.__array_interface__['data'][0] and \
+        buffer.strides == coordinates.strides and buffer.dtype == coordinates.dtype
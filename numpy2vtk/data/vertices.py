@@ -2,35 +2,52 @@ import numpy
 import vtk
 from .raw import points as to_vtk_points
 from .raw import vertices as to_vtk_vertices
+from .raw.raw import _load
+from .attributes import attach
+from .spatial import voxel_hash
 from numpy2vtk.exceptions import Numpy2VtkFormatException
 
-def vertices(points, z_index=0):
+def vertices(points, z_index=0, verts=True, point_data=None, cell_data=None, dtype=None, validate=True,
+             workers=1, spatial_index=False):
     """
     Returns the VTK-representation of a number of vertices that are defined by the points array.
 
     Args:
-        points (numpy.ndarray<float> or vtk.vtkPoints): The points that the mesh consist of.
-            If it's a numpy array it should be of dimensions (n,2) or (n,3)
+        points (numpy.ndarray<float>, str or vtk.vtkPoints): The points that the mesh consist of.
+            If it's a numpy array it should be of dimensions (n,2) or (n,3), paths to .npy files are memory-mapped
         z_index (float): The value the z-value of 2d-points is filled with (only applicable for (n,2) input arrays)
+        verts (bool): Whether a vertex cell should be created for every point
+        point_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are attached as point data
+        cell_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are attached as cell data
+        dtype (numpy.dtype): The type the points are stored as, numpy.float32 or numpy.float64, by default the
+            precision of the input is preserved
+        validate (bool): Whether the input should be checked, can be disabled for trusted input
+        workers (int): The number of threads the conversion is split across
+        spatial_index (bool): Whether a VoxelHash of the converted points should be built and cached on the result,
+            see voxel_hash
 
     Returns:
         vertices_data (vtk.vtkPolyData): VTK polydata representation of the vertices
     """
+    points = _load(points)
     if not (isinstance(points, numpy.ndarray) or isinstance(points, vtk.vtkPoints)):
         raise Numpy2VtkFormatException(
             'vertices needs numpy array or vtk.vtkPoints as input'
         )
 
     if isinstance(points, numpy.ndarray):
-        vtk_points = to_vtk_points(points, z_index=z_index) if isinstance(points, numpy.ndarray) else points
+        vtk_points = to_vtk_points(points, z_index=z_index, dtype=dtype, validate=validate, workers=workers)
     else:
         vtk_points = points
 
-    number_of_points = vtk_points.GetNumberOfPoints()
-    vertices = to_vtk_vertices(numpy.array(range(number_of_points), dtype=numpy.int))
-
     vertices_data = vtk.vtkPolyData()
     vertices_data.SetPoints(vtk_points)
-    vertices_data.SetVerts(vertices)
+    if verts:
+        number_of_points = vtk_points.GetNumberOfPoints()
+        vtk_vertices = to_vtk_vertices(numpy.arange(number_of_points, dtype=numpy.int), validate=False, workers=workers)
+        vertices_data.SetVerts(vtk_vertices)
+    attach(vertices_data, point_data=point_data, cell_data=cell_data)
+    if spatial_index:
+        voxel_hash(vertices_data)
 
     return vertices_data
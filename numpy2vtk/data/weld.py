@@ -0,0 +1,138 @@
+import numpy
+from vtk.util.numpy_support import ID_TYPE_CODE
+from .raw.raw import _load
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+from numpy2vtk.validation import check_bounds, check_offsets
+
+def weld(points, polys, offsets=None, tolerance=0.0, prune=True, validate=True):
+    """
+    Merges duplicate points of a mesh and removes points that no patch references. Points are duplicates if their
+    coordinates are equal after rounding them to multiples of tolerance, so points closer than tolerance can stay
+    apart if they are rounded to different multiples. Every group of duplicates is replaced by its first point.
+
+    Example:
+        points, polys, kept, ratio = weld(points, polys, tolerance=1e-6)
+        poly_data = mesh(points, polys, point_data={'t': t[kept]})
+
+    Args:
+        points (numpy.ndarray<float> or str): The points of the mesh, should be of dimensions (n,2) or (n,3)
+        polys (numpy.ndarray<int> or str): Array of patches, should be of shape nxm for n patches with m points per
+            patch or of shape (k,) if offsets are given
+        offsets (numpy.ndarray<int> or str): Array of shape (n+1,) that defines where each of the n patches starts in
+            polys
+        tolerance (float): The distance duplicates are rounded to, with 0 only exactly equal points are merged
+        prune (bool): Whether points that no patch references should be removed
+        validate (bool): Whether the input should be checked, can be disabled for trusted input
+
+    Returns:
+        welded (tuple): The welded points, the remapped polys of the same shape, the indices of the kept points in
+            the original points (to select point data with) and the ratio of the number of original to kept points
+    """
+    points = _load(points)
+    polys = _load(polys)
+    if not isinstance(points, numpy.ndarray) or len(points.shape) != 2 or points.shape[1] not in (2, 3):
+        raise Numpy2VtkFormatException(
+            'weld needs points of nx2 or nx3 shape'
+        )
+    if not isinstance(polys, numpy.ndarray) or polys.dtype.kind not in 'iu':
+        raise Numpy2VtkFormatException(
+            'weld polys needs to be numpy array of integer type'
+        )
+    if tolerance < 0:
+        raise Numpy2VtkFormatException(
+            'weld tolerance needs to be positive or 0'
+        )
+    if validate:
+        if offsets is not None:
+            check_offsets(polys, _load(offsets), 'weld polys')
+        check_bounds(polys, len(points), 'weld polys')
+
+    first, inverse = _groups(_quantize(points, tolerance))
+
+    groups = inverse[polys]
+    keep = numpy.zeros(len(points), dtype=bool)
+    if prune:
+        used = numpy.zeros(len(first), dtype=bool)
+        used[groups] = True
+        keep[first[used]] = True
+    else:
+        keep[first] = True
+    # The kept points stay in their original order, which keeps the memory access pattern of the mesh
+    polys = (numpy.cumsum(keep, dtype=ID_TYPE_CODE) - 1)[first[groups]]
+    kept = numpy.flatnonzero(keep)
+
+    ratio = len(points) / float(max(len(kept), 1))
+    return points[kept], polys.astype(ID_TYPE_CODE, copy=False), kept, ratio
+
+def _quantize(points, tolerance):
+    """
+    Returns integer columns that are equal for points that are duplicates.
+    """
+    if tolerance > 0:
+        return numpy.round(points / tolerance).astype(numpy.int64)
+    # Adding 0.0 turns -0.0 into 0.0, whose bits differ otherwise
+    points = numpy.ascontiguousarray(points + 0.0)
+    return points.view(numpy.int64 if points.dtype.itemsize == 8 else numpy.int32).astype(numpy.int64)
+
+def _groups(columns):
+    """
+    Returns the index of the first row of every group of equal rows and the group of every row. The rows are reduced
+    to a single integer key, as sorting one key is much faster than sorting rows. If the columns span too large a
+    range to be packed into a key, the rows are hashed and the rare hash collisions fall back to ranked keys.
+    """
+    lower = columns.min(axis=0) if len(columns) else numpy.zeros(columns.shape[1], dtype=numpy.int64)
+    upper = columns.max(axis=0) if len(columns) else lower
+    # The spans are computed as floats, as they can overflow int64 for the bits of floats
+    spans = upper.astype(numpy.float64) - lower + 1
+    if numpy.prod(spans) < 2 ** 62:
+        return _group_keys(_packed_keys(columns - lower, spans))
+
+    keys = numpy.zeros(len(columns), dtype=numpy.int64)
+    for axis in range(columns.shape[1]):
+        # Multiplying by a large odd number mixes the bits, overflows wrap around
+        keys = (keys ^ columns[:, axis]) * numpy.int64(-7046029254386353131)
+    first, inverse, order, starts = _group_keys(keys, grouping=True)
+    rows = columns[order]
+    if ((rows[1:] != rows[:-1]).any(axis=1) & ~starts[1:]).any():
+        return _group_keys(_ranked_keys(columns - lower))
+    return first, inverse
+
+def _packed_keys(columns, spans):
+    keys = numpy.zeros(len(columns), dtype=numpy.int64)
+    for axis in range(columns.shape[1]):
+        keys = keys * int(spans[axis]) + columns[:, axis]
+    return keys
+
+def _ranked_keys(columns):
+    """
+    Returns keys that are equal for equal rows, replacing columns and partial keys by their rank among the distinct
+    values whenever the key would overflow.
+    """
+    keys = numpy.zeros(len(columns), dtype=numpy.int64)
+    span = 1
+    for axis in range(columns.shape[1]):
+        column = numpy.unique(columns[:, axis], return_inverse=True)[1]
+        column_span = int(column.max()) + 1
+        if span * column_span >= 2 ** 62:
+            keys = numpy.unique(keys, return_inverse=True)[1]
+            span = int(keys.max()) + 1
+        keys = keys * column_span + column
+        span *= column_span
+    return keys
+
+def _group_keys(keys, grouping=False):
+    """
+    Returns the index of the first key of every group of equal keys and the group of every key, with grouping also
+    the sort order of the keys and where groups start in it.
+    """
+    order = numpy.argsort(keys)
+    keys = keys[order]
+    starts = numpy.ones(len(keys), dtype=bool)
+    numpy.not_equal(keys[1:], keys[:-1], out=starts[1:])
+    inverse = numpy.empty(len(keys), dtype=ID_TYPE_CODE)
+    inverse[order] = numpy.cumsum(starts, dtype=ID_TYPE_CODE) - 1
+    # The sort is not stable, so the first key of a group is the smallest index in it
+    first = numpy.minimum.reduceat(order, numpy.flatnonzero(starts)) if len(order) else order
+    if grouping:
+        return first, inverse, order, starts
+    return first, inverse
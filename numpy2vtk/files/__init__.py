@@ -0,0 +1,3 @@
+from writers import mesh, unstructured_grid
+
+__all__ = ['mesh', 'unstructured_grid']
@@ -0,0 +1,490 @@
+import collections
+import struct
+import zlib
+from xml.sax.saxutils import escape
+import numpy
+import vtk
+from numpy2vtk.data.raw.raw import _legacy_cells, _load, _windows
+from numpy2vtk.data.unstructured import _check_cells
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+from numpy2vtk.validation import check_bounds, check_offsets
+
+try:
+    import lz4.block as lz4_block
+except ImportError:
+    lz4_block = None
+
+# The number of bytes that are compressed into one block of an XML file, the same default as VTK's compressors
+BLOCK_SIZE = 1 << 15
+
+# The names of the compressors in XML files, VTK needs them to read compressed files
+COMPRESSORS = {
+    'zlib': 'vtkZLibDataCompressor',
+    'lz4': 'vtkLZ4DataCompressor',
+}
+
+# The names of the numpy types in XML and legacy files
+_XML_TYPES = {
+    'i1': 'Int8', 'u1': 'UInt8', 'i2': 'Int16', 'u2': 'UInt16', 'i4': 'Int32', 'u4': 'UInt32', 'i8': 'Int64',
+    'u8': 'UInt64', 'f4': 'Float32', 'f8': 'Float64',
+}
+_LEGACY_TYPES = {
+    'i1': 'char', 'u1': 'unsigned_char', 'i2': 'short', 'u2': 'unsigned_short', 'i4': 'int', 'u4': 'unsigned_int',
+    'i8': 'vtktypeint64', 'u8': 'vtktypeuint64', 'f4': 'float', 'f8': 'double',
+}
+
+# An array that is written chunk by chunk, chunks is a function that returns an iterable of numpy arrays of dtype
+_Array = collections.namedtuple('_Array', 'name dtype components tuples chunks')
+
+def mesh(path, points, polys=None, offsets=None, z_index=0, verts=True, point_data=None, cell_data=None,
+         compression=None, dtype=None, validate=True):
+    """
+    Writes a mesh of points and polys to a VTK XML polydata file (.vtp) or a legacy VTK file (.vtk), without building
+    the VTK-representation first. The arrays are converted and written in windows, so the memory that is needed stays
+    bounded for huge meshes (and memory-mapped input is never loaded at once). The arguments are the same as the ones
+    of data.mesh.
+
+    XML files are written in appended binary format, optionally compressed with zlib or lz4 (which needs the lz4
+    package), legacy files are written in binary format and can not be compressed.
+
+    Args:
+        path (str): The path of the file, the format is chosen by its extension
+        points (numpy.ndarray<float> or str): The points of the mesh, should be of dimensions (n,2) or (n,3)
+        polys (numpy.ndarray<int> or str): Array of patches, should be of shape nxm for n patches with m points per
+            patch or of shape (k,) if offsets are given, by default only points are written
+        offsets (numpy.ndarray<int> or str): Array of shape (n+1,) that defines where each of the n patches starts in
+            polys
+        z_index (float): The value the z-value of 2d-points is filled with (only applicable for (n,2) input arrays)
+        verts (bool): Whether a vertex cell should be written for every point
+        point_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are written as point data
+        cell_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are written as cell data, one entry
+            per patch (the values of vertex cells are 0)
+        compression (str): 'zlib' or 'lz4' to compress the arrays of XML files, by default they are not compressed
+        dtype (numpy.dtype): The type the points are stored as, numpy.float32 or numpy.float64, by default the
+            precision of the input is preserved
+        validate (bool): Whether the input should be checked, can be disabled for trusted input
+    """
+    extension = _extension(path, ('.vtp', '.vtk'), compression)
+    points = _load(points)
+    polys = _load(polys)
+    offsets = _load(offsets)
+    if validate:
+        _check_points(points)
+        if polys is not None:
+            _check_polys(polys, offsets, len(points))
+
+    number_of_points = len(points)
+    number_of_verts = number_of_points if verts else 0
+    blocks = None if polys is None or offsets is not None else [(vtk.VTK_POLYGON, polys)]
+    number_of_polys = 0 if polys is None else len(polys) if offsets is None else len(offsets) - 1
+
+    vtk_points = _points(points, z_index, dtype)
+    point_arrays = _attributes(point_data, number_of_points, 0, 'point_data')
+    cell_arrays = _attributes(cell_data, number_of_polys, number_of_verts, 'cell_data')
+
+    if extension == '.vtp':
+        sections = [('PointData', point_arrays), ('CellData', cell_arrays), ('Points', [vtk_points])]
+        if verts:
+            sections.append(('Verts', [
+                _Array('connectivity', numpy.dtype('<i8'), 1, number_of_points,
+                       lambda: _counting(number_of_points, 0, 1)),
+                _Array('offsets', numpy.dtype('<i8'), 1, number_of_points, lambda: _counting(number_of_points, 1, 1)),
+            ]))
+        if polys is not None:
+            sections.append(('Polys', _xml_cells(blocks, polys, offsets)[:2]))
+        _write_xml(path, 'PolyData', [
+            ('NumberOfPoints', number_of_points), ('NumberOfVerts', number_of_verts), ('NumberOfLines', 0),
+            ('NumberOfStrips', 0), ('NumberOfPolys', number_of_polys)
+        ], sections, compression)
+    else:
+        _check_legacy_indices(number_of_points)
+        sections = [('POINTS {} {}'.format(number_of_points, _LEGACY_TYPES[_code(vtk_points.dtype)]), vtk_points)]
+        if verts:
+            sections.append(('VERTICES {} {}'.format(number_of_points, 2 * number_of_points), _Array(
+                'verts', numpy.dtype('>i4'), 2, number_of_points, lambda: _legacy_verts(number_of_points)
+            )))
+        if polys is not None:
+            sections.append(('POLYGONS {} {}'.format(number_of_polys, number_of_polys + polys.size),
+                             _legacy(blocks, polys, offsets)))
+        _write_legacy(path, 'POLYDATA', sections, point_arrays, cell_arrays, number_of_points,
+                      number_of_verts + number_of_polys)
+
+def unstructured_grid(path, points, cells, offsets=None, types=None, z_index=0, point_data=None, cell_data=None,
+                      compression=None, dtype=None, validate=True):
+    """
+    Writes an unstructured grid of cells of arbitrary VTK cell types to a VTK XML unstructured grid file (.vtu) or a
+    legacy VTK file (.vtk), without building the VTK-representation first. The arrays are converted and written in
+    windows, so the memory that is needed stays bounded. The cells are passed in the forms data.unstructured_grid
+    takes.
+
+    Args:
+        path (str): The path of the file, the format is chosen by its extension
+        points (numpy.ndarray<float> or str): The points of the grid, should be of dimensions (n,2) or (n,3)
+        cells (numpy.ndarray<int>, str, dict or list): The cells, see data.unstructured_grid
+        offsets (numpy.ndarray<int> or str): Array of shape (n+1,) that defines where each of the n cells starts in
+            cells
+        types (int or numpy.ndarray<int>): The VTK cell type (e.g. vtk.VTK_TETRA) of all cells or an array of shape
+            (n,) with the type of each cell
+        z_index (float): The value the z-value of 2d-points is filled with (only applicable for (n,2) input arrays)
+        point_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are written as point data
+        cell_data (dict<str, numpy.ndarray>): Arrays of shape (n,) or (n,c) that are written as cell data
+        compression (str): 'zlib' or 'lz4' to compress the arrays of XML files, by default they are not compressed
+        dtype (numpy.dtype): The type the points are stored as, numpy.float32 or numpy.float64, by default the
+            precision of the input is preserved
+        validate (bool): Whether the input should be checked, can be disabled for trusted input
+    """
+    extension = _extension(path, ('.vtu', '.vtk'), compression)
+    points = _load(points)
+    if validate:
+        _check_points(points)
+
+    if isinstance(cells, (dict, list, tuple)):
+        if offsets is not None or types is not None:
+            raise Numpy2VtkFormatException(
+                'unstructured_grid needs no offsets or types when cells are given as blocks'
+            )
+        blocks = sorted(cells.items()) if isinstance(cells, dict) else list(cells)
+        blocks = [(cell_type, _load(block)) for cell_type, block in blocks]
+        cells = None
+    else:
+        cells = _load(cells)
+        offsets = _load(offsets)
+        if types is None:
+            raise Numpy2VtkFormatException(
+                'unstructured_grid needs types when cells are given as an array'
+            )
+        blocks = [(types, cells)] if offsets is None else None
+        cells = None if offsets is None else cells
+    if validate:
+        for block_types, block in blocks or [(types, cells)]:
+            _check_cells(block, offsets if blocks is None else None, block_types, len(points))
+
+    number_of_points = len(points)
+    if blocks is None:
+        number_of_cells, number_of_indices = len(offsets) - 1, len(cells)
+    else:
+        number_of_cells = sum(len(block) for _, block in blocks)
+        number_of_indices = sum(block.size for _, block in blocks)
+
+    vtk_points = _points(points, z_index, dtype)
+    point_arrays = _attributes(point_data, number_of_points, 0, 'point_data')
+    cell_arrays = _attributes(cell_data, number_of_cells, 0, 'cell_data')
+
+    if extension == '.vtu':
+        _write_xml(path, 'UnstructuredGrid', [
+            ('NumberOfPoints', number_of_points), ('NumberOfCells', number_of_cells)
+        ], [
+            ('PointData', point_arrays), ('CellData', cell_arrays), ('Points', [vtk_points]),
+            ('Cells', _xml_cells(blocks, cells, offsets, types)),
+        ], compression)
+    else:
+        _check_legacy_indices(number_of_points)
+        _write_legacy(path, 'UNSTRUCTURED_GRID', [
+            ('POINTS {} {}'.format(number_of_points, _LEGACY_TYPES[_code(vtk_points.dtype)]), vtk_points),
+            ('CELLS {} {}'.format(number_of_cells, number_of_cells + number_of_indices),
+             _legacy(blocks, cells, offsets)),
+            ('CELL_TYPES {}'.format(number_of_cells), _Array(
+                'types', numpy.dtype('>i4'), 1, number_of_cells, lambda: _types(blocks, types, number_of_cells)
+            )),
+        ], point_arrays, cell_arrays, number_of_points, number_of_cells)
+
+def _write_xml(path, data_type, piece, sections, compression):
+    """
+    Writes an XML file with all arrays in the appended data section. The header is written with placeholders for the
+    offsets of the arrays first and rewritten with the same length once the arrays are written.
+    """
+    arrays = [array for _, section in sections for array in section]
+    with open(path, 'wb') as f:
+        f.write(_xml_header(data_type, piece, sections, [0] * len(arrays), compression))
+        f.write('  <AppendedData encoding="raw">\n   _')
+        start = f.tell()
+        positions = []
+        for array in arrays:
+            positions.append(f.tell() - start)
+            if compression is None:
+                _write_raw(f, array)
+            else:
+                _write_compressed(f, array, compression)
+        f.write('\n  </AppendedData>\n</VTKFile>\n')
+        f.seek(0)
+        f.write(_xml_header(data_type, piece, sections, positions, compression))
+
+def _xml_header(data_type, piece, sections, positions, compression):
+    compressor = ' compressor="{}"'.format(COMPRESSORS[compression]) if compression else ''
+    lines = [
+        '<?xml version="1.0"?>',
+        '<VTKFile type="{}" version="1.0" byte_order="LittleEndian" header_type="UInt64"{}>'.format(
+            data_type, compressor),
+        '  <{}>'.format(data_type),
+        '    <Piece {}>'.format(' '.join('{}="{}"'.format(key, value) for key, value in piece)),
+    ]
+    positions = iter(positions)
+    for element, arrays in sections:
+        lines.append('      <{}{}>'.format(element, _active_attributes(arrays) if element.endswith('Data') else ''))
+        for array in arrays:
+            # The offsets have a fixed width, so the header keeps its length when they are filled in
+            lines.append(
+                '        <DataArray type="{}" Name="{}" NumberOfComponents="{}" format="appended" '
+                'offset="{:020d}"/>'.format(_XML_TYPES[_code(array.dtype)], _escape(array.name), array.components,
+                                            next(positions)))
+        lines.append('      </{}>'.format(element))
+    lines += ['    </Piece>', '  </{}>'.format(data_type), '']
+    return '\n'.join(lines)
+
+def _active_attributes(arrays):
+    """
+    Returns the attributes that mark the active scalars, normals and vectors, chosen the same way attach does.
+    """
+    active = {}
+    for array in arrays:
+        if array.components == 1:
+            active.setdefault('Scalars', array.name)
+        elif array.components == 3 and array.name == 'normals':
+            active['Normals'] = array.name
+        elif array.components == 3:
+            active.setdefault('Vectors', array.name)
+    return ''.join(' {}="{}"'.format(key, _escape(name)) for key, name in sorted(active.items()))
+
+def _write_raw(f, array):
+    f.write(struct.pack('<Q', array.tuples * array.components * array.dtype.itemsize))
+    for chunk in array.chunks():
+        f.write(chunk.tobytes())
+
+def _write_compressed(f, array, compression):
+    """
+    Writes an array as compressed blocks of BLOCK_SIZE bytes, preceded by the number of blocks, the block size, the
+    size of the last block and the compressed size of every block. The header is reserved and filled in afterwards.
+    """
+    if compression == 'lz4' and lz4_block is None:
+        raise Numpy2VtkFormatException(
+            'lz4 compression needs the lz4 package'
+        )
+    compress = zlib.compress if compression == 'zlib' else lambda data: lz4_block.compress(data, store_size=False)
+
+    size = array.tuples * array.components * array.dtype.itemsize
+    number_of_blocks = -(-size // BLOCK_SIZE)
+    header = f.tell()
+    f.write('\0' * 8 * (3 + number_of_blocks))
+
+    compressed_sizes = []
+    rest = ''
+    for chunk in array.chunks():
+        data = rest + chunk.tobytes()
+        position = 0
+        while len(data) - position >= BLOCK_SIZE:
+            block = compress(data[position:position + BLOCK_SIZE])
+            compressed_sizes.append(len(block))
+            f.write(block)
+            position += BLOCK_SIZE
+        rest = data[position:]
+    if rest:
+        block = compress(rest)
+        compressed_sizes.append(len(block))
+        f.write(block)
+
+    f.seek(header)
+    f.write(struct.pack('<{}Q'.format(3 + number_of_blocks), number_of_blocks, BLOCK_SIZE, size % BLOCK_SIZE,
+                        *compressed_sizes))
+    f.seek(0, 2)
+
+def _write_legacy(path, data_type, sections, point_arrays, cell_arrays, number_of_points, number_of_cells):
+    """
+    Writes a binary legacy file, its arrays are big endian. Point and cell data are written as field data.
+    """
+    with open(path, 'wb') as f:
+        f.write('# vtk DataFile Version 3.0\nnumpy2vtk\nBINARY\nDATASET {}\n'.format(data_type))
+        for line, array in sections:
+            f.write(line + '\n')
+            _write_big_endian(f, array)
+        for kind, arrays, count in (('POINT_DATA', point_arrays, number_of_points),
+                                    ('CELL_DATA', cell_arrays, number_of_cells)):
+            if arrays:
+                f.write('{} {}\nFIELD FieldData {}\n'.format(kind, count, len(arrays)))
+                for array in arrays:
+                    f.write('{} {} {} {}\n'.format(array.name.replace(' ', '%20'), array.components, array.tuples,
+                                                   _LEGACY_TYPES[_code(array.dtype)]))
+                    _write_big_endian(f, array)
+
+def _write_big_endian(f, array):
+    for chunk in array.chunks():
+        f.write(chunk.astype(chunk.dtype.newbyteorder('>'), copy=False).tobytes())
+    f.write('\n')
+
+def _points(points, z_index, dtype):
+    if dtype is None:
+        dtype = points.dtype if points.dtype in (numpy.float32, numpy.float64) else numpy.float64
+
+    def chunks():
+        for start, end in _windows(len(points)):
+            chunk = numpy.empty((end - start, 3), dtype=numpy.dtype(dtype).newbyteorder('<'))
+            chunk[:, :points.shape[1]] = points[start:end]
+            if points.shape[1] == 2:
+                chunk[:, 2] = z_index
+            yield chunk
+    return _Array('Points', numpy.dtype(dtype).newbyteorder('<'), 3, len(points), chunks)
+
+def _attributes(arrays, number_of_tuples, skipped, kind):
+    """
+    Returns the arrays of point or cell data in the order of their names, like attach, with skipped leading zeros.
+    """
+    result = []
+    for name in sorted((arrays or {}).keys()):
+        values = _load(arrays[name])
+        if not isinstance(values, numpy.ndarray) or len(values.shape) not in (1, 2) or \
+                values.dtype.kind not in 'biuf':
+            raise Numpy2VtkFormatException(
+                '{} {} needs to be a numpy array of shape (n,) or (n,c)'.format(kind, name)
+            )
+        if len(values) != number_of_tuples:
+            raise Numpy2VtkFormatException(
+                '{} {} needs {} entries, has {}'.format(kind, name, number_of_tuples, len(values))
+            )
+        # The same types are written as attach stores
+        if values.dtype.kind == 'b':
+            dtype = numpy.dtype(numpy.uint8)
+        elif values.dtype.kind == 'f' and values.dtype not in (numpy.float32, numpy.float64):
+            dtype = numpy.dtype(numpy.float64 if values.dtype.itemsize > 8 else numpy.float32)
+        else:
+            dtype = values.dtype
+        if _code(dtype) not in _XML_TYPES:
+            raise Numpy2VtkFormatException(
+                '{} {} has the unsupported type {}'.format(kind, name, values.dtype)
+            )
+        dtype = dtype.newbyteorder('<')
+        components = 1 if len(values.shape) == 1 else values.shape[1]
+        result.append(_Array(name, dtype, components, skipped + len(values),
+                             lambda values=values, dtype=dtype: _rows(values, dtype, skipped)))
+    return result
+
+def _rows(values, dtype, skipped=0):
+    for start, end in _windows(skipped):
+        yield numpy.zeros((end - start,) + values.shape[1:], dtype=dtype)
+    for start, end in _windows(len(values)):
+        yield numpy.ascontiguousarray(values[start:end], dtype=dtype)
+
+def _counting(count, first, step):
+    for start, end in _windows(count):
+        yield numpy.arange(first + start * step, first + end * step, step, dtype=numpy.int64)
+
+def _xml_cells(blocks, indices, offsets, types=None):
+    """
+    Returns the connectivity, offsets (the end of each cell) and types arrays of the cells of an XML file.
+    """
+    if blocks is None:
+        number_of_cells = len(offsets) - 1
+
+        def connectivity():
+            for start, end in _windows(len(indices)):
+                yield indices[start:end].astype(numpy.int64)
+
+        def ends():
+            for start, end in _windows(number_of_cells):
+                yield offsets[start + 1:end + 1].astype(numpy.int64)
+        number_of_indices = len(indices)
+    else:
+        number_of_cells = sum(len(block) for _, block in blocks)
+
+        def connectivity():
+            for _, block in blocks:
+                for start, end in _windows(len(block)):
+                    yield block[start:end].astype(numpy.int64).ravel()
+
+        def ends():
+            position = 0
+            for _, block in blocks:
+                for chunk in _counting(len(block), position + block.shape[1], block.shape[1]):
+                    yield chunk
+                position += block.size
+        number_of_indices = sum(block.size for _, block in blocks)
+
+    return [
+        _Array('connectivity', numpy.dtype('<i8'), 1, number_of_indices, connectivity),
+        _Array('offsets', numpy.dtype('<i8'), 1, number_of_cells, ends),
+        _Array('types', numpy.dtype('u1'), 1, number_of_cells,
+               lambda: (chunk.astype(numpy.uint8) for chunk in _types(blocks, types, number_of_cells))),
+    ]
+
+def _types(blocks, types, number_of_cells):
+    if blocks is None:
+        blocks = [(types, numpy.empty((number_of_cells, 0)))]
+    for block_types, block in blocks:
+        block_types = numpy.asarray(block_types)
+        for start, end in _windows(len(block)):
+            chunk = numpy.empty(end - start, dtype=numpy.int32)
+            chunk[:] = block_types if block_types.ndim == 0 else block_types[start:end]
+            yield chunk
+
+def _legacy(blocks, indices, offsets):
+    """
+    Returns the cells of a legacy file, laid out as [m, i0, ..., im-1] for each cell.
+    """
+    if blocks is None:
+        number_of_cells = len(offsets) - 1
+
+        def chunks():
+            for start, end in _windows(number_of_cells):
+                first, last = offsets[start], offsets[end]
+                yield _legacy_cells(indices[first:last], offsets[start:end + 1] - first).astype(numpy.int32)
+        size = number_of_cells + len(indices)
+    else:
+        def chunks():
+            for _, block in blocks:
+                for start, end in _windows(len(block)):
+                    yield _legacy_cells(block[start:end]).astype(numpy.int32)
+        size = sum(len(block) + block.size for _, block in blocks)
+    return _Array('cells', numpy.dtype('>i4'), 1, size, chunks)
+
+def _legacy_verts(number_of_points):
+    for chunk in _counting(number_of_points, 0, 1):
+        yield numpy.column_stack((numpy.ones(len(chunk), dtype=numpy.int32), chunk.astype(numpy.int32)))
+
+def _extension(path, extensions, compression):
+    extension = path[path.rfind('.'):].lower() if '.' in path else ''
+    if extension not in extensions:
+        raise Numpy2VtkFormatException(
+            'file path needs one of the extensions {}'.format(', '.join(extensions))
+        )
+    if compression is not None and compression not in COMPRESSORS:
+        raise Numpy2VtkFormatException(
+            "file compression needs to be 'zlib' or 'lz4'"
+        )
+    if compression is not None and extension == '.vtk':
+        raise Numpy2VtkFormatException(
+            'legacy files can not be compressed'
+        )
+    return extension
+
+def _check_points(points):
+    if not isinstance(points, numpy.ndarray) or len(points.shape) != 2 or points.shape[1] not in (2, 3):
+        raise Numpy2VtkFormatException(
+            'file points needs to be a numpy array of nx2 or nx3 shape'
+        )
+
+def _check_polys(polys, offsets, number_of_points):
+    if not isinstance(polys, numpy.ndarray) or polys.dtype.kind not in 'iu':
+        raise Numpy2VtkFormatException(
+            'file polys needs to be numpy array of integer type'
+        )
+    if offsets is None and len(polys.shape) != 2:
+        raise Numpy2VtkFormatException(
+            'file polys needs a nxm ndarray as input'
+        )
+    if offsets is not None:
+        if len(polys.shape) != 1:
+            raise Numpy2VtkFormatException(
+                'file polys needs a one dimensional ndarray as input when offsets are given'
+            )
+        check_offsets(polys, offsets, 'file polys')
+    check_bounds(polys, number_of_points, 'file polys')
+
+def _check_legacy_indices(number_of_points):
+    if number_of_points > numpy.iinfo(numpy.int32).max:
+        raise Numpy2VtkFormatException(
+            'legacy files can not reference more than 2**31 - 1 points, use an XML file instead'
+        )
+
+def _code(dtype):
+    return '{}{}'.format(dtype.kind if dtype.kind != 'b' else 'u', dtype.itemsize)
+
+def _escape(name):
+    return escape(name, {'"': '&quot;'})
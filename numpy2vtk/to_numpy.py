@@ -0,0 +1,126 @@
+import numpy
+import vtk
+from vtk.util.numpy_support import vtk_to_numpy, ID_TYPE_CODE
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+def points(vtk_points):
+    """
+    Returns a numpy view of the coordinates of vtkPoints, the points are not copied
+
+    Args:
+        vtk_points (vtk.vtkPoints): The points that should be converted
+
+    Returns:
+        coordinates (numpy.ndarray<float>): numpy.ndarray of shape (n,3) that contains the points
+    """
+    if not isinstance(vtk_points, vtk.vtkPoints):
+        raise Numpy2VtkFormatException(
+            'points needs vtk.vtkPoints as input'
+        )
+
+    return vtk_to_numpy(vtk_points.GetData()).reshape(-1, 3)
+
+def cells(vtk_cells):
+    """
+    Returns the indices of the cells in a vtkCellArray. If all cells have the same number of points m, an array of
+    shape (n,m) is returned, which is a view of the cell array without copying. Otherwise a flat array of
+    indices and an array of offsets is returned, where the points of cell i are indices[offsets[i]:offsets[i+1]].
+
+    Args:
+        vtk_cells (vtk.vtkCellArray): The cells that should be converted
+
+    Returns:
+        indices (numpy.ndarray<int> or tuple): numpy.ndarray of shape (n,m) or a tuple of numpy.ndarrays of shape
+            (k,) and (n+1,) with the indices and offsets of the cells
+    """
+    if not isinstance(vtk_cells, vtk.vtkCellArray):
+        raise Numpy2VtkFormatException(
+            'cells needs vtk.vtkCellArray as input'
+        )
+
+    return _from_legacy_cells(vtk_to_numpy(vtk_cells.GetData()), vtk_cells.GetNumberOfCells())
+
+def array(vtk_array):
+    """
+    Returns a numpy view of a vtkDataArray, the values are not copied
+
+    Args:
+        vtk_array (vtk.vtkDataArray): The array that should be converted
+
+    Returns:
+        values (numpy.ndarray): numpy.ndarray of shape (n,) or (n,c) for arrays with c components
+    """
+    if not isinstance(vtk_array, vtk.vtkDataArray):
+        raise Numpy2VtkFormatException(
+            'array needs vtk.vtkDataArray as input'
+        )
+
+    return vtk_to_numpy(vtk_array)
+
+def point_data(data_set):
+    """
+    Returns numpy views of all point data arrays of a VTK data set
+
+    Args:
+        data_set (vtk.vtkDataSet): The data set whose point data should be converted
+
+    Returns:
+        arrays (dict<str, numpy.ndarray>): The point data arrays by name
+    """
+    return _attributes(data_set.GetPointData())
+
+def cell_data(data_set):
+    """
+    Returns numpy views of all cell data arrays of a VTK data set
+
+    Args:
+        data_set (vtk.vtkDataSet): The data set whose cell data should be converted
+
+    Returns:
+        arrays (dict<str, numpy.ndarray>): The cell data arrays by name
+    """
+    return _attributes(data_set.GetCellData())
+
+def _attributes(attributes):
+    arrays = {}
+    for i in range(attributes.GetNumberOfArrays()):
+        vtk_array = attributes.GetArray(i)
+        if vtk_array is not None:
+            arrays[vtk_array.GetName()] = vtk_to_numpy(vtk_array)
+    return arrays
+
+def _from_legacy_cells(legacy, number_of_cells):
+    """
+    Splits cells in the [m, i0, ..., im-1] layout into indices and offsets. If all cells have the same size, a view of
+    shape (n,m) is returned instead.
+
+    The cell headers form a chain, each header is followed by the next one right after its cell. The chain is walked
+    by pointer doubling: jump holds the position 2^k cells further for every position, so the first 2^k headers give
+    the next 2^k ones at once and only log2(n) vectorized steps are needed.
+    """
+    if number_of_cells == 0:
+        return numpy.zeros((0, 0), dtype=ID_TYPE_CODE)
+
+    size = legacy[0]
+    if len(legacy) == number_of_cells * (size + 1):
+        uniform = legacy.reshape(number_of_cells, size + 1)
+        if (uniform[:, 0] == size).all():
+            return uniform[:, 1:]
+
+    # The position after the last cell points to itself, so chains that reach the end stay there
+    jump = numpy.empty(len(legacy) + 1, dtype=ID_TYPE_CODE)
+    jump[:-1] = numpy.arange(len(legacy), dtype=ID_TYPE_CODE) + legacy + 1
+    jump[-1] = len(legacy)
+    numpy.minimum(jump, len(legacy), out=jump)
+    headers = numpy.zeros(1, dtype=ID_TYPE_CODE)
+    while len(headers) < number_of_cells:
+        headers = numpy.concatenate((headers, jump[headers]))
+        jump = jump[jump]
+    headers = headers[:number_of_cells]
+
+    is_index = numpy.ones(len(legacy), dtype=bool)
+    is_index[headers] = False
+    offsets = numpy.empty(number_of_cells + 1, dtype=ID_TYPE_CODE)
+    offsets[:-1] = headers - numpy.arange(number_of_cells)
+    offsets[-1] = len(legacy) - number_of_cells
+    return legacy[is_index], offsets
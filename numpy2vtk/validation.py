@@ -0,0 +1,48 @@
+import numpy
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+# Number of entries that are checked at once. Every window is reduced while it is in cache, so each check reads its
+# input only once and needs no temporaries the size of the input.
+WINDOW_SIZE = 1 << 18
+
+def check_bounds(indices, number_of_points, name):
+    """
+    Raises a Numpy2VtkFormatException if indices contains an index that is not in [0, number_of_points).
+
+    Args:
+        indices (numpy.ndarray<int>): The indices that should be checked, of any shape
+        number_of_points (int): The number of points the indices refer to
+        name (str): The name of the indices in the error message
+    """
+    rows = max(1, WINDOW_SIZE // max(1, int(numpy.prod(indices.shape[1:]))))
+    for start in range(0, len(indices), rows):
+        window = indices[start:start + rows]
+        if window.size and (window.min() < 0 or window.max() > number_of_points - 1):
+            raise Numpy2VtkFormatException(
+                '{} references a point index that does not exist'.format(name)
+            )
+
+def check_offsets(indices, offsets, name):
+    """
+    Raises a Numpy2VtkFormatException if offsets do not partition the flat array indices into cells, i.e. if they do
+    not increase from 0 to the length of indices.
+
+    Args:
+        indices (numpy.ndarray): The flat array that is partitioned
+        offsets (numpy.ndarray<int>): The offsets that should be checked
+        name (str): The name of the partitioned array in the error message
+    """
+    if not isinstance(offsets, numpy.ndarray) or len(offsets.shape) != 1 or offsets.dtype.kind not in 'iu':
+        raise Numpy2VtkFormatException(
+            '{} offsets need to be a one dimensional numpy array of integer type'.format(name)
+        )
+    if len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(indices):
+        raise Numpy2VtkFormatException(
+            '{} offsets need to be increasing from 0 to the number of indices'.format(name)
+        )
+    for start in range(0, len(offsets) - 1, WINDOW_SIZE):
+        window = offsets[start:start + WINDOW_SIZE + 1]
+        if (window[1:] < window[:-1]).any():
+            raise Numpy2VtkFormatException(
+                '{} offsets need to be increasing from 0 to the number of indices'.format(name)
+            )
@@ -0,0 +1,18 @@
+from V2NUnitTest import V2NUnitTest
+
+class WindowedTestCase(V2NUnitTest):
+    """
+    Runs the tests with tiny windows, so code that works in windows is split into many of them. The WINDOW_SIZE of
+    every module in window_modules is set to window_size during each test.
+    """
+    window_modules = ()
+    window_size = 2
+
+    def setUp(self):
+        self.window_sizes = [(module, module.WINDOW_SIZE) for module in self.window_modules]
+        for module in self.window_modules:
+            module.WINDOW_SIZE = self.window_size
+
+    def tearDown(self):
+        for module, window_size in self.window_sizes:
+            module.WINDOW_SIZE = window_size
@@ -1 +1,2 @@
 from V2NUnitTest import V2NUnitTest
+from WindowedTestCase import WindowedTestCase
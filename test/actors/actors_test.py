@@ -0,0 +1,136 @@
+import numpy
+import vtk
+
+from test import V2NUnitTest
+from numpy2vtk import actors
+from numpy2vtk.data import mesh
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+POINTS = numpy.array([
+    [0.0, 0.0],
+    [0.0, 1.0],
+    [1.0, 1.0],
+    [1.0, 0.0],
+])
+POLYS = numpy.array([
+    [0, 1, 2],
+    [0, 2, 3],
+])
+
+class TestActors(V2NUnitTest):
+
+    def test_actor(self):
+        poly_data = mesh(POINTS, POLYS)
+        actor = actors.actor(poly_data, color=(1.0, 0.0, 0.0), opacity=0.5, static=True)
+
+        mapper = actor.GetMapper()
+        self.assertIsInstance(mapper, vtk.vtkPolyDataMapper)
+        self.assertIs(mapper.GetInput(), poly_data)
+        self.assertTrue(mapper.GetStatic())
+        self.assertFalse(mapper.GetScalarVisibility())
+        self.assertEqual(actor.GetProperty().GetColor(), (1.0, 0.0, 0.0))
+        self.assertEqual(actor.GetProperty().GetOpacity(), 0.5)
+
+    def test_mesh_colored_by_point_data(self):
+        actor = actors.mesh(POINTS, POLYS, point_data={'height': numpy.array([-1.0, 0.0, 2.0, 1.0])},
+                            scalars='height')
+
+        mapper = actor.GetMapper()
+        self.assertEqual(mapper.GetInput().GetNumberOfVerts(), 0)
+        self.assertTrue(mapper.GetScalarVisibility())
+        self.assertEqual(mapper.GetScalarModeAsString(), 'UsePointFieldData')
+        self.assertEqual(mapper.GetArrayName(), 'height')
+        self.assertEqual(mapper.GetScalarRange(), (-1.0, 2.0))
+
+    def test_mesh_colored_by_cell_data_with_lookup_table(self):
+        lookup_table = vtk.vtkLookupTable()
+        actor = actors.mesh(POINTS, POLYS, cell_data={'quality': numpy.array([0.2, 0.4])}, scalars='quality',
+                            scalar_range=(0.0, 1.0), lookup_table=lookup_table)
+
+        mapper = actor.GetMapper()
+        self.assertEqual(mapper.GetScalarModeAsString(), 'UseCellFieldData')
+        self.assertIs(mapper.GetLookupTable(), lookup_table)
+        self.assertEqual(mapper.GetScalarRange(), (0.0, 1.0))
+
+    def test_vertices_with_direct_colors(self):
+        colors = numpy.array([[255, 0, 0], [0, 255, 0], [0, 0, 255], [0, 0, 0]], dtype=numpy.uint8)
+        actor = actors.vertices(POINTS, point_data={'colors': colors}, scalars='colors', direct_colors=True)
+
+        self.assertEqual(actor.GetMapper().GetColorMode(), vtk.VTK_COLOR_MODE_DIRECT_SCALARS)
+
+    def test_line(self):
+        actor = actors.line(POINTS, closed=True)
+
+        self.assertCellArray(actor.GetMapper().GetInput().GetLines(), [
+            (0, 1, 2, 3, 0),
+        ])
+
+    def test_actor_reuses_mapper(self):
+        actor = actors.mesh(POINTS, POLYS)
+        mapper = actor.GetMapper()
+        reused = actors.mesh(POINTS + 1.0, POLYS, reuse=actor)
+
+        self.assertIs(reused, actor)
+        self.assertIs(reused.GetMapper(), mapper)
+        self.assertEqual(mapper.GetInput().GetPoint(0), (1.0, 1.0, 0.0))
+
+    def test_actor_with_unknown_scalars(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'actor scalars height needs to be a point or cell data array'):
+            actors.mesh(POINTS, POLYS, scalars='height')
+
+    def test_actor_with_wrong_reuse(self):
+        with self.assertRaisesRegexp(Numpy2VtkFormatException, 'actor reuse needs to be a vtk.vtkActor'):
+            actors.mesh(POINTS, POLYS, reuse=vtk.vtkPolyDataMapper())
+
+
+class TestPointCloud(V2NUnitTest):
+
+    def test_point_cloud_with_gaussian_splats(self):
+        actor = actors.point_cloud(POINTS, radius=0.1, point_data={'size': numpy.arange(4.0)}, scale_array='size',
+                                   scalars='size')
+
+        mapper = actor.GetMapper()
+        self.assertIsInstance(mapper, vtk.vtkPointGaussianMapper)
+        self.assertEqual(mapper.GetInput().GetNumberOfVerts(), 0)
+        self.assertEqual(mapper.GetScaleFactor(), 0.1)
+        self.assertEqual(mapper.GetScaleArray(), 'size')
+        self.assertEqual(mapper.GetScalarRange(), (0.0, 3.0))
+
+    def test_point_cloud_with_glyphs(self):
+        actor = actors.point_cloud(POINTS, radius=0.5, glyph=vtk.vtkSphereSource())
+
+        mapper = actor.GetMapper()
+        self.assertIsInstance(mapper, vtk.vtkGlyph3DMapper)
+        self.assertEqual(mapper.GetScaleFactor(), 0.5)
+        self.assertFalse(mapper.GetScaling())
+
+    def test_point_cloud_default_radius(self):
+        splats = actors.point_cloud(POINTS).GetMapper()
+        glyphs = actors.point_cloud(POINTS, glyph=vtk.vtkSphereSource()).GetMapper()
+
+        self.assertEqual(splats.GetScaleFactor(), 0.0)
+        self.assertEqual(glyphs.GetScaleFactor(), 1.0)
+
+    def test_point_cloud_replaces_mapper_of_other_type(self):
+        actor = actors.point_cloud(POINTS)
+        reused = actors.point_cloud(POINTS, glyph=vtk.vtkSphereSource(), reuse=actor)
+
+        self.assertIs(reused, actor)
+        self.assertIsInstance(reused.GetMapper(), vtk.vtkGlyph3DMapper)
+
+
+class TestPointCloudLod(V2NUnitTest):
+
+    def test_point_cloud_lod(self):
+        points = numpy.random.rand(1000, 3)
+        lod = actors.point_cloud_lod(points, number_of_levels=3, point_data={'x': points[:, 0]}, scalars='x')
+
+        self.assertIsInstance(lod, vtk.vtkLODProp3D)
+        self.assertEqual(lod.GetNumberOfLODs(), 3)
+        # vtkLODProp3D numbers its levels from 1000 in the order they were added
+        ids = [1000 + i for i in range(3)]
+        mappers = [lod.GetLODMapper(i) for i in ids]
+        self.assertEqual(mappers[0].GetInput().GetNumberOfPoints(), 1000)
+        self.assertTrue(mappers[2].GetInput().GetNumberOfPoints() < 100)
+        self.assertEqual(mappers[2].GetScalarRange(), mappers[0].GetScalarRange())
@@ -0,0 +1,92 @@
+import multiprocessing
+import numpy
+
+from test import V2NUnitTest, WindowedTestCase
+import numpy2vtk.data.batch as batch
+import numpy2vtk.data.raw as raw
+import numpy2vtk.to_numpy as to_numpy
+from numpy2vtk.data import meshes
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+def parts(count):
+    for i in range(count):
+        points = numpy.array([
+            [0.0, 0.0],
+            [0.0, 1.0],
+            [1.0, float(i)],
+        ])
+        yield points, numpy.array([[0, 1, 2]], dtype=numpy.int), {'point_data': {'part': numpy.full(3, i)}}
+
+
+class TestMeshes(V2NUnitTest):
+
+    def setUp(self):
+        self.pool = multiprocessing.Pool(2)
+
+    def tearDown(self):
+        self.pool.terminate()
+        self.pool.join()
+
+    def test_meshes_in_order(self):
+        converted = list(meshes(parts(7), in_flight=3, pool=self.pool))
+
+        self.assertEqual(len(converted), 7)
+        for i, poly_data in enumerate(converted):
+            self.assertPoints(poly_data.GetPoints(), [
+                (0.0, 0.0, 0.0),
+                (0.0, 1.0, 0.0),
+                (1.0, float(i), 0.0),
+            ])
+            self.assertCellArray(poly_data.GetPolys(), [
+                (0, 1, 2),
+            ])
+            numpy.testing.assert_array_equal(to_numpy.point_data(poly_data)['part'], [i, i, i])
+
+    def test_meshes_without_keyword_arguments(self):
+        converted = list(meshes([(numpy.zeros((3, 3)), numpy.array([[0, 1, 2]]))], pool=self.pool))
+
+        self.assertEqual(converted[0].GetNumberOfVerts(), 3)
+        self.assertEqual(converted[0].GetNumberOfPolys(), 1)
+
+    def test_meshes_with_own_pool(self):
+        converted = list(meshes(parts(2), processes=2))
+
+        self.assertEqual([poly_data.GetNumberOfPoints() for poly_data in converted], [3, 3])
+
+    def test_meshes_with_invalid_mesh(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'mesh polys references a point index that does not exist'):
+            list(meshes([(numpy.zeros((3, 3)), numpy.array([[0, 1, 3]]))], pool=self.pool))
+
+    def test_meshes_with_invalid_item(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException,
+                'meshes needs items of points, polys and optionally a dict of keyword arguments'):
+            list(meshes([(numpy.zeros((3, 3)),)], pool=self.pool))
+
+
+class TestMeshesAfterThreadPools(WindowedTestCase):
+    window_modules = (raw.raw,)
+    window_size = 2
+
+    def test_meshes_with_workers_after_the_parent_started_a_pool(self):
+        numpy_points = numpy.zeros((6, 3))
+        raw.points(numpy_points[:, :2], workers=2)
+        converted = list(meshes([(numpy_points, numpy.array([[0, 1, 2], [3, 4, 5]]), {'workers': 2})], processes=1))
+
+        self.assertEqual(converted[0].GetNumberOfPolys(), 2)
+
+    def test_meshes_workers_start_without_the_thread_pools_of_the_parent(self):
+        initializers = []
+        start_pool = batch.multiprocessing.Pool
+
+        def record_pool(processes, initializer=None):
+            initializers.append(initializer)
+            return start_pool(processes, initializer=initializer)
+        batch.multiprocessing.Pool = record_pool
+        try:
+            list(meshes(parts(1), processes=1))
+        finally:
+            batch.multiprocessing.Pool = start_pool
+
+        self.assertEqual(initializers, [raw.raw._reset_pools])
@@ -0,0 +1,128 @@
+import numpy
+import vtk
+
+from test import V2NUnitTest
+from numpy2vtk.data import PolyDataBuilder
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+class TestPolyDataBuilder(V2NUnitTest):
+
+    def test_builder_with_chunks(self):
+        builder = PolyDataBuilder()
+        builder.append(numpy.array([
+            [0.0, 0.0],
+            [0.0, 1.0],
+            [1.0, 1.0],
+        ]), numpy.array([
+            [0, 1, 2],
+        ], dtype=numpy.int))
+        builder.append(numpy.array([
+            [2.0, 0.0, 1.0],
+            [2.0, 1.0, 1.0],
+            [3.0, 1.0, 1.0],
+        ]), numpy.array([
+            [0, 1, 2],
+            [2, 1, 0],
+        ], dtype=numpy.int))
+        poly_data = builder.build()
+
+        self.assertPoints(poly_data.GetPoints(), [
+            (0.0, 0.0, 0.0),
+            (0.0, 1.0, 0.0),
+            (1.0, 1.0, 0.0),
+            (2.0, 0.0, 1.0),
+            (2.0, 1.0, 1.0),
+            (3.0, 1.0, 1.0),
+        ])
+        self.assertCellArray(poly_data.GetVerts(), [
+            (0,),
+            (1,),
+            (2,),
+            (3,),
+            (4,),
+            (5,),
+        ])
+        self.assertCellArray(poly_data.GetPolys(), [
+            (0, 1, 2),
+            (3, 4, 5),
+            (5, 4, 3),
+        ])
+
+    def test_builder_with_uint8_polys(self):
+        builder = PolyDataBuilder(verts=False)
+        for _ in range(100):
+            builder.append(numpy.zeros((3, 3)), numpy.array([
+                [0, 1, 2],
+            ], dtype=numpy.uint8))
+        poly_data = builder.build()
+
+        self.assertEqual(poly_data.GetNumberOfPolys(), 100)
+        self.assertCellArray(poly_data.GetPolys(), [(3 * i, 3 * i + 1, 3 * i + 2) for i in range(100)])
+
+    def test_builder_grows_its_buffers(self):
+        builder = PolyDataBuilder(z_index=1.0, verts=False, capacity=1)
+        for i in range(10):
+            builder.append(
+                numpy.array([[i, 0.0], [i, 1.0]]),
+                numpy.array([0, 1, 1, 0, 1], dtype=numpy.int),
+                offsets=numpy.array([0, 2, 5], dtype=numpy.int)
+            )
+        poly_data = builder.build()
+
+        self.assertEqual(builder.number_of_points, 20)
+        self.assertEqual(builder.number_of_cells, 20)
+        self.assertEqual(poly_data.GetNumberOfVerts(), 0)
+        self.assertPoints(poly_data.GetPoints(), [
+            p for i in range(10) for p in [(float(i), 0.0, 1.0), (float(i), 1.0, 1.0)]
+        ])
+        self.assertCellArray(poly_data.GetPolys(), [
+            c for i in range(0, 20, 2) for c in [(i, i + 1), (i + 1, i, i + 1)]
+        ])
+
+    def test_builder_without_polys(self):
+        builder = PolyDataBuilder(dtype=numpy.float32)
+        builder.append(numpy.array([[1.0, 2.0, 3.0]]))
+        builder.append(numpy.array([[4.0, 5.0, 6.0]]))
+        poly_data = builder.build()
+
+        self.assertPoints(poly_data.GetPoints(), [
+            (1.0, 2.0, 3.0),
+            (4.0, 5.0, 6.0),
+        ])
+        self.assertEqual(poly_data.GetNumberOfPolys(), 0)
+
+    def test_builder_preserves_float32_points(self):
+        builder = PolyDataBuilder()
+        builder.append(numpy.array([[1.0, 2.0, 3.0]], dtype=numpy.float32))
+        self.assertEqual(builder.build().GetPoints().GetDataType(), vtk.VTK_FLOAT)
+
+        builder.append(numpy.array([[4.0, 5.0, 6.0]]))
+        poly_data = builder.build()
+        self.assertEqual(poly_data.GetPoints().GetDataType(), vtk.VTK_DOUBLE)
+        self.assertPoints(poly_data.GetPoints(), [
+            (1.0, 2.0, 3.0),
+            (4.0, 5.0, 6.0),
+        ])
+
+    def test_build_is_not_changed_by_later_chunks(self):
+        builder = PolyDataBuilder()
+        builder.append(numpy.array([[1.0, 2.0, 3.0]]))
+        poly_data = builder.build()
+        builder.append(numpy.array([[4.0, 5.0, 6.0]]))
+
+        self.assertPoints(poly_data.GetPoints(), [
+            (1.0, 2.0, 3.0),
+        ])
+
+    def test_builder_with_wrong_points(self):
+        builder = PolyDataBuilder()
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'builder points needs to be a numpy array of nx2 or nx3 shape'):
+            builder.append(numpy.array([1.0, 2.0, 3.0]))
+
+    def test_builder_with_point_index_that_does_not_exist(self):
+        builder = PolyDataBuilder()
+        builder.append(numpy.array([[1.0, 2.0], [3.0, 4.0]]))
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'builder polys references a point index that does not exist'):
+            builder.append(numpy.array([[1.0, 2.0], [3.0, 4.0]]), numpy.array([[0, 1, 2]], dtype=numpy.int))
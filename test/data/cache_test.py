@@ -0,0 +1,110 @@
+import numpy
+
+from test import V2NUnitTest, WindowedTestCase
+import numpy2vtk.data.raw as raw
+from numpy2vtk.data import ConversionCache, mesh
+from numpy2vtk.data.raw import polygons
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+class TestConversionCache(V2NUnitTest):
+
+    def setUp(self):
+        self.points = numpy.array([
+            [0.0, 0.0],
+            [0.0, 1.0],
+            [1.0, 1.0],
+            [1.0, 0.0],
+        ])
+        self.polys = numpy.array([
+            [0, 1, 2],
+            [0, 2, 3],
+        ], dtype=numpy.int)
+
+    def test_mesh_reuses_cached_cells(self):
+        cache = ConversionCache()
+        first = mesh(self.points, self.polys, cache=cache)
+        second = mesh(self.points + 1.0, self.polys, cache=cache)
+
+        self.assertEqual(first.GetPolys(), second.GetPolys())
+        self.assertEqual(first.GetVerts(), second.GetVerts())
+        self.assertPoints(second.GetPoints(), [
+            (1.0, 1.0, 0.0),
+            (1.0, 2.0, 0.0),
+            (2.0, 2.0, 0.0),
+            (2.0, 1.0, 0.0),
+        ])
+        self.assertCellArray(second.GetPolys(), [
+            (0, 1, 2),
+            (0, 2, 3)
+        ])
+
+    def test_mesh_updates_cached_points_in_place(self):
+        cache = ConversionCache()
+        first = mesh(self.points, self.polys, cache=cache)
+        modified = first.GetPoints().GetMTime()
+        self.points[0] = [5.0, 5.0]
+        second = mesh(self.points, self.polys, cache=cache)
+
+        self.assertEqual(first.GetPoints(), second.GetPoints())
+        self.assertGreater(second.GetPoints().GetMTime(), modified)
+        self.assertEqual(second.GetPoints().GetPoint(0), (5.0, 5.0, 0.0))
+
+    def test_cache_without_content_hash_misses_in_place_changes(self):
+        cache = ConversionCache()
+        first = cache.get('polygons', (self.polys,), lambda: polygons(self.polys))
+        self.polys[0, 0] = 3
+        second = cache.get('polygons', (self.polys,), lambda: polygons(self.polys))
+
+        self.assertEqual(first, second)
+
+    def test_cache_with_content_hash(self):
+        cache = ConversionCache(hash_content=True)
+        first = cache.get('polygons', (self.polys,), lambda: polygons(self.polys))
+        self.polys[0, 0] = 3
+        second = cache.get('polygons', (self.polys,), lambda: polygons(self.polys))
+
+        self.assertNotEqual(first, second)
+        self.assertCellArray(second, [
+            (3, 1, 2),
+            (0, 2, 3)
+        ])
+
+    def test_cache_evicts_least_recently_used_entries(self):
+        cache = ConversionCache()
+        first_polys = numpy.zeros((10000, 3), dtype=numpy.int)
+        second_polys = numpy.zeros((10000, 3), dtype=numpy.int)
+        first = cache.get('polygons', (first_polys,), lambda: polygons(first_polys))
+        cache.max_bytes = cache.size + 1
+        cache.get('polygons', (second_polys,), lambda: polygons(second_polys))
+
+        self.assertEqual(len(cache), 1)
+        self.assertLessEqual(cache.size, cache.max_bytes)
+        self.assertNotEqual(cache.get('polygons', (first_polys,), lambda: polygons(first_polys)), first)
+
+    def test_cached_mesh_still_validates_new_polys(self):
+        cache = ConversionCache()
+        mesh(self.points, self.polys, cache=cache)
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'mesh polys references a point index that does not exist'):
+            mesh(self.points, numpy.array([[0, 1, 4]], dtype=numpy.int), cache=cache)
+
+    def test_clear(self):
+        cache = ConversionCache()
+        mesh(self.points, self.polys, cache=cache)
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size, 0)
+
+
+class TestConversionCacheWorkers(WindowedTestCase):
+    window_modules = (raw.raw,)
+    window_size = 2
+
+    def test_points_are_converted_with_workers(self):
+        raw.raw._close_pools()
+        vtk_points = ConversionCache().points(numpy.zeros((6, 2)), z_index=1.0, workers=3)
+
+        self.assertEqual(vtk_points.GetPoint(5), (0.0, 0.0, 1.0))
+
+        self.assertEqual(list(raw.raw._pools.keys()), [3])
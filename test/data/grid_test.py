@@ -0,0 +1,149 @@
+import numpy
+
+from test import V2NUnitTest
+import numpy2vtk.to_numpy as to_numpy
+from numpy2vtk.data import image_data, rectilinear_grid, structured_grid
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+class TestImageData(V2NUnitTest):
+
+    def test_image_data_with_fortran_ordered_field(self):
+        field = numpy.asfortranarray(numpy.arange(24, dtype=numpy.float64).reshape(2, 3, 4))
+        image = image_data(point_data={'density': field}, origin=(1.0, 2.0, 3.0), spacing=(0.5, 0.5, 2.0))
+
+        self.assertEqual(image.GetDimensions(), (2, 3, 4))
+        self.assertEqual(image.GetOrigin(), (1.0, 2.0, 3.0))
+        self.assertEqual(image.GetPoint(image.ComputePointId([1, 2, 3])), (1.5, 3.0, 9.0))
+        scalars = image.GetPointData().GetScalars()
+        self.assertEqual(scalars.GetName(), 'density')
+        self.assertEqual(scalars.GetValue(image.ComputePointId([1, 2, 3])), field[1, 2, 3])
+
+        field[1, 2, 3] = -1.0
+        self.assertEqual(scalars.GetValue(image.ComputePointId([1, 2, 3])), -1.0)
+
+    def test_image_data_with_c_ordered_field(self):
+        field = numpy.arange(24, dtype=numpy.float32).reshape(4, 3, 2)
+        image = image_data(point_data={'density': field}, order='C')
+
+        self.assertEqual(image.GetDimensions(), (2, 3, 4))
+        scalars = image.GetPointData().GetScalars()
+        self.assertEqual(scalars.GetValue(image.ComputePointId([1, 2, 3])), field[3, 2, 1])
+
+        field[3, 2, 1] = -1.0
+        self.assertEqual(scalars.GetValue(image.ComputePointId([1, 2, 3])), -1.0)
+
+    def test_image_data_with_vector_field(self):
+        field = numpy.random.rand(4, 3, 2, 3)
+        image = image_data(point_data={'velocity': numpy.transpose(field, (2, 1, 0, 3))})
+
+        vectors = image.GetPointData().GetVectors()
+        self.assertEqual(vectors.GetNumberOfComponents(), 3)
+        self.assertEqual(vectors.GetTuple3(image.ComputePointId([1, 2, 3])), tuple(field[3, 2, 1]))
+        field[3, 2, 1, 0] = -1.0
+        self.assertEqual(vectors.GetTuple3(image.ComputePointId([1, 2, 3]))[0], -1.0)
+
+    def test_image_data_with_cell_data(self):
+        field = numpy.arange(6, dtype=numpy.float64).reshape(1, 2, 3)
+        image = image_data(cell_data={'pressure': field})
+
+        self.assertEqual(image.GetDimensions(), (2, 3, 4))
+        self.assertEqual(image.GetNumberOfCells(), 6)
+        numpy.testing.assert_array_equal(to_numpy.cell_data(image)['pressure'], field.ravel(order='F'))
+
+    def test_two_dimensional_image_data(self):
+        field = numpy.arange(6, dtype=numpy.float64).reshape(3, 2)
+        image = image_data(point_data={'height': field}, dimensions=(2, 3), order='C')
+
+        self.assertEqual(image.GetDimensions(), (2, 3, 1))
+        numpy.testing.assert_array_equal(to_numpy.point_data(image)['height'], field.ravel())
+
+    def test_two_dimensional_image_data_with_vector_field_named_first(self):
+        image = image_data(point_data={
+            'a_velocity': numpy.zeros((2, 3, 3)),
+            'height': numpy.zeros((2, 3)),
+        })
+
+        self.assertEqual(image.GetDimensions(), (2, 3, 1))
+        self.assertEqual(image.GetPointData().GetVectors().GetName(), 'a_velocity')
+
+    def test_image_data_with_fields_of_different_shapes(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException,
+                'image_data fields imply different dimensions, pass dimensions to choose them'):
+            image_data(point_data={'density': numpy.zeros((2, 3, 4))}, cell_data={'pressure': numpy.zeros((1, 2, 2))})
+
+    def test_image_data_with_fields_of_different_grid_dimensions(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException,
+                'image_data fields need the same number of grid dimensions, pass dimensions to choose them'):
+            image_data(point_data={'height': numpy.zeros((2, 3)), 'velocity': numpy.zeros((2, 3, 4, 3))})
+
+    def test_image_data_with_field_of_wrong_shape(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException,
+                r'point_data density needs an array of shape \(2, 3, 4\) with an optional component axis'):
+            image_data(point_data={'density': numpy.zeros((2, 3, 5))}, dimensions=(2, 3, 4))
+
+    def test_image_data_without_input(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'image_data needs dimensions, point_data or cell_data as input'):
+            image_data()
+
+    def test_image_data_with_wrong_order(self):
+        with self.assertRaisesRegexp(Numpy2VtkFormatException, "image_data order needs to be 'F' or 'C'"):
+            image_data(dimensions=(2, 2, 2), order='A')
+
+
+class TestRectilinearGrid(V2NUnitTest):
+
+    def test_rectilinear_grid(self):
+        field = numpy.arange(12, dtype=numpy.float64).reshape(2, 3, 2)
+        grid = rectilinear_grid(
+            numpy.array([0.0, 1.0]), numpy.array([0.0, 2.0, 5.0]), numpy.array([-1.0, 1.0]),
+            point_data={'density': field}, order='C'
+        )
+
+        self.assertEqual(grid.GetDimensions(), (2, 3, 2))
+        self.assertEqual(grid.GetPoint(grid.ComputePointId([1, 2, 0])), (1.0, 5.0, -1.0))
+        numpy.testing.assert_array_equal(to_numpy.point_data(grid)['density'], field.ravel())
+
+    def test_two_dimensional_rectilinear_grid(self):
+        grid = rectilinear_grid(numpy.array([0, 1, 2]), numpy.array([0.0, 2.0]), z_index=3.0)
+
+        self.assertEqual(grid.GetDimensions(), (3, 2, 1))
+        self.assertEqual(grid.GetPoint(grid.ComputePointId([2, 1, 0])), (2.0, 2.0, 3.0))
+
+    def test_rectilinear_grid_with_wrong_coordinates(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'rectilinear_grid needs one dimensional numpy arrays as coordinates'):
+            rectilinear_grid(numpy.zeros((2, 2)), numpy.zeros(2))
+
+
+class TestStructuredGrid(V2NUnitTest):
+
+    def test_structured_grid(self):
+        points = numpy.random.rand(4, 3, 2, 3)
+        grid = structured_grid(points, cell_data={'quality': numpy.arange(6).reshape(3, 2, 1)}, order='C')
+
+        self.assertEqual(grid.GetDimensions(), (2, 3, 4))
+        self.assertEqual(grid.GetPoint(1 + 2 * (2 + 3 * 3)), tuple(points[3, 2, 1]))
+        self.assertEqual(grid.GetNumberOfCells(), 6)
+
+        points[3, 2, 1, 0] = -1.0
+        self.assertEqual(grid.GetPoint(1 + 2 * (2 + 3 * 3))[0], -1.0)
+
+    def test_two_dimensional_structured_grid(self):
+        points = numpy.array([
+            [[0.0, 0.0], [0.0, 1.0]],
+            [[1.0, 0.0], [1.0, 1.5]],
+        ])
+        grid = structured_grid(points, z_index=2.0)
+
+        self.assertEqual(grid.GetDimensions(), (2, 2, 1))
+        self.assertEqual(grid.GetPoint(1 + 2 * 1), (1.0, 1.5, 2.0))
+
+    def test_structured_grid_with_wrong_points(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException,
+                r'structured_grid needs an array of shape \(nx,ny,2\|3\) or \(nx,ny,nz,3\) as input'):
+            structured_grid(numpy.zeros((2, 2, 2, 4)))
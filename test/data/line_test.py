@@ -100,6 +100,44 @@ class TestLineData(V2NUnitTest):
             (2, 0)
         ])
 
+    def test_line_without_verts(self):
+        numpy_points = numpy.array([
+            [1.0, 2.0],
+            [3.0, 4.0],
+            [5.0, 6.0]
+        ])
+        vtk_line = line(numpy_points, verts=False)
+
+        self.assertEqual(vtk_line.GetNumberOfVerts(), 0)
+        self.assertCellArray(vtk_line.GetLines(), [
+            (0, 1),
+            (1, 2)
+        ])
+
+    def test_line_as_poly_line(self):
+        numpy_points = numpy.array([
+            [1.0, 2.0],
+            [4.0, 5.0],
+            [7.0, 8.0]
+        ])
+        vtk_line = line(numpy_points, poly_line=True)
+
+        self.assertCellArray(vtk_line.GetLines(), [
+            (0, 1, 2)
+        ])
+
+    def test_closed_line_as_poly_line(self):
+        numpy_points = numpy.array([
+            [1.0, 2.0],
+            [4.0, 5.0],
+            [7.0, 8.0]
+        ])
+        vtk_line = line(numpy_points, closed=True, poly_line=True)
+
+        self.assertCellArray(vtk_line.GetLines(), [
+            (0, 1, 2, 0)
+        ])
+
     def test_line_with_vtk_points_input_data(self):
         vtk_points = points(numpy.array([
             [1.0, 2.0],
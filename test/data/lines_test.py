@@ -0,0 +1,109 @@
+import numpy
+
+from test import V2NUnitTest
+from numpy2vtk.data import lines
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+class TestLinesData(V2NUnitTest):
+
+    def test_lines_with_list_input_data(self):
+        vtk_lines = lines([
+            numpy.array([
+                [1.0, 2.0],
+                [3.0, 4.0],
+                [5.0, 6.0]
+            ]),
+            numpy.array([
+                [7.0, 8.0, 9.0],
+                [10.0, 11.0, 12.0]
+            ])
+        ], z_index=1.0)
+
+        self.assertPoints(vtk_lines.GetPoints(), [
+            (1.0, 2.0, 1.0),
+            (3.0, 4.0, 1.0),
+            (5.0, 6.0, 1.0),
+            (7.0, 8.0, 9.0),
+            (10.0, 11.0, 12.0)
+        ])
+        self.assertCellArray(vtk_lines.GetVerts(), [
+            (0,),
+            (1,),
+            (2,),
+            (3,),
+            (4,),
+        ])
+        self.assertCellArray(vtk_lines.GetLines(), [
+            (0, 1),
+            (1, 2),
+            (3, 4)
+        ])
+
+    def test_closed_lines_with_offsets(self):
+        numpy_points = numpy.arange(18, dtype=numpy.float).reshape(6, 3)
+        numpy_offsets = numpy.array([0, 3, 3, 4, 6], dtype=numpy.int)
+        vtk_lines = lines(numpy_points, offsets=numpy_offsets, closed=True, verts=False)
+
+        self.assertEqual(vtk_lines.GetNumberOfVerts(), 0)
+        self.assertCellArray(vtk_lines.GetLines(), [
+            (0, 1),
+            (1, 2),
+            (2, 0),
+            (3, 3),
+            (4, 5),
+            (5, 4)
+        ])
+
+    def test_lines_with_uint32_offsets(self):
+        numpy_points = numpy.arange(12, dtype=numpy.float).reshape(4, 3)
+        numpy_offsets = numpy.array([0, 2, 4], dtype=numpy.uint32)
+        vtk_lines = lines(numpy_points, offsets=numpy_offsets, closed=True, poly_line=True, verts=False)
+
+        self.assertCellArray(vtk_lines.GetLines(), [
+            (0, 1, 0),
+            (2, 3, 2)
+        ])
+
+    def test_lines_as_poly_lines(self):
+        numpy_points = numpy.arange(18, dtype=numpy.float).reshape(6, 3)
+        numpy_offsets = numpy.array([0, 3, 3, 6], dtype=numpy.int)
+        vtk_lines = lines(numpy_points, offsets=numpy_offsets, poly_line=True)
+
+        self.assertCellArray(vtk_lines.GetLines(), [
+            (0, 1, 2),
+            (),
+            (3, 4, 5)
+        ])
+
+    def test_closed_lines_as_poly_lines(self):
+        numpy_points = numpy.arange(18, dtype=numpy.float).reshape(6, 3)
+        numpy_offsets = numpy.array([0, 3, 3, 6], dtype=numpy.int)
+        vtk_lines = lines(numpy_points, offsets=numpy_offsets, closed=True, poly_line=True,
+                          cell_data={'ids': numpy.array([1, 2, 3])})
+
+        self.assertCellArray(vtk_lines.GetLines(), [
+            (0, 1, 2, 0),
+            (),
+            (3, 4, 5, 3)
+        ])
+        self.assertEqual(vtk_lines.GetCellData().GetScalars().GetValue(8), 3)
+
+    def test_lines_with_list_and_offsets(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'lines needs a single numpy array as input when offsets are given'):
+            lines([numpy.zeros((2, 3))], offsets=numpy.array([0, 2], dtype=numpy.int))
+
+    def test_lines_without_offsets(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'lines needs a list of numpy arrays or a numpy array and offsets as input'):
+            lines(numpy.zeros((2, 3)))
+
+    def test_lines_with_wrong_list_entries(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'lines needs a list of numpy arrays of nx2 or nx3 shape'):
+            lines([numpy.zeros((2, 3)), numpy.zeros(3)])
+
+    def test_lines_with_wrong_offsets(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'lines offsets need to be increasing from 0 to the number of indices'):
+            lines(numpy.zeros((2, 3)), offsets=numpy.array([0, 3], dtype=numpy.int))
@@ -0,0 +1,71 @@
+import numpy
+
+from test import WindowedTestCase
+import numpy2vtk.data.raw.raw as raw
+import numpy2vtk.to_numpy as to_numpy
+from numpy2vtk.data import point_cloud_levels, level_for_budget
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+class TestPointCloudLevels(WindowedTestCase):
+    window_modules = (raw,)
+    window_size = 1000
+
+    def setUp(self):
+        super(TestPointCloudLevels, self).setUp()
+        self.points = numpy.random.RandomState(0).rand(20000, 3)
+
+    def assertSubset(self, coarse, fine):
+        fine = set(map(tuple, to_numpy.points(fine.GetPoints())))
+        self.assertTrue(all(tuple(p) in fine for p in to_numpy.points(coarse.GetPoints())))
+
+    def test_voxel_levels(self):
+        levels = point_cloud_levels(self.points, number_of_levels=3, factor=8, verts=False)
+
+        self.assertEqual([level.GetNumberOfPoints() for level in levels][0], 20000)
+        self.assertTrue(1000 < levels[1].GetNumberOfPoints() <= 2500)
+        self.assertTrue(100 < levels[2].GetNumberOfPoints() <= 20000 / 64 + 50)
+        self.assertSubset(levels[1], levels[0])
+        self.assertSubset(levels[2], levels[1])
+        self.assertEqual(levels[2].GetNumberOfVerts(), 0)
+
+    def test_voxel_levels_cover_the_bounding_box(self):
+        coarse = to_numpy.points(point_cloud_levels(self.points, number_of_levels=2, factor=100)[1].GetPoints())
+
+        numpy.testing.assert_array_less(coarse.min(axis=0), 0.25)
+        numpy.testing.assert_array_less(0.75, coarse.max(axis=0))
+
+    def test_voxel_levels_of_a_planar_cloud(self):
+        points = numpy.random.RandomState(1).rand(20000, 3)
+        points[:, 2] = points[:, 0] + points[:, 1]
+        counts = [level.GetNumberOfPoints() for level in point_cloud_levels(points, number_of_levels=4, factor=8)]
+
+        self.assertEqual(counts[0], 20000)
+        for finer, coarser in zip(counts[:-1], counts[1:]):
+            self.assertTrue(4 < finer / float(coarser) <= 12, counts)
+
+    def test_random_levels_with_point_data(self):
+        levels = point_cloud_levels(self.points, number_of_levels=2, factor=4, method='random', seed=1,
+                                    point_data={'x': self.points[:, 0]})
+
+        self.assertTrue(4000 < levels[1].GetNumberOfPoints() < 6000)
+        self.assertEqual(levels[1].GetNumberOfVerts(), levels[1].GetNumberOfPoints())
+        numpy.testing.assert_array_equal(to_numpy.point_data(levels[1])['x'],
+                                         to_numpy.points(levels[1].GetPoints())[:, 0])
+
+    def test_two_dimensional_levels(self):
+        levels = point_cloud_levels(self.points[:, :2], number_of_levels=2, factor=10, z_index=1.0)
+
+        self.assertTrue(levels[1].GetNumberOfPoints() <= 2000)
+        self.assertEqual(levels[1].GetPoint(0)[2], 1.0)
+
+    def test_level_for_budget(self):
+        levels = point_cloud_levels(self.points, number_of_levels=3, method='random', seed=1)
+
+        self.assertIs(level_for_budget(levels, 20000), levels[0])
+        self.assertIs(level_for_budget(levels, 5000), levels[1])
+        self.assertIs(level_for_budget(levels, 1), levels[2])
+
+    def test_levels_with_wrong_method(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, "point_cloud_levels method needs to be 'voxel' or 'random'"):
+            point_cloud_levels(self.points, method='octree')
@@ -0,0 +1,79 @@
+import numpy
+
+from test import V2NUnitTest
+import numpy2vtk.to_numpy as to_numpy
+from numpy2vtk.data import merge
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+class TestMerge(V2NUnitTest):
+
+    def test_merge_parts_with_same_polygon_size(self):
+        poly_data = merge([
+            (numpy.array([[0.0, 0.0], [0.0, 1.0], [1.0, 1.0]]), numpy.array([[0, 1, 2]], dtype=numpy.int32)),
+            (numpy.array([[2.0, 0.0, 1.0], [2.0, 1.0, 1.0], [3.0, 1.0, 1.0]]), numpy.array([[0, 1, 2], [2, 1, 0]])),
+        ], verts=False, part_ids=True)
+
+        self.assertPoints(poly_data.GetPoints(), [
+            (0.0, 0.0, 0.0),
+            (0.0, 1.0, 0.0),
+            (1.0, 1.0, 0.0),
+            (2.0, 0.0, 1.0),
+            (2.0, 1.0, 1.0),
+            (3.0, 1.0, 1.0),
+        ])
+        self.assertCellArray(poly_data.GetPolys(), [
+            (0, 1, 2),
+            (3, 4, 5),
+            (5, 4, 3),
+        ])
+        numpy.testing.assert_array_equal(to_numpy.cell_data(poly_data)['part_id'], [0, 1, 1])
+
+    def test_merge_parts_with_mixed_polygons(self):
+        poly_data = merge([
+            (numpy.zeros((4, 3)), numpy.array([[0, 1, 2, 3]])),
+            (numpy.zeros((3, 3)), numpy.array([0, 1, 2, 2, 1]), numpy.array([0, 3, 5])),
+        ], part_ids=True, cell_data={'quality': numpy.array([1.0, 2.0, 3.0])})
+
+        self.assertEqual(poly_data.GetNumberOfVerts(), 7)
+        self.assertCellArray(poly_data.GetPolys(), [
+            (0, 1, 2, 3),
+            (4, 5, 6),
+            (6, 5),
+        ])
+        cell_data = to_numpy.cell_data(poly_data)
+        numpy.testing.assert_array_equal(cell_data['part_id'], [0] * 4 + [1] * 3 + [0, 1, 1])
+        numpy.testing.assert_array_equal(cell_data['quality'], [0.0] * 7 + [1.0, 2.0, 3.0])
+
+    def test_merge_keeps_float32_points(self):
+        poly_data = merge([
+            (numpy.zeros((3, 3), dtype=numpy.float32), numpy.array([[0, 1, 2]])),
+            (numpy.zeros((3, 2), dtype=numpy.float32), numpy.array([[0, 1, 2]])),
+        ])
+
+        self.assertEqual(to_numpy.points(poly_data.GetPoints()).dtype, numpy.float32)
+
+    def test_merge_with_wrong_input(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'merge needs a list of tuples of points, polys and optionally offsets'):
+            merge([numpy.zeros((3, 3))])
+
+    def test_merge_with_point_index_that_does_not_exist(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'merge polys references a point index that does not exist'):
+            merge([
+                (numpy.zeros((3, 3)), numpy.array([[0, 1, 2]])),
+                (numpy.zeros((3, 3)), numpy.array([[0, 1, 3]])),
+            ])
+
+    def test_merge_with_part_without_polys(self):
+        poly_data = merge([
+            (numpy.zeros((3, 3)), numpy.array([[0, 1, 2]])),
+            (numpy.zeros((2, 3)), numpy.zeros((0, 3), dtype=numpy.int)),
+            (numpy.zeros((3, 3)), numpy.array([[2, 1, 0]])),
+        ], verts=False, part_ids=True)
+
+        self.assertCellArray(poly_data.GetPolys(), [
+            (0, 1, 2),
+            (7, 6, 5),
+        ])
+        numpy.testing.assert_array_equal(to_numpy.cell_data(poly_data)['part_id'], [0, 2])
@@ -1,6 +1,10 @@
+import os
+import shutil
+import tempfile
 import numpy
 
 from test import V2NUnitTest
+import numpy2vtk.to_numpy as to_numpy
 from numpy2vtk.data.raw import points
 from numpy2vtk.data import mesh
 from numpy2vtk.exceptions import Numpy2VtkFormatException
@@ -164,6 +168,160 @@ class TestMeshData(V2NUnitTest):
             (3, 2, 4, 5)
         ])
 
+    def test_mesh_with_mixed_elements(self):
+        numpy_points = numpy.array([
+            [0.0, 0.0],
+            [0.0, 1.0],
+            [1.0, 1.0],
+            [1.0, 0.0],
+            [1.0, 2.0],
+        ])
+        numpy_polys = numpy.array([0, 1, 2, 3, 1, 4, 2], dtype=numpy.int)
+        numpy_offsets = numpy.array([0, 4, 7], dtype=numpy.int)
+
+        vtk_mesh = mesh(numpy_points, numpy_polys, offsets=numpy_offsets)
+
+        self.assertCellArray(vtk_mesh.GetPolys(), [
+            (0, 1, 2, 3),
+            (1, 4, 2)
+        ])
+
+    def test_mesh_with_mixed_elements_and_point_index_that_does_not_exist(self):
+        numpy_points = numpy.array([
+            [0.0, 0.0],
+            [0.0, 1.0],
+            [1.0, 1.0],
+            [1.0, 0.0],
+        ])
+        numpy_polys = numpy.array([0, 1, 2, 3, 1, 4, 2], dtype=numpy.int)
+        numpy_offsets = numpy.array([0, 4, 7], dtype=numpy.int)
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'mesh polys references a point index that does not exist'):
+            mesh(numpy_points, numpy_polys, offsets=numpy_offsets)
+
+    def test_mesh_without_verts(self):
+        numpy_points = numpy.array([
+            [0.0, 0.0],
+            [0.0, 1.0],
+            [1.0, 1.0],
+            [1.0, 0.0],
+        ])
+        numpy_polys = numpy.array([
+            [0, 1, 2],
+            [0, 2, 3],
+        ], dtype=numpy.int)
+
+        vtk_mesh = mesh(numpy_points, numpy_polys, verts=False)
+
+        self.assertEqual(vtk_mesh.GetNumberOfVerts(), 0)
+        self.assertCellArray(vtk_mesh.GetPolys(), [
+            (0, 1, 2),
+            (0, 2, 3)
+        ])
+
+    def test_mesh_from_npy_files(self):
+        directory = tempfile.mkdtemp()
+        try:
+            points_path = os.path.join(directory, 'points.npy')
+            polys_path = os.path.join(directory, 'polys.npy')
+            numpy.save(points_path, numpy.array([
+                [0.0, 0.0],
+                [0.0, 1.0],
+                [1.0, 1.0],
+                [1.0, 0.0],
+            ]))
+            numpy.save(polys_path, numpy.array([
+                [0, 1, 2],
+                [0, 2, 3],
+            ], dtype=numpy.int))
+
+            vtk_mesh = mesh(points_path, polys_path)
+        finally:
+            shutil.rmtree(directory)
+
+        self.assertPoints(vtk_mesh.GetPoints(), [
+            (0.0, 0.0, 0.0),
+            (0.0, 1.0, 0.0),
+            (1.0, 1.0, 0.0),
+            (1.0, 0.0, 0.0),
+        ])
+        self.assertCellArray(vtk_mesh.GetPolys(), [
+            (0, 1, 2),
+            (0, 2, 3)
+        ])
+
+    def test_mesh_with_point_and_cell_data(self):
+        numpy_points = numpy.array([
+            [0.0, 0.0],
+            [0.0, 1.0],
+            [1.0, 1.0],
+            [1.0, 0.0],
+        ])
+        numpy_polys = numpy.array([
+            [0, 1, 2],
+            [0, 2, 3],
+        ], dtype=numpy.int)
+        temperature = numpy.array([1.0, 2.0, 3.0, 4.0])
+        normals = numpy.array([[0.0, 0.0, 1.0]] * 4)
+        velocity = numpy.ones((4, 3))
+        labels = numpy.array([5, 6], dtype=numpy.int32)
+
+        vtk_mesh = mesh(numpy_points, numpy_polys, point_data={
+            'temperature': temperature,
+            'normals': normals,
+            'velocity': velocity,
+        }, cell_data={
+            'labels': labels
+        })
+
+        point_data = vtk_mesh.GetPointData()
+        self.assertEqual(point_data.GetScalars().GetName(), 'temperature')
+        self.assertEqual(point_data.GetNormals().GetName(), 'normals')
+        self.assertEqual(point_data.GetVectors().GetName(), 'velocity')
+        self.assertEqual(point_data.GetScalars().GetValue(3), 4.0)
+        cell_labels = vtk_mesh.GetCellData().GetScalars()
+        self.assertEqual(cell_labels.GetName(), 'labels')
+        self.assertEqual([cell_labels.GetValue(i) for i in range(6)], [0, 0, 0, 0, 5, 6])
+
+    def test_mesh_with_weld(self):
+        poly_data = mesh(numpy.array([
+            [0.0, 0.0],
+            [0.0, 1.0],
+            [1.0, 1.0],
+            [0.0, 0.0],
+            [1.0, 1.0],
+            [1.0, 0.0],
+        ]), numpy.array([
+            [0, 1, 2],
+            [3, 4, 5],
+        ]), point_data={'t': numpy.arange(6.0)}, weld=0.0)
+
+        self.assertPoints(poly_data.GetPoints(), [
+            (0.0, 0.0, 0.0),
+            (0.0, 1.0, 0.0),
+            (1.0, 1.0, 0.0),
+            (1.0, 0.0, 0.0),
+        ])
+        self.assertCellArray(poly_data.GetPolys(), [
+            (0, 1, 2),
+            (0, 2, 3),
+        ])
+        numpy.testing.assert_array_equal(to_numpy.point_data(poly_data)['t'], [0.0, 1.0, 2.0, 5.0])
+        self.assertEqual(poly_data.GetFieldData().GetArray('compaction_ratio').GetValue(0), 1.5)
+
+    def test_mesh_with_cell_data_of_wrong_length(self):
+        numpy_points = numpy.array([
+            [0.0, 0.0],
+            [0.0, 1.0],
+            [1.0, 1.0],
+        ])
+        numpy_polys = numpy.array([
+            [0, 1, 2],
+        ], dtype=numpy.int)
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'cell_data labels needs 1 entries, has 2'):
+            mesh(numpy_points, numpy_polys, verts=False, cell_data={'labels': numpy.array([1, 2])})
+
     def test_mesh_with_point_index_that_does_not_exist(self):
         numpy_points = numpy.array([
             [0.0, 0.0],
@@ -203,3 +361,24 @@ class TestMeshData(V2NUnitTest):
         with self.assertRaisesRegexp(
                 Numpy2VtkFormatException, 'mesh points needs to be numpy array or vtk.vtkPoints'):
             mesh(numpy_points, numpy_polys)
+
+    def test_mesh_without_validation(self):
+        numpy_points = numpy.array([
+            [0.0, 0.0],
+            [0.0, 1.0],
+            [1.0, 1.0],
+        ])
+        numpy_polys = numpy.array([
+            [0, 1, 2],
+        ], dtype=numpy.int)
+
+        vtk_mesh = mesh(numpy_points, numpy_polys, verts=False, validate=False)
+
+        self.assertPoints(vtk_mesh.GetPoints(), [
+            (0.0, 0.0, 0.0),
+            (0.0, 1.0, 0.0),
+            (1.0, 1.0, 0.0),
+        ])
+        self.assertCellArray(vtk_mesh.GetPolys(), [
+            (0, 1, 2),
+        ])
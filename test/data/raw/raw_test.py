@@ -1,10 +1,33 @@
+import os
+import shutil
+import tempfile
+import threading
 import numpy
+import vtk
+from vtk.util.numpy_support import vtk_to_numpy
 
-from test import V2NUnitTest
+from test import V2NUnitTest, WindowedTestCase
 import numpy2vtk.data.raw as raw
 from numpy2vtk.exceptions import Numpy2VtkFormatException
 
-class RawPointsDataTest(V2NUnitTest):
+class RawTestCase(WindowedTestCase):
+    window_modules = (raw.raw,)
+
+    def setUp(self):
+        super(RawTestCase, self).setUp()
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        super(RawTestCase, self).tearDown()
+        shutil.rmtree(self.directory)
+
+    def save(self, name, array):
+        path = os.path.join(self.directory, name)
+        numpy.save(path, array)
+        return path
+
+
+class RawPointsDataTest(RawTestCase):
     def test_2d_points(self):
         numpy_points = numpy.array([
             [1.0, 2.0],
@@ -38,6 +61,114 @@ class RawPointsDataTest(V2NUnitTest):
             (4.0, 5.0, 6.0),
         ])
 
+    def test_3d_points_share_the_numpy_buffer(self):
+        numpy_points = numpy.array([
+            [1.0, 2.0, 3.0],
+            [4.0, 5.0, 6.0]
+        ])
+        vtk_points = raw.points(numpy_points)
+        numpy_points[1, 2] = 7.0
+        self.assertPoints(vtk_points, [
+            (1.0, 2.0, 3.0),
+            (4.0, 5.0, 7.0),
+        ])
+
+    def test_3d_points_keep_the_numpy_buffer_alive(self):
+        vtk_points = raw.points(numpy.array([
+            [1.0, 2.0, 3.0],
+            [4.0, 5.0, 6.0]
+        ], dtype=numpy.float32))
+        self.assertEqual(vtk_points.GetDataType(), vtk.VTK_FLOAT)
+        self.assertPoints(vtk_points, [
+            (1.0, 2.0, 3.0),
+            (4.0, 5.0, 6.0),
+        ])
+
+    def test_points_with_dtype(self):
+        vtk_points = raw.points(numpy.array([
+            [1.0, 2.0],
+            [4.0, 5.0]
+        ]), z_index=3.0, dtype=numpy.float32)
+        self.assertEqual(vtk_points.GetDataType(), vtk.VTK_FLOAT)
+        self.assertPoints(vtk_points, [
+            (1.0, 2.0, 3.0),
+            (4.0, 5.0, 3.0),
+        ])
+
+    def test_integer_points_are_stored_as_float64(self):
+        vtk_points = raw.points(numpy.array([
+            [1, 2, 3],
+        ]))
+        self.assertEqual(vtk_points.GetDataType(), vtk.VTK_DOUBLE)
+
+    def test_points_with_invalid_dtype(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'points dtype needs to be numpy.float32 or numpy.float64'):
+            raw.points(numpy.zeros((2, 3)), dtype=numpy.int32)
+
+    def test_3d_points_with_copy(self):
+        numpy_points = numpy.array([
+            [1.0, 2.0, 3.0],
+            [4.0, 5.0, 6.0]
+        ])
+        vtk_points = raw.points(numpy_points, copy=True)
+        numpy_points[1, 2] = 7.0
+        self.assertPoints(vtk_points, [
+            (1.0, 2.0, 3.0),
+            (4.0, 5.0, 6.0),
+        ])
+
+    def test_non_contiguous_3d_points(self):
+        numpy_points = numpy.array([
+            [1.0, 2.0, 3.0, 0.0],
+            [4.0, 5.0, 6.0, 0.0]
+        ])[:, :3]
+        vtk_points = raw.points(numpy_points)
+        self.assertPoints(vtk_points, [
+            (1.0, 2.0, 3.0),
+            (4.0, 5.0, 6.0),
+        ])
+
+    def test_points_from_npy_file(self):
+        path = self.save('points.npy', numpy.array([
+            [1.0, 2.0, 3.0],
+            [4.0, 5.0, 6.0],
+            [7.0, 8.0, 9.0],
+        ]))
+        vtk_points = raw.points(path)
+        self.assertPoints(vtk_points, [
+            (1.0, 2.0, 3.0),
+            (4.0, 5.0, 6.0),
+            (7.0, 8.0, 9.0),
+        ])
+
+    def test_points_from_memmap_are_copied(self):
+        path = self.save('points.npy', numpy.array([
+            [1.0, 2.0],
+            [3.0, 4.0],
+            [5.0, 6.0],
+        ], dtype=numpy.float32))
+        numpy_points = numpy.load(path, mmap_mode='r')
+        vtk_points = raw.points(numpy_points, z_index=1.0)
+        del numpy_points
+        self.assertEqual(vtk_points.GetDataType(), vtk.VTK_FLOAT)
+        self.assertPoints(vtk_points, [
+            (1.0, 2.0, 1.0),
+            (3.0, 4.0, 1.0),
+            (5.0, 6.0, 1.0),
+        ])
+
+    def test_read_only_points_are_copied(self):
+        path = self.save('points.npy', numpy.array([
+            [1.0, 2.0, 3.0],
+            [4.0, 5.0, 6.0],
+        ]))
+        numpy_points = numpy.asarray(numpy.load(path, mmap_mode='r'))
+        vtk_points = raw.points(numpy_points)
+        self.assertFalse(numpy.may_share_memory(vtk_to_numpy(vtk_points.GetData()), numpy_points))
+        vtk_to_numpy(vtk_points.GetData())[0] = 0.0
+        self.assertEqual(numpy_points[0].tolist(), [1.0, 2.0, 3.0])
+
     def test_points_with_invalid_input_type(self):
         numpy_points = 'something'
         with self.assertRaisesRegexp(
@@ -68,6 +199,11 @@ class RawPointsDataTest(V2NUnitTest):
                 Numpy2VtkFormatException, 'points needs an array of nx2 or nx3 shape, was nx4'):
             raw.points(numpy_points)
 
+    def test_2d_points_with_workers(self):
+        numpy_points = numpy.arange(14, dtype=numpy.float32).reshape(7, 2)
+        vtk_points = raw.points(numpy_points, z_index=1.0, workers=3)
+        self.assertPoints(vtk_points, [(2.0 * i, 2.0 * i + 1, 1.0) for i in range(7)])
+
 
 class RawVerticesDataTest(V2NUnitTest):
     def test_vertices(self):
@@ -78,6 +214,14 @@ class RawVerticesDataTest(V2NUnitTest):
             (4,),
         ])
 
+    def test_vertices_of_any_integer_type(self):
+        for dtype in [numpy.int8, numpy.int16, numpy.int32, numpy.uint8, numpy.uint16, numpy.uint32, numpy.uint64]:
+            vtk_vertices = raw.vertices(numpy.array([3, 4], dtype=dtype))
+            self.assertCellArray(vtk_vertices, [
+                (3,),
+                (4,),
+            ])
+
     def test_vertices_with_invalid_input_type(self):
         numpy_vertices = 'something'
         with self.assertRaisesRegexp(
@@ -96,7 +240,7 @@ class RawVerticesDataTest(V2NUnitTest):
     def test_vertices_with_wrong_array_type(self):
         numpy_vertices = numpy.array([3, 4], dtype=numpy.float)
         with self.assertRaisesRegexp(
-                Numpy2VtkFormatException, 'vertices need to be numpy array of type numpy.int'):
+                Numpy2VtkFormatException, 'vertices need to be numpy array of integer type'):
             raw.vertices(numpy_vertices)
 
 
@@ -112,6 +256,17 @@ class RawEdgesDataTest(V2NUnitTest):
             (3, 4),
         ])
 
+    def test_int32_edges(self):
+        numpy_edges = numpy.array([
+            [1, 2],
+            [3, 4]
+        ], dtype=numpy.int32)
+        vtk_edges = raw.edges(numpy_edges)
+        self.assertCellArray(vtk_edges, [
+            (1, 2),
+            (3, 4),
+        ])
+
     def test_edges_with_invalid_input_type(self):
         numpy_edges = 'something'
         with self.assertRaisesRegexp(
@@ -146,11 +301,11 @@ class RawEdgesDataTest(V2NUnitTest):
             [3, 4]
         ], dtype=numpy.float)
         with self.assertRaisesRegexp(
-                Numpy2VtkFormatException, 'lines needs to be numpy array of type numpy.int'):
+                Numpy2VtkFormatException, 'lines needs to be numpy array of integer type'):
             raw.edges(numpy_edges)
 
 
-class RawPolygonsDataTest(V2NUnitTest):
+class RawPolygonsDataTest(RawTestCase):
     def test_polygons(self):
         numpy_polygons = numpy.array([
             [1, 2, 3, 4],
@@ -162,6 +317,104 @@ class RawPolygonsDataTest(V2NUnitTest):
             (5, 6, 7, 8),
         ])
 
+    def test_uint16_polygons(self):
+        numpy_polygons = numpy.array([
+            [1, 2, 3, 4],
+            [5, 6, 7, 60000],
+        ], dtype=numpy.uint16)
+        vtk_polygons = raw.polygons(numpy_polygons)
+        self.assertCellArray(vtk_polygons, [
+            (1, 2, 3, 4),
+            (5, 6, 7, 60000),
+        ])
+
+    def test_many_polygons(self):
+        numpy_polygons = numpy.arange(3000, dtype=numpy.int).reshape(1000, 3)
+        vtk_polygons = raw.polygons(numpy_polygons)
+        self.assertEqual(vtk_polygons.GetNumberOfCells(), 1000)
+        self.assertCellArray(vtk_polygons, [tuple(p) for p in numpy_polygons])
+
+    def test_empty_polygons(self):
+        numpy_polygons = numpy.zeros((0, 3), dtype=numpy.int)
+        vtk_polygons = raw.polygons(numpy_polygons)
+        self.assertCellArray(vtk_polygons, [])
+
+    def test_polygons_with_offsets(self):
+        numpy_polygons = numpy.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12], dtype=numpy.int)
+        numpy_offsets = numpy.array([0, 3, 7, 7, 12], dtype=numpy.int)
+        vtk_polygons = raw.polygons(numpy_polygons, offsets=numpy_offsets)
+        self.assertCellArray(vtk_polygons, [
+            (1, 2, 3),
+            (4, 5, 6, 7),
+            (),
+            (8, 9, 10, 11, 12),
+        ])
+
+    def test_int32_polygons_with_uint32_offsets(self):
+        numpy_polygons = numpy.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12], dtype=numpy.int32)
+        numpy_offsets = numpy.array([0, 3, 7, 7, 12], dtype=numpy.uint32)
+        vtk_polygons = raw.polygons(numpy_polygons, offsets=numpy_offsets)
+        self.assertCellArray(vtk_polygons, [
+            (1, 2, 3),
+            (4, 5, 6, 7),
+            (),
+            (8, 9, 10, 11, 12),
+        ])
+
+    def test_polygons_from_npy_files(self):
+        indices_path = self.save('indices.npy', numpy.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12], dtype=numpy.int))
+        offsets_path = self.save('offsets.npy', numpy.array([0, 3, 7, 7, 12], dtype=numpy.int))
+        vtk_polygons = raw.polygons(indices_path, offsets=offsets_path)
+        self.assertCellArray(vtk_polygons, [
+            (1, 2, 3),
+            (4, 5, 6, 7),
+            (),
+            (8, 9, 10, 11, 12),
+        ])
+
+    def test_polygons_from_memmap(self):
+        path = self.save('polygons.npy', numpy.arange(15, dtype=numpy.int).reshape(5, 3))
+        vtk_polygons = raw.polygons(numpy.load(path, mmap_mode='r'))
+        self.assertCellArray(vtk_polygons, [
+            (0, 1, 2),
+            (3, 4, 5),
+            (6, 7, 8),
+            (9, 10, 11),
+            (12, 13, 14),
+        ])
+
+    def test_polygons_with_offsets_and_two_dimensional_input(self):
+        numpy_polygons = numpy.array([
+            [1, 2, 3],
+            [4, 5, 6],
+        ], dtype=numpy.int)
+        numpy_offsets = numpy.array([0, 3, 6], dtype=numpy.int)
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'polygons needs a one dimensional ndarray as input when offsets are given'):
+            raw.polygons(numpy_polygons, offsets=numpy_offsets)
+
+    def test_polygons_with_wrong_offsets_type(self):
+        numpy_polygons = numpy.array([1, 2, 3, 4, 5, 6], dtype=numpy.int)
+        numpy_offsets = numpy.array([0, 3, 6], dtype=numpy.float)
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException,
+                'polygons offsets need to be a one dimensional numpy array of integer type'):
+            raw.polygons(numpy_polygons, offsets=numpy_offsets)
+
+    def test_polygons_with_offsets_that_do_not_cover_the_indices(self):
+        numpy_polygons = numpy.array([1, 2, 3, 4, 5, 6], dtype=numpy.int)
+        numpy_offsets = numpy.array([0, 3, 5], dtype=numpy.int)
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'polygons offsets need to be increasing from 0 to the number of indices'):
+            raw.polygons(numpy_polygons, offsets=numpy_offsets)
+
+    def test_polygons_with_decreasing_offsets(self):
+        numpy_polygons = numpy.array([1, 2, 3, 4, 5, 6], dtype=numpy.int)
+        numpy_offsets = numpy.array([0, 4, 3, 6], dtype=numpy.int)
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'polygons offsets need to be increasing from 0 to the number of indices'):
+            raw.polygons(numpy_polygons, offsets=numpy_offsets)
+
     def test_polygons_with_invalid_input_type(self):
         numpy_polygons = 'something'
         with self.assertRaisesRegexp(
@@ -187,7 +440,77 @@ class RawPolygonsDataTest(V2NUnitTest):
             [3, 4]
         ], dtype=numpy.float)
         with self.assertRaisesRegexp(
-                Numpy2VtkFormatException, 'polygons needs to be numpy array of type numpy.int'):
+                Numpy2VtkFormatException, 'polygons needs to be numpy array of integer type'):
             raw.polygons(numpy_polygons)
 
+    def test_polygons_with_workers(self):
+        numpy_polygons = numpy.arange(21, dtype=numpy.int).reshape(7, 3)
+        vtk_polygons = raw.polygons(numpy_polygons, workers=3)
+        self.assertCellArray(vtk_polygons, [tuple(p) for p in numpy_polygons])
+
+    def test_polygons_with_offsets_and_workers(self):
+        numpy_polygons = numpy.arange(12, dtype=numpy.int)
+        numpy_offsets = numpy.array([0, 3, 3, 4, 7, 9, 12], dtype=numpy.int)
+        vtk_polygons = raw.polygons(numpy_polygons, offsets=numpy_offsets, workers=3)
+        self.assertCellArray(vtk_polygons, [
+            (0, 1, 2),
+            (),
+            (3,),
+            (4, 5, 6),
+            (7, 8),
+            (9, 10, 11),
+        ])
+
+    def test_workers_share_one_pool_across_threads(self):
+        pools = []
+        threads = [threading.Thread(target=lambda: pools.append(raw.raw._pool(5))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(map(id, pools))), 1)
+
+
+class RawArrayDataTest(V2NUnitTest):
+    def test_array(self):
+        numpy_values = numpy.array([1.0, 2.0, 3.0])
+        vtk_array = raw.array(numpy_values, name='values')
+        numpy_values[2] = 4.0
+        self.assertEqual(vtk_array.GetName(), 'values')
+        self.assertEqual(vtk_array.GetDataType(), vtk.VTK_DOUBLE)
+        self.assertEqual([vtk_array.GetValue(i) for i in range(3)], [1.0, 2.0, 4.0])
+
+    def test_array_with_components(self):
+        numpy_values = numpy.array([
+            [1, 2, 3],
+            [4, 5, 6]
+        ], dtype=numpy.int32)
+        vtk_array = raw.array(numpy_values)
+        self.assertEqual(vtk_array.GetDataType(), vtk.VTK_INT)
+        self.assertEqual(vtk_array.GetNumberOfComponents(), 3)
+        self.assertEqual([vtk_array.GetTuple3(i) for i in range(2)], [(1.0, 2.0, 3.0), (4.0, 5.0, 6.0)])
 
+    def test_boolean_array(self):
+        vtk_array = raw.array(numpy.array([True, False]))
+        self.assertEqual(vtk_array.GetDataType(), vtk.VTK_UNSIGNED_CHAR)
+        self.assertEqual([vtk_array.GetValue(i) for i in range(2)], [1, 0])
+
+    def test_float16_array(self):
+        vtk_array = raw.array(numpy.array([1.5, 2.5], dtype=numpy.float16))
+        self.assertEqual(vtk_array.GetDataType(), vtk.VTK_FLOAT)
+        self.assertEqual([vtk_array.GetValue(i) for i in range(2)], [1.5, 2.5])
+
+    def test_array_with_invalid_input_type(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'array needs numpy array as input'):
+            raw.array('something')
+
+    def test_array_with_too_many_dimensions(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'array needs a one or two dimensional array as input, was 3-dimensional'):
+            raw.array(numpy.zeros((2, 2, 2)))
+
+    def test_array_with_wrong_array_type(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'array needs to be numpy array of boolean, integer or float type'):
+            raw.array(numpy.array(['a', 'b']))
@@ -0,0 +1,57 @@
+import numpy
+
+from test import V2NUnitTest
+from numpy2vtk.data import VoxelHash, voxel_hash, vertices, mesh, PolyDataBuilder
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+class TestVoxelHash(V2NUnitTest):
+
+    def setUp(self):
+        random = numpy.random.RandomState(0)
+        self.points = random.rand(2000, 3)
+        self.queries = random.rand(300, 3) * 1.4 - 0.2
+
+    def distances(self):
+        return numpy.sqrt(((self.queries[:, None, :] - self.points[None, :, :]) ** 2).sum(axis=2))
+
+    def test_radius(self):
+        indices, offsets = VoxelHash(self.points).radius(self.queries, 0.15)
+
+        expected = self.distances() <= 0.15
+        self.assertEqual(len(offsets), len(self.queries) + 1)
+        for i in range(len(self.queries)):
+            self.assertEqual(sorted(indices[offsets[i]:offsets[i + 1]]), list(numpy.flatnonzero(expected[i])))
+
+    def test_nearest(self):
+        indices, distances = VoxelHash(self.points, cell_size=0.05).nearest(self.queries)
+
+        numpy.testing.assert_array_equal(indices, self.distances().argmin(axis=1))
+        numpy.testing.assert_allclose(distances, self.distances().min(axis=1))
+
+    def test_nearest_in_two_dimensions(self):
+        points = numpy.array([[0.0, 0.0], [10.0, 0.0], [10.0, 10.0]])
+        indices, distances = VoxelHash(points).nearest(numpy.array([[1.0, 1.0], [9.0, 8.0], [30.0, -5.0]]))
+
+        numpy.testing.assert_array_equal(indices, [0, 2, 1])
+        numpy.testing.assert_allclose(distances, [numpy.sqrt(2), numpy.sqrt(5), numpy.sqrt(425)])
+
+    def test_voxel_hash_is_cached_until_points_are_modified(self):
+        poly_data = vertices(self.points, spatial_index=True)
+        index = voxel_hash(poly_data)
+
+        self.assertIs(voxel_hash(poly_data), index)
+        poly_data.GetPoints().Modified()
+        self.assertIsNot(voxel_hash(poly_data), index)
+
+    def test_spatial_index_option_of_builders(self):
+        poly_data = mesh(self.points, numpy.array([[0, 1, 2]]), spatial_index=True)
+        builder = PolyDataBuilder()
+        builder.append(self.points)
+
+        self.assertEqual(voxel_hash(poly_data).nearest(self.points[5:6])[0][0], 5)
+        self.assertEqual(voxel_hash(builder.build(spatial_index=True)).nearest(self.points[7:8])[0][0], 7)
+
+    def test_queries_with_wrong_dimensions(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'voxel hash queries need to be of the same dimensions as the points'):
+            VoxelHash(self.points).radius(self.queries[:, :2], 0.1)
@@ -0,0 +1,94 @@
+import numpy
+import vtk
+
+from test import V2NUnitTest
+from numpy2vtk.data import unstructured_grid
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+POINTS = numpy.array([
+    [0.0, 0.0, 0.0],
+    [1.0, 0.0, 0.0],
+    [1.0, 1.0, 0.0],
+    [0.0, 1.0, 0.0],
+    [0.0, 0.0, 1.0],
+    [1.0, 0.0, 1.0],
+    [1.0, 1.0, 1.0],
+    [0.0, 1.0, 1.0],
+    [0.5, 0.5, 2.0],
+])
+
+class TestUnstructuredGrid(V2NUnitTest):
+
+    def assertCells(self, grid, expected):
+        got = []
+        for i in range(grid.GetNumberOfCells()):
+            cell = grid.GetCell(i)
+            got.append((cell.GetCellType(), tuple(cell.GetPointId(j) for j in range(cell.GetNumberOfPoints()))))
+        self.assertEqual(got, expected)
+
+    def test_unstructured_grid_with_cells_of_one_type(self):
+        grid = unstructured_grid(POINTS, numpy.array([
+            [0, 1, 2, 4],
+            [4, 5, 6, 8],
+        ]), types=vtk.VTK_TETRA, cell_data={'quality': numpy.array([0.5, 1.0])})
+
+        self.assertEqual(grid.GetNumberOfPoints(), 9)
+        self.assertCells(grid, [
+            (vtk.VTK_TETRA, (0, 1, 2, 4)),
+            (vtk.VTK_TETRA, (4, 5, 6, 8)),
+        ])
+        self.assertEqual(grid.GetCellData().GetScalars().GetValue(1), 1.0)
+
+    def test_unstructured_grid_with_offsets_and_types(self):
+        grid = unstructured_grid(
+            POINTS,
+            numpy.array([0, 1, 2, 3, 4, 5, 6, 7, 4, 5, 6, 7, 8, 0, 1, 2], dtype=numpy.int32),
+            offsets=numpy.array([0, 8, 13, 16]),
+            types=numpy.array([vtk.VTK_HEXAHEDRON, vtk.VTK_PYRAMID, vtk.VTK_TRIANGLE])
+        )
+
+        self.assertCells(grid, [
+            (vtk.VTK_HEXAHEDRON, (0, 1, 2, 3, 4, 5, 6, 7)),
+            (vtk.VTK_PYRAMID, (4, 5, 6, 7, 8)),
+            (vtk.VTK_TRIANGLE, (0, 1, 2)),
+        ])
+
+    def test_unstructured_grid_with_blocks(self):
+        grid = unstructured_grid(POINTS, {
+            vtk.VTK_WEDGE: numpy.array([[0, 1, 2, 4, 5, 6]]),
+            vtk.VTK_TETRA: numpy.array([[0, 1, 2, 4], [4, 5, 6, 8]]),
+        })
+
+        self.assertCells(grid, [
+            (vtk.VTK_TETRA, (0, 1, 2, 4)),
+            (vtk.VTK_TETRA, (4, 5, 6, 8)),
+            (vtk.VTK_WEDGE, (0, 1, 2, 4, 5, 6)),
+        ])
+
+    def test_unstructured_grid_with_list_of_blocks(self):
+        grid = unstructured_grid(POINTS, [
+            (vtk.VTK_HEXAHEDRON, numpy.array([[0, 1, 2, 3, 4, 5, 6, 7]], dtype=numpy.uint16)),
+            (vtk.VTK_TETRA, numpy.array([[4, 5, 6, 8]])),
+        ])
+
+        self.assertCells(grid, [
+            (vtk.VTK_HEXAHEDRON, (0, 1, 2, 3, 4, 5, 6, 7)),
+            (vtk.VTK_TETRA, (4, 5, 6, 8)),
+        ])
+
+    def test_unstructured_grid_without_types(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'unstructured_grid needs types when cells are given as an array'):
+            unstructured_grid(POINTS, numpy.array([[0, 1, 2, 4]]))
+
+    def test_unstructured_grid_with_wrong_cell_size(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException,
+                'unstructured_grid cells needs the number of points of its cell type for every cell'):
+            unstructured_grid(POINTS, numpy.array([0, 1, 2, 4, 5]), offsets=numpy.array([0, 3, 5]),
+                              types=numpy.array([vtk.VTK_TRIANGLE, vtk.VTK_TETRA]))
+
+    def test_unstructured_grid_with_point_index_that_does_not_exist(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'unstructured_grid cells references a point index that does not exist'):
+            unstructured_grid(POINTS, {vtk.VTK_TETRA: numpy.array([[0, 1, 2, 9]])})
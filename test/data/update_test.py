@@ -0,0 +1,88 @@
+import numpy
+from vtk.util.numpy_support import numpy_to_vtk, vtk_to_numpy
+
+from test import V2NUnitTest
+from numpy2vtk.data import mesh, update_points
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+class TestUpdatePoints(V2NUnitTest):
+
+    def setUp(self):
+        self.mesh = mesh(numpy.array([
+            [0.0, 0.0],
+            [0.0, 1.0],
+            [1.0, 1.0],
+        ]), numpy.array([
+            [0, 1, 2],
+        ], dtype=numpy.int))
+
+    def test_update_points_copies_into_the_point_buffer(self):
+        vtk_points = self.mesh.GetPoints()
+        buffer = vtk_points.GetData()
+        modified = self.mesh.GetMTime()
+
+        update_points(self.mesh, numpy.array([
+            [1.0, 0.0],
+            [1.0, 1.0],
+            [2.0, 1.0],
+        ]), z_index=2.0)
+
+        self.assertEqual(self.mesh.GetPoints(), vtk_points)
+        self.assertEqual(self.mesh.GetPoints().GetData(), buffer)
+        self.assertGreater(self.mesh.GetMTime(), modified)
+        self.assertPoints(self.mesh.GetPoints(), [
+            (1.0, 0.0, 2.0),
+            (1.0, 1.0, 2.0),
+            (2.0, 1.0, 2.0),
+        ])
+        self.assertCellArray(self.mesh.GetPolys(), [
+            (0, 1, 2)
+        ])
+
+    def test_update_points_without_copy_shares_the_buffer(self):
+        numpy_points = numpy.array([
+            [1.0, 0.0, 3.0],
+            [1.0, 1.0, 3.0],
+            [2.0, 1.0, 3.0],
+        ])
+        update_points(self.mesh, numpy_points, copy=False)
+        numpy_points[0, 0] = 4.0
+
+        self.assertPoints(self.mesh.GetPoints(), [
+            (4.0, 0.0, 3.0),
+            (1.0, 1.0, 3.0),
+            (2.0, 1.0, 3.0),
+        ])
+
+    def test_update_points_with_a_view_of_the_point_buffer_fills_z(self):
+        buffer = vtk_to_numpy(self.mesh.GetPoints().GetData())
+        update_points(self.mesh, buffer[:, :2], z_index=5.0)
+
+        self.assertPoints(self.mesh.GetPoints(), [
+            (0.0, 0.0, 5.0),
+            (0.0, 1.0, 5.0),
+            (1.0, 1.0, 5.0),
+        ])
+
+    def test_update_points_replaces_read_only_points(self):
+        numpy_points = numpy.zeros((3, 3))
+        numpy_points.flags.writeable = False
+        self.mesh.GetPoints().SetData(numpy_to_vtk(numpy_points))
+
+        update_points(self.mesh, numpy.array([
+            [1.0, 0.0],
+            [1.0, 1.0],
+            [2.0, 1.0],
+        ]), z_index=2.0)
+
+        self.assertEqual(numpy_points.tolist(), numpy.zeros((3, 3)).tolist())
+        self.assertPoints(self.mesh.GetPoints(), [
+            (1.0, 0.0, 2.0),
+            (1.0, 1.0, 2.0),
+            (2.0, 1.0, 2.0),
+        ])
+
+    def test_update_points_with_wrong_number_of_points(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'update_points needs an array of nx2 or nx3 shape with one row per point'):
+            update_points(self.mesh, numpy.zeros((2, 3)))
@@ -1,4 +1,5 @@
 import numpy
+import vtk
 
 from test import V2NUnitTest
 from numpy2vtk.data.raw import points as to_vtk_points
@@ -70,8 +71,40 @@ class TestPVerticesData(V2NUnitTest):
             (2,)
         ])
 
+    def test_vertices_without_verts(self):
+        numpy_points = numpy.array([
+            [1.0, 2.0],
+            [3.0, 4.0]
+        ])
+        vtk_vertices = vertices(numpy_points, verts=False)
+        self.assertPoints(vtk_vertices.GetPoints(), [
+            (1.0, 2.0, 0.0),
+            (3.0, 4.0, 0.0)
+        ])
+        self.assertEqual(vtk_vertices.GetNumberOfVerts(), 0)
+
+    def test_vertices_with_point_data(self):
+        numpy_points = numpy.array([
+            [1.0, 2.0],
+            [3.0, 4.0]
+        ])
+        vtk_vertices = vertices(numpy_points, point_data={'intensity': numpy.array([0.5, 0.25], dtype=numpy.float32)})
+        scalars = vtk_vertices.GetPointData().GetScalars()
+        self.assertEqual(scalars.GetName(), 'intensity')
+        self.assertEqual([scalars.GetValue(i) for i in range(2)], [0.5, 0.25])
+
     def test_vertices_with_wrong_input_type(self):
         numpy_points = 'numpy array'
         with self.assertRaisesRegexp(
                 Numpy2VtkFormatException, 'vertices needs numpy array or vtk.vtkPoints as input'):
             vertices(numpy_points)
+
+    def test_vertices_with_dtype(self):
+        vtk_vertices = vertices(numpy.array([
+            [1.0, 2.0, 3.0],
+        ]), dtype=numpy.float32)
+
+        self.assertEqual(vtk_vertices.GetPoints().GetDataType(), vtk.VTK_FLOAT)
+        self.assertPoints(vtk_vertices.GetPoints(), [
+            (1.0, 2.0, 3.0),
+        ])
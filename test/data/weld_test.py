@@ -0,0 +1,76 @@
+import numpy
+
+from test import V2NUnitTest
+import numpy2vtk.to_numpy as to_numpy
+from numpy2vtk.data import weld, mesh
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+class TestWeld(V2NUnitTest):
+
+    def setUp(self):
+        # Two triangles with unshared points, one point of the second one is slightly off, point 6 is unused
+        self.points = numpy.array([
+            [0.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0],
+            [1.0, 0.0, 0.0],
+            [1.0, 1.0, 0.0],
+            [0.0, 1.0000001, -0.0],
+            [5.0, 5.0, 5.0],
+        ])
+        self.polys = numpy.array([[0, 1, 2], [3, 4, 5]])
+
+    def test_weld_exact(self):
+        points, polys, kept, ratio = weld(self.points, self.polys)
+
+        numpy.testing.assert_array_equal(kept, [0, 1, 2, 4, 5])
+        numpy.testing.assert_array_equal(points, self.points[kept])
+        numpy.testing.assert_array_equal(polys, [[0, 1, 2], [1, 3, 4]])
+        self.assertAlmostEqual(ratio, 7 / 5.0)
+
+    def test_weld_with_tolerance_and_offsets(self):
+        points, polys, kept, ratio = weld(self.points, self.polys.ravel(), offsets=numpy.array([0, 3, 6]),
+                                          tolerance=1e-4)
+
+        numpy.testing.assert_array_equal(kept, [0, 1, 2, 4])
+        numpy.testing.assert_array_equal(polys, [0, 1, 2, 1, 3, 2])
+        self.assertAlmostEqual(ratio, 7 / 4.0)
+
+    def test_weld_without_pruning(self):
+        points, polys, kept, ratio = weld(self.points, self.polys, tolerance=1e-4, prune=False)
+
+        numpy.testing.assert_array_equal(kept, [0, 1, 2, 4, 6])
+        numpy.testing.assert_array_equal(polys, [[0, 1, 2], [1, 3, 2]])
+
+    def test_weld_keeps_the_first_point_of_each_group_in_order(self):
+        points = numpy.array([[2.0, 0.0], [1.0, 0.0], [2.0, 0.0], [0.0, 0.0]])
+        points, polys, kept, _ = weld(points, numpy.array([[3, 2, 1, 0]]))
+
+        numpy.testing.assert_array_equal(kept, [0, 1, 3])
+        numpy.testing.assert_array_equal(polys, [[2, 0, 1, 0]])
+
+    def test_weld_exact_with_negative_and_float32_points(self):
+        points = numpy.array([[-1.5, 2.0, -3.0], [1.5, 2.0, 3.0], [-1.5, 2.0, -3.0], [1e30, -1e-30, 0.0]],
+                             dtype=numpy.float32)
+        points, polys, kept, ratio = weld(points, numpy.array([[0, 1, 2, 3]]))
+
+        numpy.testing.assert_array_equal(kept, [0, 1, 3])
+        numpy.testing.assert_array_equal(polys, [[0, 1, 0, 2]])
+        self.assertEqual(points.dtype, numpy.float32)
+
+    def test_mesh_with_weld(self):
+        poly_data = mesh(self.points, self.polys, weld=1e-4, verts=False,
+                         point_data={'id': numpy.arange(7)}, cell_data={'side': numpy.array([0, 1])})
+
+        self.assertEqual(poly_data.GetNumberOfPoints(), 4)
+        self.assertCellArray(poly_data.GetPolys(), [
+            (0, 1, 2),
+            (1, 3, 2),
+        ])
+        numpy.testing.assert_array_equal(to_numpy.point_data(poly_data)['id'], [0, 1, 2, 4])
+        numpy.testing.assert_array_equal(to_numpy.cell_data(poly_data)['side'], [0, 1])
+
+    def test_weld_with_point_index_that_does_not_exist(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'weld polys references a point index that does not exist'):
+            weld(self.points, numpy.array([[0, 1, 7]]))
@@ -0,0 +1,140 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy
+import vtk
+
+from test import WindowedTestCase
+import numpy2vtk.data.raw.raw as raw
+import numpy2vtk.files.writers as writers
+import numpy2vtk.to_numpy as to_numpy
+from numpy2vtk import files
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+class TestWriters(WindowedTestCase):
+    # Small windows and blocks so the arrays are written in many chunks
+    window_modules = (raw,)
+    window_size = 7
+
+    def setUp(self):
+        super(TestWriters, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.block_size = writers.BLOCK_SIZE
+        writers.BLOCK_SIZE = 64
+        self.points = numpy.random.rand(50, 2).astype(numpy.float32)
+        self.polys = numpy.random.randint(0, 50, size=(30, 3))
+
+    def tearDown(self):
+        super(TestWriters, self).tearDown()
+        writers.BLOCK_SIZE = self.block_size
+        shutil.rmtree(self.directory)
+
+    def read(self, name, reader_type):
+        reader = reader_type()
+        reader.SetFileName(os.path.join(self.directory, name))
+        reader.Update()
+        return reader.GetOutput()
+
+    def write_mesh(self, name, **kwargs):
+        files.mesh(os.path.join(self.directory, name), self.points, self.polys, z_index=1.0,
+                   point_data={'x': self.points[:, 0], 'uv': self.points.astype(numpy.float64)},
+                   cell_data={'id': numpy.arange(30, dtype=numpy.int32)}, **kwargs)
+
+    def assertMesh(self, poly_data, verts=True):
+        self.assertEqual(poly_data.GetNumberOfPoints(), 50)
+        points = to_numpy.points(poly_data.GetPoints())
+        self.assertEqual(points.dtype, numpy.float32)
+        numpy.testing.assert_array_equal(points[:, :2], self.points)
+        numpy.testing.assert_array_equal(points[:, 2], 1.0)
+        self.assertEqual(poly_data.GetNumberOfVerts(), 50 if verts else 0)
+        self.assertCellArray(poly_data.GetPolys(), [tuple(poly) for poly in self.polys])
+
+        point_data = to_numpy.point_data(poly_data)
+        numpy.testing.assert_array_equal(point_data['x'], self.points[:, 0])
+        numpy.testing.assert_array_equal(point_data['uv'], self.points)
+        numpy.testing.assert_array_equal(to_numpy.cell_data(poly_data)['id'], [0] * (50 if verts else 0) + range(30))
+
+    def test_write_vtp(self):
+        self.write_mesh('mesh.vtp')
+
+        self.assertMesh(self.read('mesh.vtp', vtk.vtkXMLPolyDataReader))
+
+    def test_write_vtp_with_zlib_compression(self):
+        self.write_mesh('mesh.vtp', compression='zlib', verts=False)
+
+        self.assertMesh(self.read('mesh.vtp', vtk.vtkXMLPolyDataReader), verts=False)
+
+    @unittest.skipIf(writers.lz4_block is None, 'lz4 is not installed')
+    def test_write_vtp_with_lz4_compression(self):
+        self.write_mesh('mesh.vtp', compression='lz4')
+
+        self.assertMesh(self.read('mesh.vtp', vtk.vtkXMLPolyDataReader))
+
+    def test_write_legacy_mesh(self):
+        self.write_mesh('mesh.vtk')
+
+        self.assertMesh(self.read('mesh.vtk', vtk.vtkPolyDataReader))
+
+    def test_write_mesh_with_offsets(self):
+        path = os.path.join(self.directory, 'mesh.vtp')
+        files.mesh(path, numpy.zeros((5, 3)), numpy.array([0, 1, 2, 3, 2, 3, 4]), offsets=numpy.array([0, 4, 7]),
+                   verts=False, compression='zlib')
+
+        self.assertCellArray(self.read('mesh.vtp', vtk.vtkXMLPolyDataReader).GetPolys(), [
+            (0, 1, 2, 3),
+            (2, 3, 4),
+        ])
+
+    def test_write_unstructured_grid(self):
+        points = numpy.random.rand(9, 3)
+        cells = {vtk.VTK_TETRA: numpy.array([[0, 1, 2, 3], [1, 2, 3, 4]]), vtk.VTK_HEXAHEDRON: numpy.arange(8)[None]}
+
+        for name, reader_type, compression in [('grid.vtu', vtk.vtkXMLUnstructuredGridReader, None),
+                                               ('grid.vtu', vtk.vtkXMLUnstructuredGridReader, 'zlib'),
+                                               ('grid.vtk', vtk.vtkUnstructuredGridReader, None)]:
+            files.unstructured_grid(os.path.join(self.directory, name), points, cells,
+                                    cell_data={'volume': numpy.array([1.0, 2.0, 3.0])}, compression=compression)
+            grid = self.read(name, reader_type)
+
+            numpy.testing.assert_array_equal(to_numpy.points(grid.GetPoints()), points)
+            self.assertEqual([grid.GetCellType(i) for i in range(3)],
+                             [vtk.VTK_TETRA, vtk.VTK_TETRA, vtk.VTK_HEXAHEDRON])
+            self.assertCellArray(grid.GetCells(), [(0, 1, 2, 3), (1, 2, 3, 4), tuple(range(8))])
+            numpy.testing.assert_array_equal(to_numpy.cell_data(grid)['volume'], [1.0, 2.0, 3.0])
+
+    def test_write_unstructured_grid_with_offsets(self):
+        path = os.path.join(self.directory, 'grid.vtu')
+        files.unstructured_grid(path, numpy.random.rand(5, 3), numpy.array([0, 1, 2, 3, 4, 0, 1]),
+                                offsets=numpy.array([0, 4, 5, 7]),
+                                types=numpy.array([vtk.VTK_TETRA, vtk.VTK_VERTEX, vtk.VTK_LINE]))
+        grid = self.read('grid.vtu', vtk.vtkXMLUnstructuredGridReader)
+
+        self.assertEqual([grid.GetCellType(i) for i in range(3)], [vtk.VTK_TETRA, vtk.VTK_VERTEX, vtk.VTK_LINE])
+        self.assertCellArray(grid.GetCells(), [(0, 1, 2, 3), (4,), (0, 1)])
+
+    def test_write_float16_and_float128_data(self):
+        for name, reader_type in [('mesh.vtp', vtk.vtkXMLPolyDataReader), ('mesh.vtk', vtk.vtkPolyDataReader)]:
+            files.mesh(os.path.join(self.directory, name), self.points, self.polys, verts=False,
+                       point_data={'half': self.points[:, 0].astype(numpy.float16)},
+                       cell_data={'long': numpy.arange(30, dtype=numpy.longdouble)})
+            poly_data = self.read(name, reader_type)
+
+            half = to_numpy.point_data(poly_data)['half']
+            self.assertEqual(half.dtype, numpy.float32)
+            numpy.testing.assert_array_equal(half, self.points[:, 0].astype(numpy.float16))
+            self.assertEqual(to_numpy.cell_data(poly_data)['long'].dtype, numpy.float64)
+            numpy.testing.assert_array_equal(to_numpy.cell_data(poly_data)['long'], range(30))
+
+    def test_write_data_of_unsupported_type(self):
+        with self.assertRaisesRegexp(Numpy2VtkFormatException, 'point_data c needs to be a numpy array'):
+            files.mesh(os.path.join(self.directory, 'mesh.vtp'), self.points, self.polys,
+                       point_data={'c': numpy.zeros(50, dtype=numpy.complex64)})
+
+    def test_write_with_wrong_extension(self):
+        with self.assertRaisesRegexp(Numpy2VtkFormatException, 'file path needs one of the extensions .vtp, .vtk'):
+            files.mesh(os.path.join(self.directory, 'mesh.vtu'), self.points, self.polys)
+
+    def test_write_compressed_legacy_file(self):
+        with self.assertRaisesRegexp(Numpy2VtkFormatException, 'legacy files can not be compressed'):
+            files.mesh(os.path.join(self.directory, 'mesh.vtk'), self.points, self.polys, compression='zlib')
@@ -0,0 +1,106 @@
+import numpy
+import vtk
+
+from test import V2NUnitTest
+import numpy2vtk.to_numpy as to_numpy
+from numpy2vtk.data import raw, mesh
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+class ToNumpyPointsTest(V2NUnitTest):
+    def test_points(self):
+        vtk_points = vtk.vtkPoints()
+        vtk_points.InsertNextPoint(1.0, 2.0, 3.0)
+        vtk_points.InsertNextPoint(4.0, 5.0, 6.0)
+        numpy_points = to_numpy.points(vtk_points)
+        numpy.testing.assert_array_equal(numpy_points, [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+    def test_points_are_not_copied(self):
+        vtk_points = raw.points(numpy.array([[1.0, 2.0]]))
+        numpy_points = to_numpy.points(vtk_points)
+        numpy_points[0, 2] = 3.0
+        self.assertPoints(vtk_points, [(1.0, 2.0, 3.0)])
+
+    def test_points_with_invalid_input_type(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'points needs vtk.vtkPoints as input'):
+            to_numpy.points(numpy.zeros((2, 3)))
+
+
+class ToNumpyCellsTest(V2NUnitTest):
+    def test_cells_of_equal_size(self):
+        numpy_polygons = numpy.array([
+            [1, 2, 3],
+            [4, 5, 6],
+        ], dtype=numpy.int)
+        numpy.testing.assert_array_equal(to_numpy.cells(raw.polygons(numpy_polygons)), numpy_polygons)
+
+    def test_cells_of_equal_size_are_not_copied(self):
+        vtk_polygons = raw.polygons(numpy.array([[1, 2, 3]], dtype=numpy.int))
+        to_numpy.cells(vtk_polygons)[0, 1] = 7
+        self.assertCellArray(vtk_polygons, [(1, 7, 3)])
+
+    def test_cells_of_mixed_size(self):
+        vtk_cells = vtk.vtkCellArray()
+        expected = [(0, 1, 2)] * 40 + [(3, 4)] + [(5, 6, 7, 8), (9,)] * 3 + [(1, 2, 3)] * 5
+        for cell in expected:
+            vtk_cells.InsertNextCell(len(cell))
+            for index in cell:
+                vtk_cells.InsertCellPoint(index)
+
+        indices, offsets = to_numpy.cells(vtk_cells)
+
+        self.assertEqual(
+            [tuple(indices[offsets[i]:offsets[i + 1]]) for i in range(len(offsets) - 1)],
+            expected
+        )
+
+    def test_cells_of_interleaved_sizes(self):
+        numpy_offsets = numpy.cumsum([0] + [3, 4] * 500 + [5])
+        numpy_indices = numpy.arange(numpy_offsets[-1]) % 11
+        indices, offsets = to_numpy.cells(raw.polygons(numpy_indices, offsets=numpy_offsets))
+        numpy.testing.assert_array_equal(indices, numpy_indices)
+        numpy.testing.assert_array_equal(offsets, numpy_offsets)
+
+    def test_cells_with_offsets_round_trip(self):
+        numpy_indices = numpy.array([1, 2, 3, 4, 5, 6, 7], dtype=numpy.int)
+        numpy_offsets = numpy.array([0, 3, 7], dtype=numpy.int)
+        indices, offsets = to_numpy.cells(raw.polygons(numpy_indices, offsets=numpy_offsets))
+        numpy.testing.assert_array_equal(indices, numpy_indices)
+        numpy.testing.assert_array_equal(offsets, numpy_offsets)
+
+    def test_empty_cells(self):
+        self.assertEqual(to_numpy.cells(vtk.vtkCellArray()).shape, (0, 0))
+
+    def test_cells_with_invalid_input_type(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'cells needs vtk.vtkCellArray as input'):
+            to_numpy.cells(numpy.zeros((2, 3)))
+
+
+class ToNumpyArraysTest(V2NUnitTest):
+    def test_array(self):
+        vtk_array = vtk.vtkFloatArray()
+        vtk_array.SetNumberOfComponents(2)
+        vtk_array.InsertNextTuple2(1.0, 2.0)
+        vtk_array.InsertNextTuple2(3.0, 4.0)
+        numpy.testing.assert_array_equal(to_numpy.array(vtk_array), [[1.0, 2.0], [3.0, 4.0]])
+
+    def test_array_with_invalid_input_type(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'array needs vtk.vtkDataArray as input'):
+            to_numpy.array(numpy.zeros(2))
+
+    def test_point_and_cell_data(self):
+        vtk_mesh = mesh(
+            numpy.array([[0.0, 0.0], [0.0, 1.0], [1.0, 1.0]]),
+            numpy.array([[0, 1, 2]], dtype=numpy.int),
+            verts=False,
+            point_data={'temperature': numpy.array([1.0, 2.0, 3.0])},
+            cell_data={'labels': numpy.array([4], dtype=numpy.int32)}
+        )
+        point_data = to_numpy.point_data(vtk_mesh)
+        cell_data = to_numpy.cell_data(vtk_mesh)
+        self.assertEqual(list(point_data.keys()), ['temperature'])
+        numpy.testing.assert_array_equal(point_data['temperature'], [1.0, 2.0, 3.0])
+        self.assertEqual(list(cell_data.keys()), ['labels'])
+        numpy.testing.assert_array_equal(cell_data['labels'], [4])
@@ -0,0 +1,47 @@
+import numpy
+
+from test import WindowedTestCase
+import numpy2vtk.validation as validation
+from numpy2vtk.exceptions import Numpy2VtkFormatException
+
+class CheckBoundsTest(WindowedTestCase):
+    window_modules = (validation,)
+
+    def test_indices_in_bounds(self):
+        validation.check_bounds(numpy.array([[0, 1, 2], [2, 3, 0], [1, 1, 3]]), 4, 'polys')
+
+    def test_empty_indices(self):
+        validation.check_bounds(numpy.zeros((0, 3), dtype=numpy.int), 0, 'polys')
+
+    def test_index_too_large_in_last_window(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'polys references a point index that does not exist'):
+            validation.check_bounds(numpy.array([0, 1, 2, 3, 4]), 4, 'polys')
+
+    def test_negative_index(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'polys references a point index that does not exist'):
+            validation.check_bounds(numpy.array([[0, 1], [2, -1]]), 4, 'polys')
+
+
+class CheckOffsetsTest(WindowedTestCase):
+    window_modules = (validation,)
+
+    def test_valid_offsets(self):
+        validation.check_offsets(numpy.arange(7), numpy.array([0, 3, 3, 5, 7]), 'polygons')
+
+    def test_offsets_of_wrong_type(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException,
+                'polygons offsets need to be a one dimensional numpy array of integer type'):
+            validation.check_offsets(numpy.arange(7), numpy.array([0.0, 7.0]), 'polygons')
+
+    def test_offsets_not_ending_with_number_of_indices(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'polygons offsets need to be increasing from 0 to the number of indices'):
+            validation.check_offsets(numpy.arange(7), numpy.array([0, 3, 6]), 'polygons')
+
+    def test_decreasing_offsets_across_windows(self):
+        with self.assertRaisesRegexp(
+                Numpy2VtkFormatException, 'polygons offsets need to be increasing from 0 to the number of indices'):
+            validation.check_offsets(numpy.arange(7), numpy.array([0, 2, 4, 3, 7]), 'polygons')